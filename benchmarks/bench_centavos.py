@@ -0,0 +1,62 @@
+# benchmarks/bench_centavos.py
+"""
+Compara la aritmética de precios en float, Decimal y centavos enteros
+sobre un carrito grande: construcción del carrito y cálculo de total,
+cupón e impuestos.
+
+Uso: python -m benchmarks.bench_centavos [lineas]
+"""
+import random
+import sys
+import time
+from decimal import ROUND_HALF_EVEN, Decimal
+
+from src.carrito import Carrito, Producto
+from src.centavos import CarritoCentavos
+
+_CENTAVO = Decimal("0.01")
+
+
+def _cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return time.perf_counter() - inicio, resultado
+
+
+def _decimal(lineas):
+    precios = [(Decimal(str(producto.precio)), cantidad) for producto, cantidad in lineas]
+
+    def calcular():
+        total = sum(precio * cantidad for precio, cantidad in precios)
+        cupon = total - min((total * Decimal("0.2")).quantize(_CENTAVO, ROUND_HALF_EVEN), Decimal(50))
+        impuesto = (total * Decimal("0.18")).quantize(_CENTAVO, ROUND_HALF_EVEN)
+        return total, cupon, impuesto
+
+    return calcular
+
+
+def main(argv):
+    n = int(argv[0]) if argv else 1_000_000
+    rng = random.Random(5)
+    lineas = [(Producto(f"SKU{i:07d}", rng.randint(1, 99999) / 100, 10), rng.randint(1, 5)) for i in range(n)]
+
+    for etiqueta, clase in (("float", Carrito), ("centavos", CarritoCentavos)):
+        carrito = clase()
+        construir, _ = _cronometrar(lambda: carrito.agregar_productos(lineas))
+        calcular, resultado = _cronometrar(
+            lambda: (carrito.calcular_total(), carrito.aplicar_cupon(20, 50), carrito.calcular_impuestos(18))
+        )
+        print(f"{etiqueta:>9}: construir {construir:6.2f} s, precios {calcular * 1e6:8.1f} us  -> {resultado}")
+
+    calcular, resultado = _cronometrar(_decimal(lineas))
+    print(f"{'Decimal':>9}: recalcular {calcular:6.2f} s  -> {tuple(str(x) for x in resultado)}")
+
+    sumas = {}
+    for etiqueta, total in (("float (sum)", lambda: sum(p.precio * c for p, c in lineas)),
+                            ("centavos (sum)", lambda: sum(round(p.precio * 100) * c for p, c in lineas))):
+        sumas[etiqueta], _ = _cronometrar(total)
+    print("recorrido completo: " + ", ".join(f"{k} {v:.2f} s" for k, v in sumas.items()))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
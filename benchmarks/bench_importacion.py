@@ -0,0 +1,57 @@
+# benchmarks/bench_importacion.py
+"""
+Genera un catálogo CSV y un archivo de pedidos JSONL temporales e informa
+filas por segundo y el pico de memoria de la importación, que no debe
+crecer con el número de filas de pedidos.
+
+Uso: python -m benchmarks.bench_importacion [productos] [lineas_de_pedido]
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+from collections import defaultdict
+
+from src.carrito import Carrito
+from src.catalogo import Catalogo
+from src.importacion import importar_catalogo, importar_pedidos
+
+
+def _escribir(directorio, productos, lineas):
+    rng = random.Random(11)
+    ruta_catalogo = os.path.join(directorio, "catalogo.csv")
+    with open(ruta_catalogo, "w", encoding="utf-8") as archivo:
+        archivo.write("nombre,precio,stock\n")
+        for i in range(productos):
+            archivo.write(f"SKU{i:07d},{rng.randint(100, 99999) / 100},1000000000\n")
+    ruta_pedidos = os.path.join(directorio, "pedidos.jsonl")
+    with open(ruta_pedidos, "w", encoding="utf-8") as archivo:
+        for i in range(lineas):
+            fila = {"carrito": str(i // 20 % 1000), "producto": f"SKU{rng.randrange(productos):07d}", "cantidad": 1}
+            archivo.write(json.dumps(fila) + "\n")
+    return ruta_catalogo, ruta_pedidos
+
+
+def main():
+    productos = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    lineas = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_catalogo, ruta_pedidos = _escribir(directorio, productos, lineas)
+        catalogo = Catalogo()
+        tracemalloc.start()
+        resultado = importar_catalogo(ruta_catalogo, catalogo)
+        _, pico = tracemalloc.get_traced_memory()
+        print(f"catálogo: {resultado.filas:>10} filas {resultado.filas_por_segundo:12,.0f} filas/s  pico {pico / 2**20:8.1f} MiB")
+        carritos = defaultdict(lambda: Carrito(catalogo=catalogo))
+        tracemalloc.reset_peak()
+        resultado = importar_pedidos(ruta_pedidos, catalogo, carritos.__getitem__)
+        actual, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f" pedidos: {resultado.filas:>10} filas {resultado.filas_por_segundo:12,.0f} filas/s  "
+              f"pico sobre los carritos {(pico - actual) / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
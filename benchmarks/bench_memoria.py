@@ -0,0 +1,84 @@
+# benchmarks/bench_memoria.py
+"""
+Compara los bytes por línea de carrito entre el modelo original (clases con
+__dict__ y un Producto por carrito) y el actual (__slots__ y productos
+internados en un Catalogo).
+
+Uso: python -m benchmarks.bench_memoria [carritos] [lineas_por_carrito] [productos]
+"""
+import random
+import sys
+import tracemalloc
+
+from src.carrito import Carrito
+from src.catalogo import Catalogo
+
+
+class _ProductoOriginal:
+    def __init__(self, nombre, precio, stock):
+        self.nombre = nombre
+        self.precio = precio
+        self.stock = stock
+
+
+class _ItemOriginal:
+    def __init__(self, producto, cantidad=1):
+        self.producto = producto
+        self.cantidad = cantidad
+
+
+class _CarritoOriginal:
+    def __init__(self):
+        self.items = []
+
+
+def _lineas(carritos, lineas, productos, semilla=1):
+    rng = random.Random(semilla)
+    precios = [round(rng.uniform(1, 500), 2) for _ in range(productos)]
+    for _ in range(carritos):
+        yield [(f"SKU{i:07d}", precios[i], rng.randint(1, 5)) for i in rng.sample(range(productos), lineas)]
+
+
+def _original(datos):
+    carritos = []
+    for lineas in datos:
+        carrito = _CarritoOriginal()
+        for nombre, precio, cantidad in lineas:
+            carrito.items.append(_ItemOriginal(_ProductoOriginal(nombre, precio, 100), cantidad))
+        carritos.append(carrito)
+    return carritos
+
+
+def _compacto(datos):
+    catalogo = Catalogo()
+    carritos = []
+    for lineas in datos:
+        carrito = Carrito()
+        carrito.agregar_productos(
+            (catalogo.internar(nombre, precio, 100), cantidad) for nombre, precio, cantidad in lineas
+        )
+        carritos.append(carrito)
+    return catalogo, carritos
+
+
+def medir(construir, datos):
+    tracemalloc.start()
+    inicial = tracemalloc.get_traced_memory()[0]
+    resultado = construir(datos)
+    usado = tracemalloc.get_traced_memory()[0] - inicial
+    tracemalloc.stop()
+    del resultado
+    return usado
+
+
+def main(argv):
+    carritos, lineas, productos = (int(a) for a in (argv + ["20000", "10", "5000"][len(argv):]))
+    datos = list(_lineas(carritos, lineas, productos))
+    total_lineas = carritos * lineas
+    for etiqueta, construir in (("original", _original), ("slots+catalogo", _compacto)):
+        usado = medir(construir, datos)
+        print(f"{etiqueta:>15}: {usado / total_lineas:8.1f} bytes/línea ({usado / 2**20:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,62 @@
+# benchmarks/bench_persistencia.py
+"""
+Mide registros por segundo del diario con distintos lotes de fsync y el
+tiempo de recuperación (instantánea + cola del diario) para N carritos.
+
+Uso: python -m benchmarks.bench_persistencia [carritos] [lineas_por_carrito]
+"""
+import random
+import sys
+import tempfile
+import time
+
+from src.catalogo import Catalogo
+from src.persistencia import DiarioCarritos
+
+
+def medir_anexados(directorio, fsync_cada, registros=20000):
+    catalogo = Catalogo()
+    productos = [catalogo.internar(f"SKU{i:06d}", 10.0 + i % 90, 10**9) for i in range(1000)]
+    diario = DiarioCarritos(directorio, fsync_cada=fsync_cada)
+    carrito = diario.carrito(1)
+    inicio = time.perf_counter()
+    for i in range(registros):
+        carrito.agregar_producto(productos[i % len(productos)], 1)
+    diario.sincronizar()
+    segundos = time.perf_counter() - inicio
+    diario.cerrar()
+    return registros / segundos
+
+
+def medir_recuperacion(directorio, carritos, lineas, cola=0.1):
+    rng = random.Random(3)
+    catalogo = Catalogo()
+    productos = [catalogo.internar(f"SKU{i:06d}", 10.0 + i % 90, 10**9) for i in range(5000)]
+    diario = DiarioCarritos(directorio, fsync_cada=10**6)
+    for carrito_id in range(carritos):
+        diario.carrito(carrito_id).agregar_productos((p, rng.randint(1, 5)) for p in rng.sample(productos, lineas))
+    diario.compactar()
+    for carrito_id in rng.sample(range(carritos), int(carritos * cola)):
+        diario.carrito(carrito_id).actualizar_cantidad(diario.carrito(carrito_id).obtener_items()[0].producto, 9)
+    diario.cerrar()
+    del diario
+
+    inicio = time.perf_counter()
+    recuperados = DiarioCarritos(directorio, catalogo=Catalogo()).recuperar()
+    segundos = time.perf_counter() - inicio
+    assert len(recuperados) == carritos
+    return segundos
+
+
+def main(argv):
+    carritos, lineas = (int(a) for a in (argv + ["100000", "3"][len(argv):]))
+    for fsync_cada in (1, 64, 1024):
+        with tempfile.TemporaryDirectory() as directorio:
+            print(f"fsync cada {fsync_cada:>5}: {medir_anexados(directorio, fsync_cada):>10.0f} registros/s")
+    with tempfile.TemporaryDirectory() as directorio:
+        segundos = medir_recuperacion(directorio, carritos, lineas)
+        print(f"recuperación de {carritos} carritos x {lineas} líneas: {segundos:.2f} s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
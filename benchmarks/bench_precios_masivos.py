@@ -0,0 +1,62 @@
+# benchmarks/bench_precios_masivos.py
+"""
+Mide cuántos carritos por segundo reprecia repreciar_carritos según el
+número de líneas por carrito, frente a serializar las líneas de cada
+carrito en el proceso principal (el esquema anterior), y con 1 proceso
+frente a varios. Con los totales mantenidos por el carrito el costo por
+carrito no crece con las líneas, y repartir los lotes entre procesos solo
+agrega comunicación.
+
+Uso: python -m benchmarks.bench_precios_masivos [carritos] [max_procesos]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+from src.carrito_columnar import CarritoColumnar
+from src.generadores import Constante, generar_carritos, generar_productos
+from src.precios_masivos import EspecificacionPrecio, precio_desde_total, repreciar_carritos
+
+ESPECIFICACION = EspecificacionPrecio(descuento=5, cupon_porcentaje=20, cupon_maximo=50, impuesto=18)
+
+
+def _serializando(carritos):
+    # Esquema anterior: recorrer las líneas de cada carrito para empaquetarlas
+    for carrito in carritos:
+        items = carrito.obtener_items()
+        precios = np.fromiter((item.producto.precio for item in items), dtype=np.float64, count=len(items))
+        cantidades = np.fromiter((item.cantidad for item in items), dtype=np.int64, count=len(items))
+        datos = precios.tobytes() + cantidades.tobytes()
+        n = len(items)
+        total = float(np.dot(np.frombuffer(datos, np.float64, n), np.frombuffer(datos, np.int64, n, 8 * n)))
+        yield precio_desde_total(total, ESPECIFICACION)
+
+
+def _por_segundo(n, funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return n / (time.perf_counter() - inicio)
+
+
+def main(argv):
+    m = int(argv[0]) if argv else 1_000
+    max_procesos = int(argv[1]) if len(argv) > 1 else max(os.cpu_count() or 1, 2)
+    print(f"{m} carritos, {os.cpu_count()} núcleo(s)")
+    productos = list(generar_productos(20_000, semilla=1, stock=Constante(1_000)))
+    for lineas in (10, 100, 1_000):
+        for etiqueta, fabrica in (("Carrito", None), ("CarritoColumnar", CarritoColumnar)):
+            opciones = {"fabrica": fabrica} if fabrica else {}
+            carritos = list(generar_carritos(productos, m, semilla=2, lineas=Constante(lineas), **opciones))
+            antes = _por_segundo(m, lambda: list(_serializando(carritos)))
+            por_procesos = [
+                (procesos, _por_segundo(m, lambda: list(repreciar_carritos(carritos, ESPECIFICACION, procesos=procesos))))
+                for procesos in sorted({1, 2, max_procesos})
+            ]
+            print(f"{lineas:>5} líneas {etiqueta:>15}: serializando {antes:>10,.0f}/s, totales "
+                  + ", ".join(f"{procesos}p {velocidad:>10,.0f}/s" for procesos, velocidad in por_procesos))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,79 @@
+# benchmarks/bench_servicio_async.py
+"""
+Prueba de carga de ServicioCarritos con un cliente asyncio en el mismo
+proceso. Muchos clientes operan carritos chicos (agregar, remover, cotizar)
+mientras otros cotizan repetidamente un carrito grande con reglas por
+producto; se informa la latencia p50/p99 de las peticiones sobre carritos
+chicos, con y sin envío del trabajo pesado al executor.
+
+Uso: python -m benchmarks.bench_servicio_async [lineas_carrito_grande] [clientes] [peticiones_por_cliente]
+"""
+import asyncio
+import random
+import statistics
+import sys
+import time
+
+from src.carrito import AGREGAR, Producto
+from src.precios_masivos import EspecificacionPrecio
+from src.promociones import DescuentoProducto, Impuesto, compilar
+from src.servicio_async import ServicioCarritos
+
+ESPECIFICACION = EspecificacionPrecio(descuento=5, cupon_porcentaje=10, cupon_maximo=20, impuesto=18)
+
+
+async def _cliente(servicio, semilla, productos, peticiones, latencias):
+    rng = random.Random(semilla)
+    carrito_id = f"chico-{semilla}"
+    for _ in range(peticiones):
+        producto = rng.choice(productos)
+        inicio = time.perf_counter()
+        await servicio.agregar_producto(carrito_id, producto, 1)
+        await servicio.cotizar(carrito_id, ESPECIFICACION)
+        await servicio.remover_producto(carrito_id, producto, 1)
+        latencias.append(time.perf_counter() - inicio)
+        await asyncio.sleep(0)
+
+
+async def _cliente_pesado(servicio, regla, fin):
+    while time.perf_counter() < fin:
+        # Cada modificación cambia la versión e invalida la cotización anterior
+        await servicio.agregar_producto("grande", Producto("Extra", 1.0, 10**9), 1)
+        await asyncio.gather(*(servicio.cotizar("grande", regla) for _ in range(4)))
+
+
+async def _medir(lineas, clientes, peticiones, umbral):
+    servicio = ServicioCarritos(umbral_executor=umbral)
+    grandes = [Producto(f"SKU{i:07d}", 1.0 + i % 97, 10**9) for i in range(lineas)]
+    await servicio.aplicar_operaciones("grande", [(AGREGAR, producto, 1) for producto in grandes])
+    regla = compilar([DescuentoProducto(producto.nombre, 10) for producto in grandes[::10]] + [Impuesto(18)])
+    productos = [Producto(f"Chico{i}", 10.0, 10**9) for i in range(100)]
+    latencias = []
+    inicio = time.perf_counter()
+    pesado = asyncio.ensure_future(_cliente_pesado(servicio, regla, inicio + 3600))
+    await asyncio.gather(*(_cliente(servicio, i, productos, peticiones, latencias) for i in range(clientes)))
+    segundos = time.perf_counter() - inicio
+    pesado.cancel()
+    try:
+        await pesado
+    except asyncio.CancelledError:
+        pass
+    return latencias, segundos
+
+
+def _percentil(valores, p):
+    return statistics.quantiles(valores, n=100, method="inclusive")[p - 1]
+
+
+def main():
+    lineas = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    clientes = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    peticiones = int(sys.argv[3]) if len(sys.argv) > 3 else 40
+    for nombre, umbral in (("en el event loop", None), ("con executor", 10_000)):
+        latencias, segundos = asyncio.run(_medir(lineas, clientes, peticiones, umbral))
+        print(f"{nombre:>17}: p50 {_percentil(latencias, 50) * 1e3:8.2f} ms  "
+              f"p99 {_percentil(latencias, 99) * 1e3:8.2f} ms  {len(latencias) / segundos:10,.0f} peticiones/s")
+
+
+if __name__ == "__main__":
+    main()
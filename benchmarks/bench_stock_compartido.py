@@ -0,0 +1,74 @@
+# benchmarks/bench_stock_compartido.py
+"""
+Mide reservas por segundo contra StockCompartido con 1, 2, 4, ... procesos
+trabajadores, cada uno con su propio carrito que agrega y remueve productos
+sorteados de un catálogo común.
+
+Uso: python -m benchmarks.bench_stock_compartido [operaciones_por_proceso] [productos] [max_procesos]
+"""
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from src.carrito import Carrito
+from src.catalogo import Catalogo
+from src.stock_compartido import StockCompartido
+
+
+def _catalogo(productos):
+    catalogo = Catalogo()
+    for i in range(productos):
+        catalogo.internar(f"SKU{i:06d}", 10.0 + i % 90, 10**9)
+    return catalogo
+
+
+def _trabajador(stock, productos, operaciones, semilla, inicio, resultados):
+    catalogo = _catalogo(productos)
+    carrito = Carrito(inventario=stock, catalogo=catalogo)
+    rng = random.Random(semilla)
+    ids = [rng.randrange(productos) for _ in range(operaciones)]
+    inicio.wait()
+    comienzo = time.perf_counter()
+    for producto_id in ids:
+        carrito.agregar_producto(producto_id, 1)
+        carrito.remover_producto(producto_id, 1)
+    resultados.put(time.perf_counter() - comienzo)
+
+
+def medir(procesos, operaciones, productos):
+    contexto = multiprocessing.get_context()
+    with StockCompartido(capacidad=productos, contexto=contexto) as stock:
+        inicio = contexto.Event()
+        resultados = contexto.Queue()
+        trabajadores = [
+            contexto.Process(target=_trabajador, args=(stock, productos, operaciones, semilla, inicio, resultados))
+            for semilla in range(procesos)
+        ]
+        for trabajador in trabajadores:
+            trabajador.start()
+        comienzo = time.perf_counter()
+        inicio.set()
+        for _ in trabajadores:
+            resultados.get()
+        segundos = time.perf_counter() - comienzo
+        for trabajador in trabajadores:
+            trabajador.join()
+    # Cada operación reserva y libera una unidad
+    return procesos * operaciones / segundos
+
+
+def main():
+    operaciones = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    productos = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    maximo = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count() or 1
+    procesos = 1
+    print(f"{os.cpu_count()} CPUs, {operaciones} operaciones por proceso, {productos} productos")
+    while procesos <= maximo:
+        print(f"{procesos:>3} procesos: {medir(procesos, operaciones, productos):12,.0f} reservas/s")
+        procesos *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# benchmarks/suite.py
+"""
+Suite de rendimiento de Carrito, ejecutable sin conexión.
+
+Construye carritos de distintos tamaños y mide, para cada método público,
+el tiempo por llamada, el pico de memoria y los bloques de memoria netos
+que deja la llamada. Los resultados se guardan en JSON y pueden compararse
+contra una línea base guardada; la comparación termina con código 1 si
+alguna métrica empeora más que el umbral.
+
+Uso:
+    python -m benchmarks.suite --salida resultados.json
+    python -m benchmarks.suite --tamanos 10 1000 1000000 --salida grande.json
+    python -m benchmarks.suite --comparar base.json --umbral 0.3
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from src.carrito import ACTUALIZAR, AGREGAR, REMOVER, Carrito, Producto
+
+TAMANOS = [10, 100, 1_000, 10_000, 100_000]
+METRICAS = ("segundos", "memoria_pico", "bloques")
+
+
+def _productos(n, semilla=7):
+    rng = random.Random(semilla)
+    return [Producto(f"SKU{i:07d}", rng.randint(100, 99999) / 100, 10**6) for i in range(n)]
+
+
+def _carrito(productos):
+    carrito = Carrito()
+    carrito.agregar_productos((producto, 1 + i % 5) for i, producto in enumerate(productos))
+    return carrito
+
+
+def _casos(productos):
+    """
+    Retorna (nombre, preparar, ejecutar, destructivo): preparar crea el
+    estado fuera de la medición y ejecutar es la llamada medida. Los métodos
+    que modifican el carrito se miden en pares que lo dejan como estaba; los
+    destructivos se miden con un estado nuevo en cada llamada.
+    """
+    medio = productos[len(productos) // 2]
+    extra = Producto("SKU-extra", 10.0, 10**6)
+    lote = [(producto, 1) for producto in productos[:100]]
+    # Par de lotes inversos: cada llamada inserta, cambia y quita líneas de verdad
+    operaciones = [(AGREGAR, extra, 1), (ACTUALIZAR, medio, 7), (REMOVER, productos[0], 1)]
+    inversas = [(REMOVER, extra, 1), (ACTUALIZAR, medio, 1 + len(productos) // 2 % 5), (AGREGAR, productos[0], 1)]
+    # Otro carrito que comparte la mitad de los productos con otras cantidades
+    otro = Carrito()
+    otro.agregar_productos([(producto, 2) for producto in productos[::2]] + [(extra, 1)])
+
+    def base():
+        return _carrito(productos)
+
+    def con_instantaneas():
+        carrito = base()
+        original = carrito.snapshot()
+        carrito.agregar_productos(lote + [(extra, 1)])
+        return carrito, original, carrito.snapshot()
+
+    return [
+        ("construir", lambda: None, lambda _: _carrito(productos)),
+        ("agregar_producto+remover_producto", base,
+         lambda c: (c.agregar_producto(medio, 1), c.remover_producto(medio, 1))),
+        ("agregar_nuevo+remover_completo", base,
+         lambda c: (c.agregar_producto(extra, 1), c.remover_producto(extra, 1))),
+        ("actualizar_cantidad", base, lambda c: c.actualizar_cantidad(medio, 4)),
+        ("agregar_productos(100)", base, lambda c: c.agregar_productos(lote)),
+        ("aplicar_operaciones(3)+inversas", base,
+         lambda c: (c.aplicar_operaciones(operaciones), c.aplicar_operaciones(inversas))),
+        ("fusionar", base, lambda c: c.fusionar(otro), True),
+        ("diferencia", base, lambda c: c.diferencia(otro)),
+        ("restaurar+restaurar", con_instantaneas,
+         lambda e: (e[0].restaurar(e[1]), e[0].restaurar(e[2]))),
+        ("calcular_total", base, lambda c: c.calcular_total()),
+        ("contar_items", base, lambda c: c.contar_items()),
+        ("aplicar_descuento", base, lambda c: c.aplicar_descuento(10)),
+        ("aplicar_descuento_condicional", base, lambda c: c.aplicar_descuento_condicional(10, 100)),
+        ("calcular_impuestos", base, lambda c: c.calcular_impuestos(18)),
+        ("aplicar_cupon", base, lambda c: c.aplicar_cupon(20, 50)),
+        ("obtener_items", base, lambda c: c.obtener_items()),
+        ("obtener_items_ordenados(precio)", base, lambda c: c.obtener_items_ordenados("precio")),
+        ("obtener_items_ordenados(nombre,pagina)", base,
+         lambda c: c.obtener_items_ordenados("nombre", offset=0, limit=20)),
+        ("top_k(total,10)", base, lambda c: c.top_k("total", 10)),
+        ("to_bytes", base, lambda c: c.to_bytes()),
+        ("snapshot", base, lambda c: c.snapshot()),
+        ("snapshot+actualizar_cantidad", base, lambda c: (c.snapshot(), c.actualizar_cantidad(medio, 4))),
+        ("vaciar", base, lambda c: c.vaciar(), True),
+    ]
+
+
+def _tiempo(preparar, ejecutar, presupuesto, destructivo=False):
+    """
+    Mejor tiempo por llamada entre varias rondas, ajustando el número de
+    llamadas por ronda para que cada una dure al menos ~presupuesto/5.
+    """
+    estado = preparar()
+    inicio = time.perf_counter()
+    ejecutar(estado)
+    una = time.perf_counter() - inicio
+    llamadas = 1 if destructivo else max(1, min(10_000, int(presupuesto / 5 / max(una, 1e-7))))
+    mejor = una
+    for _ in range(5):
+        estado = preparar() if destructivo else estado
+        inicio = time.perf_counter()
+        for _ in range(llamadas):
+            ejecutar(estado)
+        mejor = min(mejor, (time.perf_counter() - inicio) / llamadas)
+    return mejor
+
+
+def _memoria(preparar, ejecutar):
+    estado = preparar()
+    tracemalloc.start()
+    antes = sys.getallocatedblocks()
+    resultado = ejecutar(estado)
+    bloques = sys.getallocatedblocks() - antes
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultado
+    return pico, bloques
+
+
+def medir(tamanos, presupuesto=0.2, filtro=None):
+    resultados = {}
+    for tamano in tamanos:
+        productos = _productos(tamano)
+        for nombre, preparar, ejecutar, *destructivo in _casos(productos):
+            if filtro and filtro not in nombre:
+                continue
+            segundos = _tiempo(preparar, ejecutar, presupuesto, bool(destructivo))
+            pico, bloques = _memoria(preparar, ejecutar)
+            resultados[f"{nombre}@{tamano}"] = {"segundos": segundos, "memoria_pico": pico, "bloques": bloques}
+            print(f"{nombre:>40} @ {tamano:>8}: {segundos * 1e6:12.2f} us  {pico / 1024:10.1f} KiB  {bloques:>8} bloques")
+    return resultados
+
+
+def comparar(actual, base, umbral, piso_segundos=1e-5, piso_bytes=4096, piso_bloques=64):
+    """
+    Retorna las regresiones (clave, métrica, base, actual) que superan el umbral
+    relativo. Los valores por debajo de los pisos se ignoran por ser ruido.
+    Un caso de la línea base que falta en la ejecución actual es una
+    regresión con métrica "ausente" y actual None.
+    """
+    regresiones = [(clave, "ausente", None, None) for clave in base if clave not in actual]
+    for clave, metricas in actual.items():
+        referencia = base.get(clave)
+        if referencia is None:
+            continue
+        for metrica in METRICAS:
+            valor, anterior = metricas[metrica], referencia[metrica]
+            piso = {"segundos": piso_segundos, "memoria_pico": piso_bytes, "bloques": piso_bloques}[metrica]
+            if valor > piso and valor > max(anterior, piso) * (1 + umbral):
+                regresiones.append((clave, metrica, anterior, valor))
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=TAMANOS)
+    parser.add_argument("--presupuesto", type=float, default=0.2, help="segundos aproximados por caso")
+    parser.add_argument("--filtro", help="solo casos cuyo nombre contenga este texto")
+    parser.add_argument("--salida", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--comparar", help="línea base JSON contra la cual comparar")
+    parser.add_argument("--umbral", type=float, default=0.5, help="empeoramiento relativo tolerado")
+    args = parser.parse_args(argv)
+
+    resultados = medir(args.tamanos, args.presupuesto, args.filtro)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump({
+                "python": platform.python_version(),
+                "plataforma": platform.platform(),
+                "resultados": resultados,
+            }, archivo, indent=2, sort_keys=True)
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)["resultados"]
+        # Solo cuentan como ausentes los casos que esta ejecución debía medir
+        base = {
+            clave: metricas for clave, metricas in base.items()
+            if int(clave.rpartition("@")[2]) in args.tamanos and (not args.filtro or args.filtro in clave.rpartition("@")[0])
+        }
+        regresiones = comparar(resultados, base, args.umbral)
+        for clave, metrica, anterior, valor in regresiones:
+            if valor is None:
+                print(f"REGRESIÓN {clave}: falta en la ejecución actual")
+            else:
+                print(f"REGRESIÓN {clave} {metrica}: {anterior:.6g} -> {valor:.6g}")
+        return 1 if regresiones else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
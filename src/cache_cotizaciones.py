@@ -0,0 +1,160 @@
+# src/cache_cotizaciones.py
+"""
+Caché LRU de cotizaciones compartida entre carritos.
+
+    cache = CacheCotizaciones(maximo=50_000, ttl=300)
+    resultado = cache.cotizar(carrito, EspecificacionPrecio(descuento=10, impuesto=18))
+    cotizacion = cache.cotizar(carrito, compilar([DescuentoProducto("Mouse", 10), Impuesto(18)]))
+
+La clave es la huella del carrito (Carrito.huella o CarritoColumnar.huella),
+que resume el contenido (nombre, precio y cantidad de cada línea) sin
+depender del orden, junto con el número de líneas, el de unidades y la regla
+de precio. Dos carritos con los mismos items comparten la entrada aunque se
+hayan armado en otro orden. Como el precio forma parte de la huella, un
+cambio de precio nunca devuelve una cotización vieja; invalidar_producto
+libera de inmediato las entradas que quedaron obsoletas.
+
+La huella no es un hash canónico del contenido sino la suma de
+cantidad * hash((nombre, precio)) de cada línea, para poder mantenerla en
+O(1) con cada cambio. Dos contenidos distintos con la misma huella, el mismo
+número de líneas y las mismas unidades compartirían la cotización; con
+hashes de 64 bits es muy improbable, pero no imposible. Quien no pueda
+aceptar ese riesgo debe cotizar sin caché.
+
+Carrito mantiene la huella en cada cambio, así que un acierto cuesta O(1);
+CarritoColumnar la recalcula una vez por versión. Con una
+EspecificacionPrecio el cálculo también es O(1) sobre el total ya mantenido
+y la caché solo ahorra esa aritmética; ayuda de verdad con un PipelinePrecios
+con descuentos por producto, que recorre las líneas. El resultado es el del
+primer carrito que se cotizó con ese contenido.
+"""
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from .precios_masivos import EspecificacionPrecio, precio_desde_total, validar_especificacion
+from .promociones import PipelinePrecios
+
+EstadisticasCache = namedtuple(
+    "EstadisticasCache", ["aciertos", "fallos", "desalojados", "expirados", "invalidados", "tamano"]
+)
+
+
+class CacheCotizaciones:
+    """
+    Caché de ResultadoPrecio con desalojo LRU, tamaño máximo y vencimiento opcional.
+    """
+
+    def __init__(self, maximo=10_000, ttl=None, reloj=time.monotonic):
+        """
+        Args:
+            maximo (int): Número máximo de entradas.
+            ttl (float): Segundos de validez de cada entrada; None para no expirar.
+            reloj (callable): Fuente de tiempo, reemplazable en pruebas.
+
+        Raises:
+            ValueError: Si el máximo no es positivo.
+        """
+        if maximo <= 0:
+            raise ValueError("El tamaño máximo debe ser positivo")
+        self._maximo = maximo
+        self._ttl = ttl
+        self._reloj = reloj
+        self._lock = threading.Lock()
+        # (huella, especificación) -> (resultado, vence, nombres de los productos)
+        self._entradas = OrderedDict()
+        self._por_producto = {}  # nombre -> claves que lo contienen
+        self._aciertos = self._fallos = self._desalojados = self._expirados = self._invalidados = 0
+
+    def huella(self, carrito):
+        """
+        Retorna la huella del contenido del carrito que forma parte de la clave.
+        """
+        return carrito.huella
+
+    def cotizar(self, carrito, regla):
+        """
+        Retorna la cotización del carrito con la regla, desde la caché si otro
+        carrito con el mismo contenido ya se cotizó con ella.
+
+        Args:
+            regla: EspecificacionPrecio (devuelve un ResultadoPrecio) o un
+                PipelinePrecios de promociones.compilar() (devuelve una Cotizacion).
+
+        Raises:
+            ValueError: Si la regla no es válida.
+        """
+        if not isinstance(regla, PipelinePrecios):
+            if not isinstance(regla, EspecificacionPrecio):
+                raise ValueError(f"Regla de precio no válida: {regla!r}")
+            validar_especificacion(regla)
+        clave = (carrito.huella, len(carrito), carrito.contar_items(), regla)
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None:
+                if entrada[1] is None or entrada[1] > self._reloj():
+                    self._entradas.move_to_end(clave)
+                    self._aciertos += 1
+                    return entrada[0]
+                self._quitar(clave)
+                self._expirados += 1
+            self._fallos += 1
+        if isinstance(regla, PipelinePrecios):
+            resultado = regla(carrito)
+        else:
+            resultado = precio_desde_total(carrito.calcular_total(), regla)
+        nombres = tuple(item.producto.nombre for item in carrito.obtener_items())
+        with self._lock:
+            if clave not in self._entradas:
+                vence = None if self._ttl is None else self._reloj() + self._ttl
+                self._entradas[clave] = (resultado, vence, nombres)
+                for nombre in nombres:
+                    self._por_producto.setdefault(nombre, set()).add(clave)
+                while len(self._entradas) > self._maximo:
+                    self._quitar(next(iter(self._entradas)))
+                    self._desalojados += 1
+        return resultado
+
+    def _quitar(self, clave):
+        # Se llama con el candado tomado
+        _, _, nombres = self._entradas.pop(clave)
+        for nombre in nombres:
+            claves = self._por_producto.get(nombre)
+            if claves is not None:
+                claves.discard(clave)
+                if not claves:
+                    del self._por_producto[nombre]
+
+    def invalidar_producto(self, producto):
+        """
+        Elimina las entradas de carritos que contienen el producto (un
+        Producto o su nombre), por ejemplo tras cambiar su precio.
+
+        Returns:
+            int: Entradas eliminadas.
+        """
+        nombre = getattr(producto, "nombre", producto)
+        with self._lock:
+            claves = list(self._por_producto.get(nombre, ()))
+            for clave in claves:
+                self._quitar(clave)
+            self._invalidados += len(claves)
+        return len(claves)
+
+    def limpiar(self):
+        """
+        Elimina todas las entradas; las estadísticas se conservan.
+        """
+        with self._lock:
+            self._entradas.clear()
+            self._por_producto.clear()
+
+    def estadisticas(self):
+        with self._lock:
+            return EstadisticasCache(
+                self._aciertos, self._fallos, self._desalojados, self._expirados,
+                self._invalidados, len(self._entradas),
+            )
+
+    def __len__(self):
+        return len(self._entradas)
@@ -0,0 +1,316 @@
+# src/carrito_columnar.py
+import numpy as np
+
+from .carrito import Carrito, ItemCarrito
+from .formato_binario import codificar, decodificar
+
+
+class CarritoColumnar:
+    """
+    Carrito con la misma API pública que Carrito, pensado para pedidos
+    mayoristas de decenas de miles de líneas. Precios y cantidades se
+    guardan en arreglos contiguos de NumPy y los totales se calculan de forma
+    vectorizada; los ItemCarrito solo se construyen cuando se piden.
+
+    Las líneas eliminadas quedan marcadas como inactivas hasta que el número
+    de huecos justifica compactar los arreglos, así se conserva el orden de
+    inserción sin desplazar filas en cada eliminación.
+    """
+
+    def __init__(self, capacidad=16, catalogo=None):
+        capacidad = max(capacidad, 1)
+        self._catalogo = catalogo
+        self._precios = np.zeros(capacidad, dtype=np.float64)
+        self._cantidades = np.zeros(capacidad, dtype=np.int64)
+        self._activas = np.zeros(capacidad, dtype=bool)
+        self._productos = []  # fila -> Producto
+        self._filas = {}  # nombre del producto -> fila activa
+        self._n = 0  # filas usadas, incluidas las eliminadas
+        self._version = 0
+        self._huella = (-1, 0)  # (versión, huella) calculada por última vez
+
+    @property
+    def huella(self):
+        """
+        Misma huella de contenido que Carrito.huella. Aquí no se mantiene en
+        cada cambio: se recalcula en O(n) la primera vez que se pide en cada
+        versión del carrito.
+        """
+        version, huella = self._huella
+        if version != self._version:
+            activas = self._filas_activas().tolist()
+            precios, cantidades = self._precios.tolist(), self._cantidades.tolist()
+            huella = sum(
+                cantidades[fila] * hash((self._productos[fila].nombre, precios[fila])) for fila in activas
+            )
+            self._huella = (self._version, huella)
+        return huella
+
+    @property
+    def version(self):
+        """
+        Contador que aumenta con cada cambio del carrito (ver Carrito.version).
+        """
+        return self._version
+
+    def __len__(self):
+        return len(self._filas)
+
+    @property
+    def items(self):
+        return self.obtener_items()
+
+    def agregar_producto(self, producto, cantidad=1):
+        """
+        Agrega un producto al carrito verificando que la cantidad no exceda el stock disponible.
+
+        Raises:
+            ValueError: Si la cantidad total excede el stock del producto.
+        """
+        producto = self._resolver(producto)
+        fila = self._filas.get(producto.nombre)
+        total_en_carrito = int(self._cantidades[fila]) if fila is not None else 0
+        if total_en_carrito + cantidad > producto.stock:
+            raise ValueError("Cantidad a agregar excede el stock disponible")
+
+        if fila is not None:
+            self._cantidades[fila] += cantidad
+        else:
+            self._insertar_filas([producto], [cantidad])
+        self._version += 1
+
+    def remover_producto(self, producto, cantidad=1):
+        """
+        Remueve una cantidad del producto del carrito.
+        Si la cantidad llega a 0, elimina el item.
+        """
+        producto = self._resolver(producto)
+        fila = self._filas.get(producto.nombre)
+        if fila is None:
+            raise ValueError("Producto no encontrado en el carrito")
+        actual = int(self._cantidades[fila])
+        if actual > cantidad:
+            self._cantidades[fila] = actual - cantidad
+        elif actual == cantidad:
+            self._quitar_fila(producto.nombre)
+        else:
+            raise ValueError("Cantidad a remover es mayor que la cantidad en el carrito")
+        self._version += 1
+
+    def actualizar_cantidad(self, producto, nueva_cantidad):
+        """
+        Actualiza la cantidad de un producto en el carrito.
+        Si la nueva cantidad es 0, elimina el item.
+        """
+        if nueva_cantidad < 0:
+            raise ValueError("La cantidad no puede ser negativa")
+        producto = self._resolver(producto)
+        fila = self._filas.get(producto.nombre)
+        if fila is None:
+            raise ValueError("Producto no encontrado en el carrito")
+        if nueva_cantidad == 0:
+            self._quitar_fila(producto.nombre)
+        else:
+            self._cantidades[fila] = nueva_cantidad
+        self._version += 1
+
+    agregar_productos = Carrito.agregar_productos
+    _simular_operaciones = Carrito._simular_operaciones
+    _resolver = Carrito._resolver
+
+    def aplicar_operaciones(self, operaciones):
+        """
+        Aplica una secuencia de operaciones de forma atómica (ver
+        Carrito.aplicar_operaciones). Las filas existentes se actualizan con
+        una única asignación indexada y las nuevas se anexan en bloque.
+        """
+        cambios = self._simular_operaciones(operaciones)
+        filas, cantidades, nuevos, cantidades_nuevas, eliminados = [], [], [], [], []
+        for clave, (producto, cantidad) in cambios.items():
+            fila = self._filas.get(clave)
+            if fila is None:
+                if cantidad > 0:
+                    nuevos.append(producto)
+                    cantidades_nuevas.append(cantidad)
+            elif cantidad == 0:
+                eliminados.append(clave)
+            else:
+                filas.append(fila)
+                cantidades.append(cantidad)
+        if filas:
+            self._cantidades[filas] = cantidades
+        for clave in eliminados:
+            self._quitar_fila(clave)
+        if nuevos:
+            self._insertar_filas(nuevos, cantidades_nuevas)
+        if cambios:
+            self._version += 1
+
+    def _estado_item(self, clave):
+        fila = self._filas.get(clave)
+        if fila is None:
+            return None
+        return self._productos[fila], int(self._cantidades[fila])
+
+    def _insertar_filas(self, productos, cantidades):
+        n = len(productos)
+        self._reservar(self._n + n)
+        inicio, fin = self._n, self._n + n
+        self._precios[inicio:fin] = [producto.precio for producto in productos]
+        self._cantidades[inicio:fin] = cantidades
+        self._activas[inicio:fin] = True
+        for fila, producto in enumerate(productos, inicio):
+            self._filas[producto.nombre] = fila
+            producto._suscribir(self)
+        self._productos.extend(productos)
+        self._n = fin
+
+    def _quitar_fila(self, clave):
+        fila = self._filas.pop(clave)
+        self._cantidades[fila] = 0
+        self._activas[fila] = False
+        self._productos[fila]._desuscribir(self)
+        if self._n - len(self._filas) > max(len(self._filas), 16):
+            self._compactar()
+
+    def _reservar(self, capacidad):
+        if capacidad <= len(self._precios):
+            return
+        nueva = max(capacidad, 2 * len(self._precios))
+        for atributo in ("_precios", "_cantidades", "_activas"):
+            anterior = getattr(self, atributo)
+            arreglo = np.zeros(nueva, dtype=anterior.dtype)
+            arreglo[:self._n] = anterior[:self._n]
+            setattr(self, atributo, arreglo)
+
+    def _compactar(self):
+        activas = self._filas_activas()
+        m = len(activas)
+        self._precios[:m] = self._precios[activas]
+        self._cantidades[:m] = self._cantidades[activas]
+        self._activas[:m] = True
+        self._cantidades[m:self._n] = 0
+        self._activas[m:self._n] = False
+        self._productos = [self._productos[fila] for fila in activas.tolist()]
+        self._filas = {producto.nombre: fila for fila, producto in enumerate(self._productos)}
+        self._n = m
+
+    def _filas_activas(self):
+        return np.flatnonzero(self._activas[:self._n])
+
+    def _precio_cambiado(self, producto, precio_anterior):
+        fila = self._filas.get(producto.nombre)
+        if fila is not None and self._productos[fila] is producto:
+            self._precios[fila] = producto.precio
+            self._version += 1
+
+    def calcular_total(self):
+        """
+        Calcula el total del carrito sin descuento.
+        """
+        return float(np.dot(self._precios[:self._n], self._cantidades[:self._n]))
+
+    def contar_items(self):
+        """
+        Retorna el número total de items (sumando las cantidades) en el carrito.
+        """
+        return int(self._cantidades[:self._n].sum())
+
+    def to_bytes(self):
+        """
+        Codifica el carrito en el formato binario de src.formato_binario.
+        """
+        activas = self._filas_activas().tolist()
+        return codificar((self._productos[fila], int(self._cantidades[fila])) for fila in activas)
+
+    @classmethod
+    def from_bytes(cls, datos, catalogo=None):
+        """
+        Construye un carrito a partir de datos generados con to_bytes, sin
+        volver a validar el stock (ver Carrito.from_bytes).
+        """
+        lineas = decodificar(datos, catalogo)
+        carrito = cls(capacidad=len(lineas), catalogo=catalogo)
+        if lineas:
+            productos, cantidades = zip(*lineas)
+            carrito._insertar_filas(list(productos), list(cantidades))
+        return carrito
+
+    def obtener_items(self):
+        """
+        Devuelve los items del carrito en orden de inserción. Son vistas
+        construidas al momento: modificarlas no altera el carrito.
+        """
+        return self._materializar(self._filas_activas())
+
+    def _materializar(self, filas):
+        productos, cantidades = self._productos, self._cantidades
+        return [ItemCarrito(productos[fila], int(cantidades[fila])) for fila in filas.tolist()]
+
+    def vaciar(self):
+        """
+        Vacía la lista de productos
+        """
+        for fila in self._filas.values():
+            self._productos[fila]._desuscribir(self)
+        self._cantidades[:self._n] = 0
+        self._activas[:self._n] = False
+        self._productos = []
+        self._filas = {}
+        self._n = 0
+        self._version += 1
+        return []
+
+    def obtener_items_ordenados(self, criterio: str, offset=0, limit=None, descendente=False):
+        """
+        Ordenar los items del carrito según el criterio "precio", "nombre",
+        "total" o "cantidad" con argsort estable, y devolver una página (ver
+        Carrito.obtener_items_ordenados). Solo se materializan los items de la página.
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("offset y limit no pueden ser negativos")
+        activas = self._filas_activas()
+        orden = np.argsort(self._claves_orden(criterio, activas), kind="stable")
+        if descendente:
+            orden = orden[::-1]
+        fin = None if limit is None else offset + limit
+        return self._materializar(activas[orden[offset:fin]])
+
+    def top_k(self, criterio: str, k, descendente=True):
+        """
+        Devuelve los k items con mayor valor según el criterio (o menor si
+        descendente es False), en el mismo orden que la primera página de
+        obtener_items_ordenados. Para criterios numéricos busca el k-ésimo
+        valor con partition y solo ordena las filas que no lo superan; los
+        empates se resuelven por posición, como el orden estable invertido.
+        """
+        activas = self._filas_activas()
+        claves = self._claves_orden(criterio, activas)
+        if criterio == "nombre" or k >= len(activas):
+            return self.obtener_items_ordenados(criterio, limit=k, descendente=descendente)
+        if k <= 0:
+            return []
+        posiciones = np.arange(len(activas))
+        if descendente:
+            claves, posiciones = -claves, -posiciones
+        limite = np.partition(claves, k - 1)[k - 1]
+        candidatas = np.flatnonzero(claves <= limite)
+        elegidas = candidatas[np.lexsort((posiciones[candidatas], claves[candidatas]))[:k]]
+        return self._materializar(activas[elegidas])
+
+    def _claves_orden(self, criterio, activas):
+        if criterio == "precio":
+            return self._precios[activas]
+        if criterio == "cantidad":
+            return self._cantidades[activas]
+        if criterio == "total":
+            return self._precios[activas] * self._cantidades[activas]
+        if criterio == "nombre":
+            return np.array([self._productos[fila].nombre.casefold() for fila in activas.tolist()])
+        raise ValueError("Criterio no válido")
+
+    # Las reglas de precio solo dependen de calcular_total
+    aplicar_descuento = Carrito.aplicar_descuento
+    aplicar_descuento_condicional = Carrito.aplicar_descuento_condicional
+    calcular_impuestos = Carrito.calcular_impuestos
+    aplicar_cupon = Carrito.aplicar_cupon
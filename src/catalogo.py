@@ -0,0 +1,110 @@
+# src/catalogo.py
+from bisect import bisect_left
+
+from .carrito import Producto
+
+
+class Catalogo:
+    """
+    Registro de productos con ids enteros estables. Internar un producto
+    garantiza que todos los carritos compartan un único objeto Producto por
+    nombre en lugar de guardar una copia cada uno.
+
+    Ofrece búsqueda por id y por nombre en O(1) y búsqueda por prefijo sin
+    distinguir mayúsculas sobre un índice ordenado de nombres normalizados.
+    """
+
+    def __init__(self):
+        self._por_id = []  # id -> Producto
+        self._por_nombre = {}
+        # Índice de prefijos: (nombre normalizado, id) ordenado; los productos
+        # nuevos esperan en _pendientes hasta la siguiente búsqueda
+        self._prefijos = []
+        self._pendientes = []
+
+    def internar(self, nombre, precio, stock):
+        """
+        Retorna el producto registrado con ese nombre, creándolo si no existe.
+        Si ya existe no se modifican su precio ni su stock.
+        """
+        producto = self._por_nombre.get(nombre)
+        if producto is None:
+            producto = self._registrar(Producto(nombre, precio, stock))
+        return producto
+
+    def agregar(self, producto):
+        """
+        Registra un producto existente y retorna la instancia canónica para su nombre.
+
+        Raises:
+            ValueError: Si el producto ya pertenece a otro catálogo o ya está
+                en algún carrito.
+        """
+        existente = self._por_nombre.get(producto.nombre)
+        if existente is not None:
+            return existente
+        if producto.id is not None:
+            raise ValueError("El producto ya pertenece a otro catálogo")
+        if producto._en_carritos():
+            raise ValueError("No se puede catalogar un producto que ya está en un carrito")
+        return self._registrar(producto)
+
+    def _registrar(self, producto):
+        producto._id = len(self._por_id)
+        self._por_id.append(producto)
+        self._por_nombre[producto.nombre] = producto
+        self._pendientes.append((producto.nombre.casefold(), producto.id))
+        return producto
+
+    def obtener(self, nombre):
+        """
+        Retorna el producto con ese nombre.
+
+        Raises:
+            ValueError: Si el producto no está en el catálogo.
+        """
+        producto = self._por_nombre.get(nombre)
+        if producto is None:
+            raise ValueError("Producto no encontrado en el catálogo")
+        return producto
+
+    def obtener_por_id(self, producto_id):
+        """
+        Retorna el producto con ese id.
+
+        Raises:
+            ValueError: Si el id no existe.
+        """
+        if not 0 <= producto_id < len(self._por_id):
+            raise ValueError("Producto no encontrado en el catálogo")
+        return self._por_id[producto_id]
+
+    def buscar_prefijo(self, prefijo, limite=10):
+        """
+        Retorna hasta `limite` productos cuyo nombre empieza por el prefijo,
+        sin distinguir mayúsculas, en orden alfabético.
+        """
+        if self._pendientes:
+            # Timsort combina en tiempo lineal la lista ya ordenada con los nuevos
+            self._prefijos.extend(self._pendientes)
+            self._prefijos.sort()
+            self._pendientes = []
+        prefijo = prefijo.casefold()
+        resultado = []
+        posicion = bisect_left(self._prefijos, (prefijo,))
+        while len(resultado) < limite and posicion < len(self._prefijos):
+            nombre, producto_id = self._prefijos[posicion]
+            if not nombre.startswith(prefijo):
+                break
+            resultado.append(self._por_id[producto_id])
+            posicion += 1
+        return resultado
+
+    def __contains__(self, nombre):
+        return nombre in self._por_nombre
+
+    def __len__(self):
+        return len(self._por_id)
+
+    def __iter__(self):
+        return iter(self._por_id)
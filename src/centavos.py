@@ -0,0 +1,164 @@
+# src/centavos.py
+"""
+Modo de precios en centavos enteros: los totales se acumulan como enteros y
+los porcentajes se aplican con aritmética racional exacta, redondeando a
+centavo con una regla explícita para cada tipo de cálculo.
+"""
+from collections import namedtuple
+from fractions import Fraction
+
+from .carrito import Carrito
+
+MITAD_PAR = "mitad_par"
+MITAD_ARRIBA = "mitad_arriba"
+HACIA_ABAJO = "hacia_abajo"
+HACIA_ARRIBA = "hacia_arriba"
+
+ReglasRedondeo = namedtuple(
+    "ReglasRedondeo",
+    ["descuento", "impuesto", "cupon"],
+    defaults=[MITAD_PAR, MITAD_PAR, MITAD_PAR],
+)
+
+
+def a_centavos(precio):
+    """
+    Convierte un precio en unidades monetarias a centavos enteros.
+    """
+    return round(precio * 100)
+
+
+def dividir(numerador, denominador, modo):
+    """
+    Divide enteros redondeando el cociente según el modo indicado.
+
+    Raises:
+        ValueError: Si el modo de redondeo no es válido.
+    """
+    signo = -1 if (numerador < 0) != (denominador < 0) else 1
+    cociente, resto = divmod(abs(numerador), abs(denominador))
+    denominador = abs(denominador)
+    if modo == HACIA_ABAJO:
+        ajuste = 0 if signo > 0 else resto > 0
+    elif modo == HACIA_ARRIBA:
+        ajuste = resto > 0 if signo > 0 else 0
+    elif modo == MITAD_ARRIBA:
+        ajuste = 2 * resto >= denominador
+    elif modo == MITAD_PAR:
+        ajuste = 2 * resto > denominador or (2 * resto == denominador and cociente % 2 == 1)
+    else:
+        raise ValueError("Modo de redondeo no válido")
+    return signo * (cociente + ajuste)
+
+
+def porcentaje_de(centavos, porcentaje, modo):
+    """
+    Calcula el porcentaje de un monto en centavos, redondeado a centavo.
+    El porcentaje se interpreta exactamente como está escrito (12.5 es 25/2).
+    """
+    fraccion = Fraction(str(porcentaje))
+    return dividir(centavos * fraccion.numerator, 100 * fraccion.denominator, modo)
+
+
+class CarritoCentavos(Carrito):
+    """
+    Carrito que acumula el total en centavos enteros en lugar de float, de
+    modo que sumar y restar líneas nunca arrastra error de redondeo.
+
+    Los métodos *_centavos devuelven enteros; los métodos heredados devuelven
+    esos mismos montos convertidos a unidades (centavos / 100).
+    """
+    __slots__ = ("_total_centavos", "_redondeo")
+
+    def __init__(self, inventario=None, catalogo=None, redondeo=None):
+        """
+        Args:
+            redondeo (ReglasRedondeo): Regla de redondeo para descuentos,
+                impuestos y cupones; por defecto mitad al par en todos.
+        """
+        super().__init__(inventario, catalogo)
+        self._total_centavos = 0
+        self._redondeo = redondeo or ReglasRedondeo()
+
+    def _insertar_item(self, producto, cantidad):
+        super()._insertar_item(producto, cantidad)
+        self._total_centavos += a_centavos(producto.precio) * cantidad
+
+    def _cambiar_cantidad(self, item, nueva_cantidad):
+        self._total_centavos += a_centavos(item.producto.precio) * (nueva_cantidad - item.cantidad)
+        super()._cambiar_cantidad(item, nueva_cantidad)
+
+    def _quitar_item(self, item):
+        super()._quitar_item(item)
+        self._total_centavos -= a_centavos(item.producto.precio) * item.cantidad
+
+    def _precio_cambiado(self, producto, precio_anterior):
+        item = self._items.get(producto.nombre)
+        if item is not None and item.producto is producto:
+            self._total_centavos += (a_centavos(producto.precio) - a_centavos(precio_anterior)) * item.cantidad
+        super()._precio_cambiado(producto, precio_anterior)
+
+    def vaciar(self):
+        resultado = super().vaciar()
+        self._total_centavos = 0
+        return resultado
+
+    def calcular_total_centavos(self):
+        """
+        Retorna el total del carrito en centavos.
+        """
+        return self._total_centavos
+
+    def aplicar_descuento_centavos(self, porcentaje):
+        """
+        Retorna el total con descuento, en centavos. El descuento se redondea
+        con la regla `descuento`.
+
+        Raises:
+            ValueError: Si el porcentaje no está entre 0 y 100.
+        """
+        if porcentaje < 0 or porcentaje > 100:
+            raise ValueError("El porcentaje debe estar entre 0 y 100")
+        total = self._total_centavos
+        return total - porcentaje_de(total, porcentaje, self._redondeo.descuento)
+
+    def calcular_impuestos_centavos(self, porcentaje):
+        """
+        Retorna el impuesto sobre el total, en centavos, redondeado con la regla `impuesto`.
+
+        Raises:
+            ValueError: Si el porcentaje no está entre 0 y 100.
+        """
+        if porcentaje < 0 or porcentaje > 100:
+            raise ValueError("El porcentaje debe estar entre 0 y 100")
+        return porcentaje_de(self._total_centavos, porcentaje, self._redondeo.impuesto)
+
+    def aplicar_cupon_centavos(self, descuento_porcentaje, descuento_maximo):
+        """
+        Retorna el total tras aplicar el cupón, en centavos. El descuento se
+        redondea con la regla `cupon` antes de compararlo con el tope.
+
+        Args:
+            descuento_porcentaje (float): Porcentaje de descuento a aplicar.
+            descuento_maximo (float): Valor máximo de descuento, en unidades monetarias.
+
+        Raises:
+            ValueError: Si alguno de los valores es negativo.
+        """
+        if descuento_porcentaje < 0 or descuento_maximo < 0 or descuento_porcentaje > 100:
+            raise ValueError("Los valores de descuento deben ser positivos")
+        total = self._total_centavos
+        descuento = porcentaje_de(total, descuento_porcentaje, self._redondeo.cupon)
+        return total - min(descuento, a_centavos(descuento_maximo))
+
+    def calcular_total(self):
+        return self._total_centavos / 100
+
+    def aplicar_descuento(self, porcentaje):
+        return self.aplicar_descuento_centavos(porcentaje) / 100
+
+    def calcular_impuestos(self, porcentaje):
+        return self.calcular_impuestos_centavos(porcentaje) / 100
+
+    def aplicar_cupon(self, descuento_porcentaje, descuento_maximo):
+        return self.aplicar_cupon_centavos(descuento_porcentaje, descuento_maximo) / 100
@@ -0,0 +1,126 @@
+# src/eventos.py
+"""
+Consumo incremental de los eventos de Carrito.
+
+    flujo = FlujoEventos([carrito_a, carrito_b], capacidad=4096, tamano_lote=256)
+    conteo = ConteoPorProducto()
+    for lote in flujo.lotes():      # en un hilo consumidor
+        conteo.aplicar(lote)
+
+Los carritos entregan cada evento al flujo, que lo guarda en un buffer
+acotado; el consumidor lo retira en lotes. Con bloquear=True un productor
+espera si el buffer está lleno, lo que exige que el consumidor corra en otro
+hilo. Con bloquear=False se descarta el evento más antiguo y se cuenta en
+`descartados`, útil cuando productor y consumidor comparten hilo.
+"""
+import threading
+from collections import deque
+
+from .carrito import CantidadCambiada, CarritoVaciado, ItemAgregado, ItemRemovido
+
+
+class FlujoEventos:
+    """
+    Buffer acotado de eventos de uno o varios carritos, consumido por lotes.
+    """
+
+    def __init__(self, carritos=(), capacidad=1024, tamano_lote=64, bloquear=True):
+        """
+        Raises:
+            ValueError: Si la capacidad o el tamaño de lote no son positivos.
+        """
+        if capacidad <= 0 or tamano_lote <= 0:
+            raise ValueError("La capacidad y el tamaño de lote deben ser positivos")
+        self._buffer = deque()
+        self._capacidad = capacidad
+        self._tamano_lote = tamano_lote
+        self._bloquear = bloquear
+        self._condicion = threading.Condition()
+        self._carritos = []
+        self._cerrado = False
+        self.descartados = 0
+        for carrito in carritos:
+            self.agregar(carrito)
+
+    def agregar(self, carrito):
+        """
+        Empieza a recibir los eventos del carrito.
+        """
+        carrito.suscribir(self._recibir)
+        self._carritos.append(carrito)
+
+    def _recibir(self, evento):
+        with self._condicion:
+            while self._bloquear and len(self._buffer) >= self._capacidad and not self._cerrado:
+                self._condicion.wait()
+            if len(self._buffer) >= self._capacidad:
+                self._buffer.popleft()
+                self.descartados += 1
+            self._buffer.append(evento)
+            self._condicion.notify_all()
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def lotes(self, espera=None):
+        """
+        Genera listas de hasta tamano_lote eventos, en el orden en que se emitieron.
+
+        Args:
+            espera (float): Segundos a esperar eventos nuevos con el buffer
+                vacío antes de terminar; None espera hasta cerrar(). Con 0 se
+                entrega lo pendiente y termina.
+        """
+        while True:
+            with self._condicion:
+                if not self._buffer and not self._cerrado:
+                    self._condicion.wait_for(lambda: self._buffer or self._cerrado, espera)
+                if not self._buffer:
+                    return
+                lote = [self._buffer.popleft() for _ in range(min(self._tamano_lote, len(self._buffer)))]
+                self._condicion.notify_all()
+            yield lote
+
+    def cerrar(self):
+        """
+        Deja de recibir eventos. Los pendientes siguen disponibles en lotes(),
+        que termina al vaciarse el buffer.
+        """
+        for carrito in self._carritos:
+            carrito.desuscribir(self._recibir)
+        self._carritos = []
+        with self._condicion:
+            self._cerrado = True
+            self._condicion.notify_all()
+
+
+class ConteoPorProducto:
+    """
+    Agregado incremental de unidades y carritos por producto, actualizado
+    solo con eventos, sin recorrer los carritos.
+    """
+
+    def __init__(self):
+        self.unidades = {}  # nombre -> unidades en carritos
+        self.carritos = {}  # nombre -> carritos que contienen el producto
+
+    def aplicar(self, eventos):
+        for evento in eventos:
+            if isinstance(evento, ItemAgregado):
+                self._sumar(evento.producto.nombre, evento.cantidad, 1)
+            elif isinstance(evento, CantidadCambiada):
+                self._sumar(evento.producto.nombre, evento.cantidad - evento.anterior, 0)
+            elif isinstance(evento, ItemRemovido):
+                self._sumar(evento.producto.nombre, -evento.cantidad, -1)
+            elif isinstance(evento, CarritoVaciado):
+                for producto, cantidad in evento.items:
+                    self._sumar(producto.nombre, -cantidad, -1)
+
+    def _sumar(self, nombre, unidades, carritos):
+        total = self.unidades.get(nombre, 0) + unidades
+        if total:
+            self.unidades[nombre] = total
+            self.carritos[nombre] = self.carritos.get(nombre, 0) + carritos
+        else:
+            self.unidades.pop(nombre, None)
+            self.carritos.pop(nombre, None)
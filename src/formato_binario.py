@@ -0,0 +1,141 @@
+# src/formato_binario.py
+"""
+Formato binario versionado para enviar carritos entre servicios.
+
+Disposición (little-endian):
+    cabecera  16 bytes: magia b"CRTB", versión (u16), reservado (u16),
+              número de líneas (u32), número de nombres (u32)
+    líneas    32 bytes cada una: precio (f64), cantidad (i64), stock (i64),
+              índice en la tabla de nombres (i64)
+    nombres   por cada nombre: largo (u16) y bytes UTF-8
+
+Las líneas tienen ancho fijo y todos sus campos ocupan 8 bytes, así que
+precios y cantidades pueden leerse como arreglos de NumPy sobre el buffer
+sin copiarlo ni construir objetos por línea.
+"""
+import struct
+
+import numpy as np
+
+from .carrito import Producto
+
+MAGIA = b"CRTB"
+VERSION = 1
+
+_CABECERA = struct.Struct("<4sHHII")
+_LINEA = struct.Struct("<dqqq")
+_LARGO = struct.Struct("<H")
+_CAMPOS_POR_LINEA = _LINEA.size // 8
+
+
+def codificar(lineas):
+    """
+    Codifica una secuencia de (producto, cantidad).
+
+    Returns:
+        bytes: Carrito codificado.
+    """
+    indices = {}
+    cuerpo = bytearray()
+    n = 0
+    for producto, cantidad in lineas:
+        indice = indices.setdefault(producto.nombre, len(indices))
+        cuerpo += _LINEA.pack(producto.precio, cantidad, producto.stock, indice)
+        n += 1
+    nombres = bytearray()
+    for nombre in indices:
+        codificado = nombre.encode("utf-8")
+        nombres += _LARGO.pack(len(codificado)) + codificado
+    return _CABECERA.pack(MAGIA, VERSION, 0, n, len(indices)) + bytes(cuerpo) + bytes(nombres)
+
+
+def leer_cabecera(datos):
+    """
+    Valida la cabecera y retorna (número de líneas, número de nombres).
+
+    Raises:
+        ValueError: Si los datos no son un carrito codificado o la versión no es compatible.
+    """
+    if len(datos) < _CABECERA.size:
+        raise ValueError("Datos de carrito incompletos")
+    magia, version, _, n_lineas, n_nombres = _CABECERA.unpack_from(datos)
+    if magia != MAGIA:
+        raise ValueError("Los datos no son un carrito codificado")
+    if version != VERSION:
+        raise ValueError(f"Versión de formato no soportada: {version}")
+    if len(datos) < _CABECERA.size + n_lineas * _LINEA.size:
+        raise ValueError("Datos de carrito incompletos")
+    return n_lineas, n_nombres
+
+
+def decodificar(datos, catalogo=None):
+    """
+    Decodifica un carrito y retorna una lista de (producto, cantidad).
+    Con catálogo, los productos se internan en él en lugar de crearse.
+
+    Raises:
+        ValueError: Si los datos están incompletos, repiten un producto o
+            tienen una cantidad no positiva.
+    """
+    datos = memoryview(datos)
+    n_lineas, n_nombres = leer_cabecera(datos)
+    posicion = _CABECERA.size + n_lineas * _LINEA.size
+    nombres = []
+    try:
+        for _ in range(n_nombres):
+            (largo,) = _LARGO.unpack_from(datos, posicion)
+            posicion += _LARGO.size
+            if posicion + largo > len(datos):
+                raise ValueError("Datos de carrito incompletos")
+            nombres.append(bytes(datos[posicion:posicion + largo]).decode("utf-8"))
+            posicion += largo
+    except struct.error:
+        raise ValueError("Datos de carrito incompletos") from None
+    lineas = []
+    vistos = set()
+    for precio, cantidad, stock, indice in _LINEA.iter_unpack(datos[_CABECERA.size:_CABECERA.size + n_lineas * _LINEA.size]):
+        if not 0 <= indice < len(nombres):
+            raise ValueError("Índice de nombre fuera de rango")
+        if indice in vistos:
+            raise ValueError("Producto repetido en el carrito codificado")
+        if cantidad <= 0:
+            raise ValueError("Cantidad no válida en el carrito codificado")
+        vistos.add(indice)
+        nombre = nombres[indice]
+        if catalogo is not None:
+            producto = catalogo.internar(nombre, precio, stock)
+        else:
+            producto = Producto(nombre, precio, stock)
+        lineas.append((producto, cantidad))
+    return lineas
+
+
+class VistaCarrito:
+    """
+    Vista de solo lectura sobre un carrito codificado. Calcula totales de
+    forma vectorizada sobre las columnas del buffer, sin copiarlo ni crear
+    objetos por línea.
+    """
+
+    def __init__(self, datos):
+        self._datos = memoryview(datos)
+        self._n, _ = leer_cabecera(self._datos)
+        lineas = self._datos[_CABECERA.size:_CABECERA.size + self._n * _LINEA.size]
+        # Vistas con paso de una línea sobre el mismo bloque
+        self._precios = np.frombuffer(lineas, dtype="<f8")[0::_CAMPOS_POR_LINEA]
+        self._cantidades = np.frombuffer(lineas, dtype="<i8")[1::_CAMPOS_POR_LINEA]
+
+    def __len__(self):
+        return self._n
+
+    def calcular_total(self):
+        """
+        Calcula el total del carrito sin descuento.
+        """
+        return float(np.dot(self._precios, self._cantidades))
+
+    def contar_items(self):
+        """
+        Retorna el número total de items (sumando las cantidades) en el carrito.
+        """
+        return int(self._cantidades.sum())
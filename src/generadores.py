@@ -0,0 +1,144 @@
+# src/generadores.py
+"""
+Generación masiva y determinista de productos y carritos sintéticos.
+
+    productos = list(generar_productos(1_000_000, semilla=1))
+    for carrito in generar_carritos(productos, 100_000, semilla=1, popularidad=Zipf(1.1)):
+        ...
+
+A diferencia de ProductoFactory, los valores se sortean por lotes con NumPy
+y los objetos se entregan con generadores, así que la memoria depende del
+tamaño del lote y no del total. Cada campo usa su propio flujo aleatorio
+derivado de la semilla: el resultado depende solo de la semilla y de los
+parámetros, no del tamaño del lote.
+"""
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from .carrito import Carrito, Producto
+
+Constante = namedtuple("Constante", ["valor"])
+Uniforme = namedtuple("Uniforme", ["minimo", "maximo"])
+LogNormal = namedtuple("LogNormal", ["mediana", "sigma"])
+# Popularidad acotada: el producto en la posición i se elige con peso (i + 1) ** -exponente
+Zipf = namedtuple("Zipf", ["exponente"])
+
+PRECIO = LogNormal(mediana=50.0, sigma=1.0)
+STOCK = Uniforme(1, 100)
+LINEAS = Uniforme(1, 10)
+CANTIDAD = Uniforme(1, 5)
+
+
+def _flujos(semilla, n):
+    return [np.random.default_rng(s) for s in np.random.SeedSequence(semilla).spawn(n)]
+
+
+def _muestrear(rng, distribucion, n, entero):
+    """
+    Sortea n valores de la distribución; los enteros se redondean y se
+    acotan a un mínimo de 1.
+    """
+    if isinstance(distribucion, Constante):
+        valores = np.full(n, distribucion.valor, dtype=float)
+    elif isinstance(distribucion, Uniforme):
+        if distribucion.minimo > distribucion.maximo:
+            raise ValueError("El mínimo no puede ser mayor que el máximo")
+        if entero:
+            return np.maximum(rng.integers(distribucion.minimo, distribucion.maximo, size=n, endpoint=True), 1)
+        valores = rng.uniform(distribucion.minimo, distribucion.maximo, size=n)
+    elif isinstance(distribucion, LogNormal):
+        if distribucion.mediana <= 0 or distribucion.sigma < 0:
+            raise ValueError("La mediana debe ser positiva y sigma no negativa")
+        valores = rng.lognormal(math.log(distribucion.mediana), distribucion.sigma, size=n)
+    else:
+        raise ValueError(f"Distribución no válida: {distribucion!r}")
+    if entero:
+        return np.maximum(np.rint(valores), 1).astype(np.int64)
+    return valores
+
+
+def generar_productos(n, semilla=0, precio=PRECIO, stock=STOCK, prefijo="SKU", lote=65_536):
+    """
+    Genera n productos con nombres f"{prefijo}{i:08d}".
+
+    Args:
+        n (int): Número de productos.
+        semilla (int): Semilla; la misma semilla produce los mismos productos.
+        precio: Distribución del precio; se redondea a centavos, mínimo 0.01.
+        stock: Distribución del stock (entero, mínimo 1).
+        lote (int): Productos sorteados por lote.
+
+    Yields:
+        Producto
+    """
+    flujo_precio, flujo_stock = _flujos(semilla, 2)
+    for inicio in range(0, n, lote):
+        tamano = min(lote, n - inicio)
+        precios = np.maximum(np.round(_muestrear(flujo_precio, precio, tamano, False), 2), 0.01).tolist()
+        stocks = _muestrear(flujo_stock, stock, tamano, True).tolist()
+        for i, (p, s) in enumerate(zip(precios, stocks), inicio):
+            yield Producto(f"{prefijo}{i:08d}", p, s)
+
+
+def _selector(n, popularidad):
+    """
+    Retorna una función (rng, tamaño) -> índices de productos.
+    """
+    if popularidad is None:
+        return lambda rng, tamano: rng.integers(0, n, size=tamano)
+    if not isinstance(popularidad, Zipf) or popularidad.exponente < 0:
+        raise ValueError(f"Popularidad no válida: {popularidad!r}")
+    acumulado = np.cumsum(np.arange(1, n + 1, dtype=float) ** -popularidad.exponente)
+    acumulado /= acumulado[-1]
+    return lambda rng, tamano: np.minimum(np.searchsorted(acumulado, rng.random(tamano), side="right"), n - 1)
+
+
+def generar_carritos(productos, m, semilla=0, lineas=LINEAS, cantidad=CANTIDAD, popularidad=None,
+                     fabrica=Carrito, lote=1_024):
+    """
+    Genera m carritos con productos sorteados de `productos`.
+
+    Los sorteos repetidos de un mismo producto en un carrito se suman y la
+    cantidad de cada línea se acota al stock del producto, así que agregarla
+    nunca falla por stock.
+
+    Args:
+        productos (sequence): Productos disponibles, con acceso por índice.
+        m (int): Número de carritos.
+        semilla (int): Semilla; la misma semilla produce los mismos carritos.
+        lineas: Distribución de sorteos de producto por carrito (entero).
+        cantidad: Distribución de la cantidad por sorteo (entero).
+        popularidad (Zipf): Sesgo de popularidad; None para elegir los productos
+            de manera uniforme.
+        fabrica (callable): Crea cada carrito vacío, por ejemplo
+            lambda: Carrito(inventario=inventario).
+        lote (int): Carritos sorteados por lote.
+
+    Yields:
+        Carrito
+
+    Raises:
+        ValueError: Si no hay productos o alguna distribución no es válida.
+    """
+    if not productos:
+        raise ValueError("Se necesita al menos un producto")
+    elegir = _selector(len(productos), popularidad)
+    flujo_lineas, flujo_productos, flujo_cantidad = _flujos(semilla, 3)
+    for inicio in range(0, m, lote):
+        por_carrito = _muestrear(flujo_lineas, lineas, min(lote, m - inicio), True)
+        total = int(por_carrito.sum())
+        indices = elegir(flujo_productos, total).tolist()
+        cantidades = _muestrear(flujo_cantidad, cantidad, total, True).tolist()
+        posicion = 0
+        for n_lineas in por_carrito.tolist():
+            pedido = {}
+            for i in range(posicion, posicion + n_lineas):
+                pedido[indices[i]] = pedido.get(indices[i], 0) + cantidades[i]
+            posicion += n_lineas
+            carrito = fabrica()
+            carrito.agregar_productos(
+                (productos[i], min(c, productos[i].stock)) for i, c in pedido.items()
+            )
+            yield carrito
@@ -0,0 +1,143 @@
+# src/historial.py
+"""
+Historial acotado de deshacer/rehacer para un carrito.
+
+    historial = Historial(carrito, maximo=50)
+    carrito.agregar_producto(mouse, 2)
+    historial.deshacer()
+    historial.rehacer()
+
+El historial se suscribe a los eventos del carrito y guarda solo los
+cambios: por cada paso, las operaciones que lo revierten y las que lo
+vuelven a aplicar, nunca una copia del carrito. Cada evento es un paso;
+agrupar() junta en un único paso los cambios hechos dentro del bloque, por
+ejemplo los de agregar_productos o fusionar.
+"""
+from collections import deque
+from contextlib import contextmanager
+
+from .carrito import (
+    ACTUALIZAR,
+    AGREGAR,
+    REMOVER,
+    CantidadCambiada,
+    CarritoVaciado,
+    ItemAgregado,
+    ItemRemovido,
+    Operacion,
+)
+
+
+def _inversas(evento):
+    """
+    Retorna (operaciones para deshacer, operaciones para rehacer) de un evento.
+    """
+    if isinstance(evento, ItemAgregado):
+        return [Operacion(REMOVER, evento.producto, evento.cantidad)], [Operacion(AGREGAR, evento.producto, evento.cantidad)]
+    if isinstance(evento, CantidadCambiada):
+        return ([Operacion(ACTUALIZAR, evento.producto, evento.anterior)],
+                [Operacion(ACTUALIZAR, evento.producto, evento.cantidad)])
+    if isinstance(evento, ItemRemovido):
+        return [Operacion(AGREGAR, evento.producto, evento.cantidad)], [Operacion(REMOVER, evento.producto, evento.cantidad)]
+    if isinstance(evento, CarritoVaciado):
+        return ([Operacion(AGREGAR, producto, cantidad) for producto, cantidad in evento.items],
+                [Operacion(REMOVER, producto, cantidad) for producto, cantidad in evento.items])
+    raise ValueError(f"Evento no válido: {evento!r}")
+
+
+class Historial:
+    """
+    Pilas acotadas de pasos para deshacer y rehacer los cambios de un carrito.
+    """
+
+    def __init__(self, carrito, maximo=100):
+        """
+        Args:
+            carrito (Carrito): Carrito a seguir.
+            maximo (int): Pasos que se conservan; los más antiguos se descartan.
+
+        Raises:
+            ValueError: Si el máximo no es positivo.
+        """
+        if maximo <= 0:
+            raise ValueError("El máximo de pasos debe ser positivo")
+        self._carrito = carrito
+        self._deshacer = deque(maxlen=maximo)
+        self._rehacer = deque(maxlen=maximo)
+        self._grupo = None
+        self._aplicando = False
+        carrito.suscribir(self._registrar)
+
+    def _registrar(self, evento):
+        if self._aplicando:
+            return
+        deshacer, rehacer = _inversas(evento)
+        if self._grupo is not None:
+            self._grupo[0][:0] = deshacer  # se deshace en orden inverso
+            self._grupo[1].extend(rehacer)
+            return
+        self._deshacer.append((deshacer, rehacer))
+        self._rehacer.clear()
+
+    @contextmanager
+    def agrupar(self):
+        """
+        Registra como un único paso todos los cambios hechos dentro del bloque.
+        """
+        if self._grupo is not None:
+            yield
+            return
+        self._grupo = ([], [])
+        try:
+            yield
+        finally:
+            grupo, self._grupo = self._grupo, None
+            if grupo[1]:
+                self._deshacer.append(grupo)
+                self._rehacer.clear()
+
+    def puede_deshacer(self):
+        return bool(self._deshacer)
+
+    def puede_rehacer(self):
+        return bool(self._rehacer)
+
+    def deshacer(self):
+        """
+        Revierte el último paso.
+
+        Raises:
+            ValueError: Si no hay nada que deshacer, o si revertir el paso
+                excede el stock; en ese caso el paso sigue en el historial.
+        """
+        if not self._deshacer:
+            raise ValueError("No hay cambios para deshacer")
+        paso = self._deshacer[-1]
+        self._aplicar(paso[0])
+        self._rehacer.append(self._deshacer.pop())
+
+    def rehacer(self):
+        """
+        Vuelve a aplicar el último paso deshecho.
+
+        Raises:
+            ValueError: Si no hay nada que rehacer o si el paso excede el stock.
+        """
+        if not self._rehacer:
+            raise ValueError("No hay cambios para rehacer")
+        paso = self._rehacer[-1]
+        self._aplicar(paso[1])
+        self._deshacer.append(self._rehacer.pop())
+
+    def _aplicar(self, operaciones):
+        self._aplicando = True
+        try:
+            self._carrito.aplicar_operaciones(operaciones)
+        finally:
+            self._aplicando = False
+
+    def cerrar(self):
+        """
+        Deja de seguir el carrito.
+        """
+        self._carrito.desuscribir(self._registrar)
@@ -0,0 +1,220 @@
+# src/importacion.py
+"""
+Importación en streaming de catálogos y pedidos desde CSV o JSONL.
+
+    resultado = importar_catalogo("catalogo.csv", catalogo)
+    carritos = defaultdict(lambda: Carrito(catalogo=catalogo))
+    resultado = importar_pedidos("pedidos.jsonl", catalogo, carritos.__getitem__)
+    print(resultado.filas_por_segundo, resultado.errores[:10])
+
+Los archivos se leen fila a fila y se procesan en lotes de `tamano_lote`,
+así que la memoria no depende del tamaño del archivo. Una fila inválida se
+registra como ErrorFila y la importación continúa; solo se guardan los
+primeros `max_errores` errores, aunque se cuentan todos.
+
+Columnas del catálogo: nombre, precio, stock. Columnas de pedidos: carrito,
+producto (nombre en el catálogo), cantidad. Las filas se numeran desde 1
+sin contar la cabecera del CSV.
+"""
+import csv
+import json
+import math
+import os
+import time
+from collections import namedtuple
+from itertools import islice
+
+CSV = "csv"
+JSONL = "jsonl"
+
+ErrorFila = namedtuple("ErrorFila", ["fila", "mensaje"])
+
+
+class ResultadoImportacion(namedtuple("ResultadoImportacion", ["filas", "importadas", "fallidas", "errores", "segundos"])):
+    """
+    filas: filas leídas; importadas y fallidas: cuántas se aplicaron o no;
+    errores: los primeros ErrorFila; segundos: duración total.
+    """
+    __slots__ = ()
+
+    @property
+    def filas_por_segundo(self):
+        return self.filas / self.segundos if self.segundos else float("inf")
+
+
+def _formato(fuente, formato):
+    if formato is not None:
+        if formato not in (CSV, JSONL):
+            raise ValueError(f"Formato no soportado: {formato}")
+        return formato
+    nombre = fuente if isinstance(fuente, (str, os.PathLike)) else getattr(fuente, "name", "")
+    extension = os.path.splitext(os.fspath(nombre))[1].lower() if nombre else ""
+    if extension == ".csv":
+        return CSV
+    if extension in (".jsonl", ".ndjson"):
+        return JSONL
+    raise ValueError("No se pudo deducir el formato; indique CSV o JSONL")
+
+
+def leer_filas(fuente, formato=None):
+    """
+    Genera (número de fila, dict) a partir de una ruta o un archivo de texto
+    abierto. Una línea JSONL que no es un objeto JSON se entrega como
+    (número, ErrorFila) para que quien consume la registre.
+
+    Raises:
+        ValueError: Si el formato no se indica ni puede deducirse.
+    """
+    formato = _formato(fuente, formato)
+    if isinstance(fuente, (str, os.PathLike)):
+        with open(fuente, newline="", encoding="utf-8") as archivo:
+            yield from leer_filas(archivo, formato)
+        return
+    if formato == CSV:
+        yield from enumerate(csv.DictReader(fuente), 1)
+        return
+    for numero, linea in enumerate(fuente, 1):
+        if not linea.strip():
+            continue
+        try:
+            fila = json.loads(linea)
+        except ValueError as error:
+            yield numero, ErrorFila(numero, f"JSON inválido: {error}")
+            continue
+        if not isinstance(fila, dict):
+            yield numero, ErrorFila(numero, "La fila no es un objeto JSON")
+            continue
+        yield numero, fila
+
+
+def _campo(fila, nombre):
+    valor = fila.get(nombre)
+    if valor is None or valor == "":
+        raise ValueError(f"Falta el campo {nombre}")
+    return valor
+
+
+def _numero(fila, nombre, tipo):
+    valor = _campo(fila, nombre)
+    try:
+        numero = tipo(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"El campo {nombre} no es un número válido: {valor!r}") from None
+    if tipo is int and isinstance(valor, float) and numero != valor:
+        raise ValueError(f"El campo {nombre} debe ser entero: {valor!r}")
+    if tipo is float and not math.isfinite(numero):
+        raise ValueError(f"El campo {nombre} no es un número válido: {valor!r}")
+    if numero < 0:
+        raise ValueError(f"El campo {nombre} no puede ser negativo")
+    return numero
+
+
+class _Acumulador:
+    def __init__(self, max_errores):
+        self.filas = self.importadas = self.fallidas = 0
+        self.errores = []
+        self._max_errores = max_errores
+        self._inicio = time.perf_counter()
+
+    def error(self, numero, mensaje):
+        self.fallidas += 1
+        if len(self.errores) < self._max_errores:
+            self.errores.append(ErrorFila(numero, mensaje))
+
+    def resultado(self):
+        return ResultadoImportacion(
+            self.filas, self.importadas, self.fallidas, self.errores, time.perf_counter() - self._inicio
+        )
+
+
+def _lotes(filas, tamano_lote):
+    if tamano_lote <= 0:
+        raise ValueError("El tamaño de lote debe ser positivo")
+    filas = iter(filas)
+    while True:
+        lote = list(islice(filas, tamano_lote))
+        if not lote:
+            return
+        yield lote
+
+
+def importar_catalogo(fuente, catalogo, formato=None, tamano_lote=10_000, max_errores=1_000):
+    """
+    Crea o actualiza productos del catálogo. Si el producto ya existe se
+    actualizan su precio (notificando a los carritos) y su stock.
+
+    Returns:
+        ResultadoImportacion
+    """
+    acumulado = _Acumulador(max_errores)
+    for lote in _lotes(leer_filas(fuente, formato), tamano_lote):
+        acumulado.filas += len(lote)
+        for numero, fila in lote:
+            if isinstance(fila, ErrorFila):
+                acumulado.error(numero, fila.mensaje)
+                continue
+            try:
+                nombre = str(_campo(fila, "nombre"))
+                precio = _numero(fila, "precio", float)
+                stock = _numero(fila, "stock", int)
+            except ValueError as error:
+                acumulado.error(numero, str(error))
+                continue
+            if nombre in catalogo:
+                producto = catalogo.obtener(nombre)
+                if producto.precio != precio:
+                    producto.precio = precio
+                producto.stock = stock
+            else:
+                catalogo.internar(nombre, precio, stock)
+            acumulado.importadas += 1
+    return acumulado.resultado()
+
+
+def importar_pedidos(fuente, catalogo, obtener_carrito, formato=None, tamano_lote=10_000, max_errores=1_000):
+    """
+    Agrega las líneas de pedido a sus carritos. Las líneas de un lote se
+    agrupan por carrito y se agregan con agregar_productos; si el lote de un
+    carrito falla, sus líneas se reintentan una a una para registrar el error
+    de cada fila y aplicar las válidas.
+
+    Args:
+        obtener_carrito (callable): id de carrito (texto de la columna
+            carrito) -> Carrito, por ejemplo el __getitem__ de un defaultdict.
+
+    Returns:
+        ResultadoImportacion
+    """
+    acumulado = _Acumulador(max_errores)
+    for lote in _lotes(leer_filas(fuente, formato), tamano_lote):
+        acumulado.filas += len(lote)
+        por_carrito = {}  # id -> [(número, producto, cantidad)]
+        for numero, fila in lote:
+            if isinstance(fila, ErrorFila):
+                acumulado.error(numero, fila.mensaje)
+                continue
+            try:
+                carrito_id = str(_campo(fila, "carrito"))
+                producto = catalogo.obtener(str(_campo(fila, "producto")))
+                cantidad = _numero(fila, "cantidad", int)
+                if cantidad == 0:
+                    raise ValueError("El campo cantidad debe ser mayor que cero")
+            except ValueError as error:
+                acumulado.error(numero, str(error))
+                continue
+            por_carrito.setdefault(carrito_id, []).append((numero, producto, cantidad))
+        for carrito_id, lineas in por_carrito.items():
+            carrito = obtener_carrito(carrito_id)
+            try:
+                carrito.agregar_productos((producto, cantidad) for _, producto, cantidad in lineas)
+                acumulado.importadas += len(lineas)
+                continue
+            except ValueError:
+                pass
+            for numero, producto, cantidad in lineas:
+                try:
+                    carrito.agregar_producto(producto, cantidad)
+                    acumulado.importadas += 1
+                except ValueError as error:
+                    acumulado.error(numero, str(error))
+    return acumulado.resultado()
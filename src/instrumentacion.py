@@ -0,0 +1,246 @@
+# src/instrumentacion.py
+"""
+Instrumentación opcional de las operaciones de Carrito.
+
+    activar()
+    ...
+    print(exportar_prometheus())
+    desactivar()
+
+    with perfilar() as perfil:
+        atender_pedido(carrito)
+    perfil.instantanea()
+
+Mientras está desactivada no existe ningún envoltorio: activar() reemplaza
+los métodos de Carrito por versiones que miden y desactivar() restaura los
+originales, así que el costo con la instrumentación apagada es nulo. Por
+cada método se registran llamadas, errores, un histograma de latencia y la
+distribución del número de líneas del carrito tras la llamada.
+
+Los métodos que se implementan sobre otros también instrumentados se
+registran ambos: agregar_productos incluye el tiempo de aplicar_operaciones.
+"""
+import contextvars
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from .carrito import Carrito
+
+METODOS = (
+    "agregar_producto",
+    "remover_producto",
+    "actualizar_cantidad",
+    "agregar_productos",
+    "aplicar_operaciones",
+    "fusionar",
+    "diferencia",
+    "snapshot",
+    "restaurar",
+    "vaciar",
+    "calcular_total",
+    "contar_items",
+    "aplicar_descuento",
+    "aplicar_descuento_condicional",
+    "calcular_impuestos",
+    "aplicar_cupon",
+    "obtener_items",
+    "obtener_items_ordenados",
+    "top_k",
+    "to_bytes",
+)
+
+# Límites superiores (inclusive) de los buckets; el último bucket es +Inf
+LIMITES_LATENCIA = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 1e-1)
+LIMITES_TAMANO = (0, 1, 5, 10, 50, 100, 500, 1_000, 10_000, 100_000)
+
+
+class Metricas:
+    """
+    Acumulador de métricas por método. Es seguro usarlo desde varios hilos.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # método -> [llamadas, errores, segundos, suma de líneas, buckets de latencia, buckets de tamaño]
+        self._datos = {}
+
+    def registrar(self, metodo, segundos, tamano, error=False):
+        latencia = bisect_left(LIMITES_LATENCIA, segundos)
+        lineas = bisect_left(LIMITES_TAMANO, tamano)
+        with self._lock:
+            datos = self._datos.get(metodo)
+            if datos is None:
+                datos = self._datos[metodo] = [
+                    0, 0, 0.0, 0, [0] * (len(LIMITES_LATENCIA) + 1), [0] * (len(LIMITES_TAMANO) + 1)
+                ]
+            datos[0] += 1
+            datos[1] += error
+            datos[2] += segundos
+            datos[3] += tamano
+            datos[4][latencia] += 1
+            datos[5][lineas] += 1
+
+    def reiniciar(self):
+        with self._lock:
+            self._datos.clear()
+
+    def instantanea(self):
+        """
+        Retorna un dict método -> {"llamadas", "errores", "segundos",
+        "lineas", "latencia", "tamano"}. segundos y lineas son sumas sobre
+        todas las llamadas; latencia y tamano mapean el límite superior de
+        cada bucket (float("inf") el último) a su conteo, sin acumular.
+        """
+        with self._lock:
+            datos = {m: (d[0], d[1], d[2], d[3], list(d[4]), list(d[5])) for m, d in self._datos.items()}
+        return {
+            metodo: {
+                "llamadas": llamadas,
+                "errores": errores,
+                "segundos": segundos,
+                "lineas": lineas,
+                "latencia": dict(zip(LIMITES_LATENCIA + (float("inf"),), latencia)),
+                "tamano": dict(zip(LIMITES_TAMANO + (float("inf"),), tamano)),
+            }
+            for metodo, (llamadas, errores, segundos, lineas, latencia, tamano) in datos.items()
+        }
+
+    def exportar_prometheus(self, prefijo="carrito"):
+        """
+        Retorna las métricas en el formato de texto de Prometheus.
+        """
+        instantanea = self.instantanea()
+        lineas = [
+            f"# HELP {prefijo}_llamadas_total Llamadas a métodos de Carrito.",
+            f"# TYPE {prefijo}_llamadas_total counter",
+        ]
+        lineas += [f'{prefijo}_llamadas_total{{metodo="{m}"}} {d["llamadas"]}' for m, d in instantanea.items()]
+        lineas += [
+            f"# HELP {prefijo}_errores_total Llamadas que terminaron con una excepción.",
+            f"# TYPE {prefijo}_errores_total counter",
+        ]
+        lineas += [f'{prefijo}_errores_total{{metodo="{m}"}} {d["errores"]}' for m, d in instantanea.items()]
+        lineas += _histograma(
+            f"{prefijo}_latencia_segundos", "Latencia de los métodos de Carrito.",
+            instantanea, "latencia", "segundos",
+        )
+        lineas += _histograma(
+            f"{prefijo}_lineas", "Número de líneas del carrito tras la llamada.",
+            instantanea, "tamano", "lineas",
+        )
+        return "\n".join(lineas) + "\n"
+
+
+def _histograma(nombre, ayuda, instantanea, campo, suma):
+    lineas = [f"# HELP {nombre} {ayuda}", f"# TYPE {nombre} histogram"]
+    for metodo, datos in instantanea.items():
+        acumulado = 0
+        for limite, conteo in datos[campo].items():
+            acumulado += conteo
+            le = "+Inf" if limite == float("inf") else repr(limite)
+            lineas.append(f'{nombre}_bucket{{metodo="{metodo}",le="{le}"}} {acumulado}')
+        lineas.append(f'{nombre}_sum{{metodo="{metodo}"}} {datos[suma]}')
+        lineas.append(f'{nombre}_count{{metodo="{metodo}"}} {acumulado}')
+    return lineas
+
+
+_global = Metricas()
+_perfil = contextvars.ContextVar("perfil_carrito", default=None)
+_originales = {}
+_activaciones = 0
+_lock_activacion = threading.Lock()
+
+
+def _medir(metodo, original):
+    @functools.wraps(original)
+    def medido(self, *args, **kwargs):
+        inicio = time.perf_counter()
+        error = True
+        try:
+            resultado = original(self, *args, **kwargs)
+            error = False
+            return resultado
+        finally:
+            segundos = time.perf_counter() - inicio
+            tamano = len(self._items)
+            _global.registrar(metodo, segundos, tamano, error)
+            perfil = _perfil.get()
+            if perfil is not None:
+                perfil.registrar(metodo, segundos, tamano, error)
+    return medido
+
+
+def activar():
+    """
+    Instrumenta los métodos de Carrito. Las activaciones se cuentan: la
+    instrumentación sigue activa hasta el mismo número de desactivar().
+    """
+    global _activaciones
+    with _lock_activacion:
+        _activaciones += 1
+        if _activaciones == 1:
+            for metodo in METODOS:
+                original = Carrito.__dict__[metodo]
+                _originales[metodo] = original
+                setattr(Carrito, metodo, _medir(metodo, original))
+
+
+def desactivar():
+    """
+    Deshace una activación; al deshacer la última se restauran los métodos originales.
+    """
+    global _activaciones
+    with _lock_activacion:
+        if _activaciones == 0:
+            return
+        _activaciones -= 1
+        if _activaciones == 0:
+            for metodo, original in _originales.items():
+                setattr(Carrito, metodo, original)
+            _originales.clear()
+
+
+def activa():
+    return _activaciones > 0
+
+
+def instantanea():
+    """
+    Retorna las métricas globales como dict (ver Metricas.instantanea).
+    """
+    return _global.instantanea()
+
+
+def exportar_prometheus(prefijo="carrito"):
+    """
+    Retorna las métricas globales en el formato de texto de Prometheus.
+    """
+    return _global.exportar_prometheus(prefijo)
+
+
+def reiniciar():
+    """
+    Descarta las métricas globales acumuladas.
+    """
+    _global.reiniciar()
+
+
+@contextmanager
+def perfilar():
+    """
+    Perfila las operaciones de carrito hechas dentro del bloque en el
+    contexto actual (hilo o tarea asyncio). Activa la instrumentación
+    mientras dura el bloque y entrega las Metricas de ese bloque; las
+    operaciones también se suman a las métricas globales.
+    """
+    perfil = Metricas()
+    activar()
+    token = _perfil.set(perfil)
+    try:
+        yield perfil
+    finally:
+        _perfil.reset(token)
+        desactivar()
@@ -0,0 +1,165 @@
+# src/inventario.py
+import threading
+import time
+
+
+class Inventario:
+    """
+    Stock compartido entre carritos. Cada carrito reserva las unidades que
+    agrega y las libera al removerlas, de modo que la suma de lo reservado
+    nunca supera el stock.
+
+    Las operaciones sobre un producto se protegen con uno de `franjas`
+    candados, elegido por el nombre del producto, así los carritos que usan
+    productos distintos casi nunca compiten por el mismo candado.
+    """
+
+    def __init__(self, franjas=64, ttl=None, reloj=time.monotonic):
+        """
+        Args:
+            franjas (int): Número de candados entre los que se reparten los productos.
+            ttl (float): Segundos que dura una reserva sin renovarse; None para no expirar.
+            reloj (callable): Fuente de tiempo, reemplazable en pruebas.
+        """
+        self._candados = [threading.Lock() for _ in range(franjas)]
+        self._ttl = ttl
+        self._reloj = reloj
+        self._stock = {}  # nombre -> unidades totales
+        self._reservado = {}  # nombre -> unidades reservadas
+        self._reservas = {}  # nombre -> {titular: [cantidad, expira]}
+
+    def _candado(self, nombre):
+        return self._candados[hash(nombre) % len(self._candados)]
+
+    def registrar(self, producto, stock=None):
+        """
+        Registra (o repone) el stock de un producto. Por defecto usa producto.stock.
+
+        Raises:
+            ValueError: Si el nuevo stock es menor que lo ya reservado.
+        """
+        stock = producto.stock if stock is None else stock
+        with self._candado(producto.nombre):
+            if stock < self._reservado.get(producto.nombre, 0):
+                raise ValueError("El stock no puede ser menor que lo reservado")
+            self._stock[producto.nombre] = stock
+            self._reservado.setdefault(producto.nombre, 0)
+            self._reservas.setdefault(producto.nombre, {})
+
+    def disponible(self, producto):
+        """
+        Retorna las unidades del producto que aún no están reservadas.
+        """
+        with self._candado(producto.nombre):
+            self._registrar_si_falta(producto)
+            return self._stock[producto.nombre] - self._reservado[producto.nombre]
+
+    def reservado(self, producto, titular=None):
+        """
+        Retorna las unidades reservadas del producto, en total o por un titular.
+        """
+        with self._candado(producto.nombre):
+            if titular is None:
+                return self._reservado.get(producto.nombre, 0)
+            reserva = self._reservas.get(producto.nombre, {}).get(titular)
+            return reserva[0] if reserva else 0
+
+    def reservar(self, producto, cantidad, titular, ttl=None):
+        """
+        Reserva unidades del producto para un titular (normalmente un carrito)
+        y renueva el vencimiento de su reserva.
+
+        Raises:
+            ValueError: Si no hay suficientes unidades disponibles.
+        """
+        nombre = producto.nombre
+        with self._candado(nombre):
+            self._registrar_si_falta(producto)
+            if self._reservado[nombre] + cantidad > self._stock[nombre]:
+                raise ValueError("Cantidad a agregar excede el stock disponible")
+            reservas = self._reservas[nombre]
+            reserva = reservas.get(titular)
+            if reserva is None:
+                reserva = reservas[titular] = [0, None]
+            reserva[0] += cantidad
+            reserva[1] = self._vencimiento(ttl)
+            self._reservado[nombre] += cantidad
+
+    def liberar(self, producto, cantidad, titular):
+        """
+        Libera unidades reservadas por el titular. Si la reserva ya expiró, solo
+        se libera lo que quede de ella.
+
+        Returns:
+            int: Unidades efectivamente liberadas.
+        """
+        nombre = producto.nombre
+        with self._candado(nombre):
+            reservas = self._reservas.get(nombre)
+            reserva = reservas.get(titular) if reservas else None
+            if reserva is None:
+                return 0
+            liberadas = min(cantidad, reserva[0])
+            reserva[0] -= liberadas
+            if reserva[0] == 0:
+                del reservas[titular]
+            self._reservado[nombre] -= liberadas
+            return liberadas
+
+    def confirmar(self, producto, cantidad, titular):
+        """
+        Convierte una reserva en venta: descuenta las unidades del stock.
+
+        Raises:
+            ValueError: Si el titular no tiene reservada esa cantidad.
+        """
+        nombre = producto.nombre
+        with self._candado(nombre):
+            reserva = self._reservas.get(nombre, {}).get(titular)
+            if reserva is None or reserva[0] < cantidad:
+                raise ValueError("La cantidad a confirmar no está reservada")
+            reserva[0] -= cantidad
+            if reserva[0] == 0:
+                del self._reservas[nombre][titular]
+            self._reservado[nombre] -= cantidad
+            self._stock[nombre] -= cantidad
+
+    def liberar_expiradas(self, ahora=None):
+        """
+        Libera todas las reservas cuyo vencimiento ya pasó y avisa a cada
+        titular que tenga un método _reserva_expirada(nombre, cantidad),
+        como Carrito, para que deje de ofrecer esas unidades: el stock ya
+        está disponible para otros y no debe venderse dos veces. Los avisos
+        se entregan fuera de los candados.
+
+        Returns:
+            int: Unidades liberadas.
+        """
+        ahora = self._reloj() if ahora is None else ahora
+        liberadas = 0
+        avisos = []
+        for nombre in list(self._reservas):
+            with self._candado(nombre):
+                reservas = self._reservas[nombre]
+                vencidas = [t for t, (_, expira) in reservas.items() if expira is not None and expira <= ahora]
+                for titular in vencidas:
+                    cantidad = reservas.pop(titular)[0]
+                    self._reservado[nombre] -= cantidad
+                    liberadas += cantidad
+                    avisos.append((titular, nombre, cantidad))
+        for titular, nombre, cantidad in avisos:
+            aviso = getattr(titular, "_reserva_expirada", None)
+            if aviso is not None:
+                aviso(nombre, cantidad)
+        return liberadas
+
+    def _vencimiento(self, ttl):
+        ttl = self._ttl if ttl is None else ttl
+        return None if ttl is None else self._reloj() + ttl
+
+    def _registrar_si_falta(self, producto):
+        # Se llama con el candado del producto tomado
+        if producto.nombre not in self._stock:
+            self._stock[producto.nombre] = producto.stock
+            self._reservado[producto.nombre] = 0
+            self._reservas[producto.nombre] = {}
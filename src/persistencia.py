@@ -0,0 +1,279 @@
+# src/persistencia.py
+import mmap
+import os
+import struct
+
+from .carrito import ACTUALIZAR, AGREGAR, REMOVER, Carrito, Producto
+
+VACIAR = "vaciar"
+
+_CODIGOS = {AGREGAR: 1, REMOVER: 2, ACTUALIZAR: 3, VACIAR: 4}
+_OPERACIONES = {codigo: tipo for tipo, codigo in _CODIGOS.items()}
+
+# Registro del diario: operación, id de carrito, cantidad, precio, stock y
+# largo del nombre, seguido del nombre en UTF-8
+_REGISTRO = struct.Struct("<BQqdqH")
+
+_MAGIA = b"CRTS"
+_VERSION = 1
+# Instantánea: magia, versión, generación del diario y número de carritos
+_CABECERA = struct.Struct("<4sHQQ")
+_CARRITO = struct.Struct("<QI")
+_LINEA = struct.Struct("<dqqH")
+
+
+class CarritoPersistente(Carrito):
+    """
+    Carrito que registra cada modificación en un DiarioCarritos.
+    """
+    __slots__ = ("_diario", "carrito_id")
+
+    def __init__(self, diario, carrito_id, inventario=None):
+        super().__init__(inventario)
+        self._diario = diario
+        self.carrito_id = carrito_id
+        diario._carritos[carrito_id] = self
+
+    def agregar_producto(self, producto, cantidad=1):
+        super().agregar_producto(producto, cantidad)
+        self._diario.registrar(AGREGAR, self.carrito_id, producto, cantidad)
+
+    def remover_producto(self, producto, cantidad=1):
+        super().remover_producto(producto, cantidad)
+        self._diario.registrar(REMOVER, self.carrito_id, producto, cantidad)
+
+    def actualizar_cantidad(self, producto, nueva_cantidad):
+        super().actualizar_cantidad(producto, nueva_cantidad)
+        self._diario.registrar(ACTUALIZAR, self.carrito_id, producto, nueva_cantidad)
+
+    def aplicar_operaciones(self, operaciones):
+        operaciones = list(operaciones)
+        super().aplicar_operaciones(operaciones)
+        for tipo, producto, cantidad in operaciones:
+            self._diario.registrar(tipo, self.carrito_id, producto, cantidad)
+
+    def vaciar(self):
+        resultado = super().vaciar()
+        self._diario.registrar(VACIAR, self.carrito_id)
+        return resultado
+
+
+class DiarioCarritos:
+    """
+    Persistencia de carritos en un directorio local mediante un diario de
+    solo anexado más instantáneas compactadas.
+
+    Cada modificación de un CarritoPersistente agrega un registro binario
+    pequeño al diario. Al compactar se escribe una instantánea con el estado
+    de todos los carritos y se empieza un diario nuevo (una nueva
+    generación), así la recuperación lee la instantánea con mmap y solo
+    reproduce los registros posteriores.
+    """
+
+    def __init__(self, directorio, fsync_cada=64, compactar_cada=None, catalogo=None):
+        """
+        Args:
+            directorio (str): Carpeta donde se guardan diario e instantánea.
+            fsync_cada (int): Registros que se acumulan antes de forzar fsync.
+            compactar_cada (int): Registros tras los cuales se compacta automáticamente; None para no hacerlo.
+            catalogo (Catalogo): Si se indica, los productos se recuperan internados en él.
+        """
+        os.makedirs(directorio, exist_ok=True)
+        self._directorio = directorio
+        self._fsync_cada = fsync_cada
+        self._compactar_cada = compactar_cada
+        self._catalogo = catalogo
+        self._carritos = {}
+        self._pendientes = 0
+        self._registros_generacion = 0
+        self._generacion = self._leer_generacion()
+        self._archivo = open(self._ruta_diario(self._generacion), "ab")
+
+    @property
+    def _ruta_instantanea(self):
+        return os.path.join(self._directorio, "instantanea.bin")
+
+    def _ruta_diario(self, generacion):
+        return os.path.join(self._directorio, f"diario.{generacion}.log")
+
+    def carrito(self, carrito_id, inventario=None):
+        """
+        Retorna el carrito con ese id, creándolo vacío si no existe.
+        """
+        carrito = self._carritos.get(carrito_id)
+        if carrito is None:
+            carrito = CarritoPersistente(self, carrito_id, inventario)
+        return carrito
+
+    def carritos(self):
+        """
+        Retorna el diccionario id -> carrito de los carritos vivos.
+        """
+        return dict(self._carritos)
+
+    def olvidar(self, carrito_id):
+        """
+        Deja de seguir un carrito: se vacía en el diario y no aparece en la próxima instantánea.
+        """
+        carrito = self._carritos.pop(carrito_id, None)
+        if carrito is not None:
+            self.registrar(VACIAR, carrito_id)
+
+    def registrar(self, tipo, carrito_id, producto=None, cantidad=0):
+        """
+        Anexa un registro al diario; fuerza fsync cada `fsync_cada` registros.
+        """
+        if producto is None:
+            nombre, precio, stock = b"", 0.0, 0
+        else:
+            nombre, precio, stock = producto.nombre.encode("utf-8"), producto.precio, producto.stock
+        self._archivo.write(_REGISTRO.pack(_CODIGOS[tipo], carrito_id, cantidad, precio, stock, len(nombre)) + nombre)
+        self._pendientes += 1
+        self._registros_generacion += 1
+        if self._pendientes >= self._fsync_cada:
+            self.sincronizar()
+        if self._compactar_cada and self._registros_generacion >= self._compactar_cada:
+            self.compactar()
+
+    def sincronizar(self):
+        """
+        Vuelca a disco los registros pendientes.
+        """
+        self._archivo.flush()
+        os.fsync(self._archivo.fileno())
+        self._pendientes = 0
+
+    def compactar(self):
+        """
+        Escribe una instantánea con el estado actual de todos los carritos y
+        empieza una nueva generación del diario.
+        """
+        self.sincronizar()
+        generacion = self._generacion + 1
+        temporal = self._ruta_instantanea + ".tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(_CABECERA.pack(_MAGIA, _VERSION, generacion, len(self._carritos)))
+            for carrito_id, carrito in self._carritos.items():
+                items = carrito.obtener_items()
+                archivo.write(_CARRITO.pack(carrito_id, len(items)))
+                for item in items:
+                    producto = item.producto
+                    nombre = producto.nombre.encode("utf-8")
+                    archivo.write(_LINEA.pack(producto.precio, producto.stock, item.cantidad, len(nombre)) + nombre)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, self._ruta_instantanea)
+        # A partir de aquí la instantánea cubre el diario anterior
+        self._archivo.close()
+        anterior = self._ruta_diario(self._generacion)
+        self._generacion = generacion
+        self._registros_generacion = 0
+        self._archivo = open(self._ruta_diario(generacion), "ab")
+        os.remove(anterior)
+
+    def recuperar(self, inventario=None):
+        """
+        Reconstruye los carritos desde la instantánea y el diario de su generación.
+
+        Returns:
+            dict: id -> CarritoPersistente.
+        """
+        estado = {}
+        productos = {}
+        self._leer_instantanea(estado, productos)
+        self._reproducir_diario(estado, productos)
+        self._carritos = {}
+        for carrito_id, lineas in estado.items():
+            if not lineas:
+                continue
+            carrito = CarritoPersistente(self, carrito_id, inventario)
+            for nombre, cantidad in lineas.items():
+                carrito._insertar_item(productos[nombre], cantidad)
+            if inventario is not None:
+                for nombre, cantidad in lineas.items():
+                    inventario.reservar(productos[nombre], cantidad, carrito)
+        return self.carritos()
+
+    def cerrar(self):
+        self.sincronizar()
+        self._archivo.close()
+
+    def _producto(self, productos, nombre, precio, stock):
+        # Los registros se leen del más antiguo al más nuevo: el último
+        # precio y stock registrados son los vigentes
+        producto = productos.get(nombre)
+        if producto is None:
+            if self._catalogo is not None:
+                producto = self._catalogo.internar(nombre, precio, stock)
+            else:
+                producto = Producto(nombre, precio, stock)
+            productos[nombre] = producto
+        if producto.precio != precio:
+            producto.precio = precio
+        producto.stock = stock
+        return producto
+
+    def _leer_generacion(self):
+        if not os.path.exists(self._ruta_instantanea):
+            return 0
+        with open(self._ruta_instantanea, "rb") as archivo:
+            magia, version, generacion, _ = _CABECERA.unpack(archivo.read(_CABECERA.size))
+        if magia != _MAGIA or version != _VERSION:
+            raise ValueError("Instantánea de carritos no válida")
+        return generacion
+
+    def _leer_instantanea(self, estado, productos):
+        if not os.path.exists(self._ruta_instantanea) or os.path.getsize(self._ruta_instantanea) == 0:
+            return
+        with open(self._ruta_instantanea, "rb") as archivo, \
+                mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+            _, _, _, n_carritos = _CABECERA.unpack_from(datos, 0)
+            posicion = _CABECERA.size
+            for _ in range(n_carritos):
+                carrito_id, n_lineas = _CARRITO.unpack_from(datos, posicion)
+                posicion += _CARRITO.size
+                lineas = estado[carrito_id] = {}
+                for _ in range(n_lineas):
+                    precio, stock, cantidad, largo = _LINEA.unpack_from(datos, posicion)
+                    posicion += _LINEA.size
+                    nombre = datos[posicion:posicion + largo].decode("utf-8")
+                    posicion += largo
+                    self._producto(productos, nombre, precio, stock)
+                    lineas[nombre] = cantidad
+
+    def _reproducir_diario(self, estado, productos):
+        self._archivo.flush()
+        ruta = self._ruta_diario(self._generacion)
+        if os.path.getsize(ruta) == 0:
+            return
+        with open(ruta, "rb") as archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+            valido = self._reproducir_registros(datos, estado, productos)
+            fin = len(datos)
+        if valido < fin:
+            # Descarta el registro truncado para que los nuevos queden alineados
+            self._archivo.truncate(valido)
+
+    def _reproducir_registros(self, datos, estado, productos):
+        posicion, fin = 0, len(datos)
+        while posicion + _REGISTRO.size <= fin:
+            codigo, carrito_id, cantidad, precio, stock, largo = _REGISTRO.unpack_from(datos, posicion)
+            inicio = posicion + _REGISTRO.size
+            if inicio + largo > fin:
+                break  # registro truncado por una caída a mitad de escritura
+            posicion = inicio + largo
+            tipo = _OPERACIONES[codigo]
+            lineas = estado.setdefault(carrito_id, {})
+            if tipo == VACIAR:
+                lineas.clear()
+                continue
+            nombre = datos[inicio:posicion].decode("utf-8")
+            self._producto(productos, nombre, precio, stock)
+            if tipo == AGREGAR:
+                lineas[nombre] = lineas.get(nombre, 0) + cantidad
+            elif tipo == REMOVER:
+                lineas[nombre] = lineas.get(nombre, 0) - cantidad
+            else:
+                lineas[nombre] = cantidad
+            if lineas[nombre] == 0:
+                del lineas[nombre]
+        return posicion
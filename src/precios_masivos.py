@@ -0,0 +1,129 @@
+# src/precios_masivos.py
+import os
+from collections import deque, namedtuple
+from itertools import islice
+from multiprocessing import Pool
+
+import numpy as np
+
+EspecificacionPrecio = namedtuple(
+    "EspecificacionPrecio",
+    ["descuento", "cupon_porcentaje", "cupon_maximo", "impuesto"],
+    defaults=[0, 0, 0, 0],
+)
+
+ResultadoPrecio = namedtuple(
+    "ResultadoPrecio",
+    ["total", "total_descuento", "total_cupon", "impuestos", "total_final"],
+)
+
+
+def validar_especificacion(especificacion):
+    """
+    Verifica que la especificación use porcentajes entre 0 y 100 y un tope de cupón no negativo.
+
+    Raises:
+        ValueError: Si algún valor está fuera de rango.
+    """
+    for porcentaje in (especificacion.descuento, especificacion.cupon_porcentaje, especificacion.impuesto):
+        if porcentaje < 0 or porcentaje > 100:
+            raise ValueError("El porcentaje debe estar entre 0 y 100")
+    if especificacion.cupon_maximo < 0:
+        raise ValueError("Los valores de descuento deben ser positivos")
+
+
+def precio_desde_total(total, especificacion):
+    """
+    Aplica descuento, cupón con tope e impuesto, en ese orden y cada uno sobre
+    el resultado del anterior, con la misma aritmética que los métodos de Carrito.
+    """
+    total_descuento = total - total * (especificacion.descuento / 100)
+    descuento_cupon = min(total_descuento * (especificacion.cupon_porcentaje / 100), especificacion.cupon_maximo)
+    total_cupon = total_descuento - descuento_cupon
+    impuestos = total_cupon * (especificacion.impuesto / 100)
+    return ResultadoPrecio(total, total_descuento, total_cupon, impuestos, total_cupon + impuestos)
+
+
+def _preciar_totales(totales, especificacion):
+    """
+    precio_desde_total vectorizado: retorna un arreglo (5, n) con las
+    columnas de ResultadoPrecio para cada total, con la misma aritmética.
+    """
+    total_descuento = totales - totales * (especificacion.descuento / 100)
+    descuento_cupon = np.minimum(total_descuento * (especificacion.cupon_porcentaje / 100), especificacion.cupon_maximo)
+    total_cupon = total_descuento - descuento_cupon
+    impuestos = total_cupon * (especificacion.impuesto / 100)
+    return np.stack((totales, total_descuento, total_cupon, impuestos, total_cupon + impuestos))
+
+
+def _preciar_lote(argumentos):
+    totales, especificacion = argumentos
+    return _preciar_totales(totales, especificacion)
+
+
+def _lotes(carritos, especificacion, tamano_lote):
+    # Solo se lee el total que cada carrito ya mantiene: O(1) por carrito en
+    # el proceso principal, sin recorrer sus líneas
+    carritos = iter(carritos)
+    while True:
+        totales = np.fromiter(
+            (carrito.calcular_total() for carrito in islice(carritos, tamano_lote)), dtype=np.float64
+        )
+        if not len(totales):
+            return
+        yield totales, especificacion
+
+
+def repreciar_carritos(carritos, especificacion, procesos=1, tamano_lote=256):
+    """
+    Calcula el precio de muchos carritos en lotes vectorizados.
+
+    De cada carrito solo se toma su total (O(1) en Carrito, un producto
+    escalar sobre sus arreglos en CarritoColumnar), siempre en el proceso
+    actual. Los totales se agrupan en lotes como arreglos de NumPy, se
+    precian de forma vectorizada y los resultados se devuelven en el mismo
+    orden de entrada a medida que están listos, por lo que la entrada puede
+    ser un generador de tamaño arbitrario.
+
+    Preciar un lote son unas pocas operaciones vectorizadas, así que
+    repartirlos en un pool de procesos no acelera: solo agrega el costo de
+    enviar lotes y resultados entre procesos. Por eso el valor por defecto
+    es 1; ver benchmarks/bench_precios_masivos.py.
+
+    Args:
+        carritos (iterable): Carritos (Carrito o CarritoColumnar).
+        especificacion (EspecificacionPrecio): Descuento, cupón y tope, impuesto.
+        procesos (int): Número de procesos; 1 calcula en el proceso actual y
+            None usa todos los núcleos.
+        tamano_lote (int): Carritos por tarea enviada a cada proceso.
+
+    Returns:
+        iterator: Un ResultadoPrecio por carrito, en orden.
+
+    Raises:
+        ValueError: Si la especificación no es válida.
+    """
+    validar_especificacion(especificacion)
+    procesos = procesos or os.cpu_count() or 1
+    return _repreciar(_lotes(carritos, especificacion, tamano_lote), procesos)
+
+
+def _repreciar(lotes, procesos):
+    if procesos == 1:
+        for lote in lotes:
+            yield from _resultados(_preciar_lote(lote))
+        return
+    # Ventana acotada de tareas en vuelo: la entrada se serializa a medida que
+    # los procesos avanzan en lugar de encolarse completa (como haría imap)
+    with Pool(procesos) as pool:
+        pendientes = deque()
+        for lote in lotes:
+            pendientes.append(pool.apply_async(_preciar_lote, (lote,)))
+            if len(pendientes) >= 2 * procesos:
+                yield from _resultados(pendientes.popleft().get())
+        while pendientes:
+            yield from _resultados(pendientes.popleft().get())
+
+
+def _resultados(columnas):
+    return map(ResultadoPrecio._make, columnas.T.tolist())
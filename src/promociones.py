@@ -0,0 +1,108 @@
+# src/promociones.py
+"""
+Reglas de precio declarativas que se compilan una vez en un callable.
+
+    precio = compilar([
+        DescuentoProducto("Mouse", 10),
+        DescuentoCondicional(15, minimo=500),
+        Cupon(20, maximo=50),
+        Impuesto(18),
+    ])
+    cotizacion = precio(carrito)
+
+Las reglas por producto se aplican en una única pasada sobre los items; si
+no hay ninguna, se parte del total ya mantenido por el carrito sin recorrerlo.
+Las reglas sobre el total se aplican después, en el orden declarado. El
+resultado se memoriza por carrito junto con su versión, así volver a cotizar
+un carrito que no cambió no cuesta nada.
+"""
+import weakref
+from collections import namedtuple
+
+DescuentoProducto = namedtuple("DescuentoProducto", ["nombre", "porcentaje"])
+DescuentoCondicional = namedtuple("DescuentoCondicional", ["porcentaje", "minimo"], defaults=[0])
+Cupon = namedtuple("Cupon", ["porcentaje", "maximo"])
+Impuesto = namedtuple("Impuesto", ["porcentaje"])
+
+Cotizacion = namedtuple("Cotizacion", ["subtotal", "descuento", "impuestos", "total"])
+
+
+def _validar_porcentaje(porcentaje):
+    if porcentaje < 0 or porcentaje > 100:
+        raise ValueError("El porcentaje debe estar entre 0 y 100")
+
+
+def _etapa(regla):
+    """
+    Convierte una regla sobre el total en una función (monto, impuestos) -> (monto, impuestos).
+    """
+    if isinstance(regla, DescuentoCondicional):
+        _validar_porcentaje(regla.porcentaje)
+        factor, minimo = 1 - regla.porcentaje / 100, regla.minimo
+        return lambda monto, impuestos: (monto * factor if monto >= minimo else monto, impuestos)
+    if isinstance(regla, Cupon):
+        if regla.porcentaje < 0 or regla.maximo < 0 or regla.porcentaje > 100:
+            raise ValueError("Los valores de descuento deben ser positivos")
+        tasa, maximo = regla.porcentaje / 100, regla.maximo
+        return lambda monto, impuestos: (monto - min(monto * tasa, maximo), impuestos)
+    if isinstance(regla, Impuesto):
+        _validar_porcentaje(regla.porcentaje)
+        tasa = regla.porcentaje / 100
+        return lambda monto, impuestos: (monto, impuestos + monto * tasa)
+    raise ValueError(f"Regla de precio no válida: {regla!r}")
+
+
+class PipelinePrecios:
+    """
+    Resultado de compilar(): un callable carrito -> Cotizacion.
+    """
+
+    def __init__(self, reglas):
+        self._factores = {}  # nombre del producto -> factor sobre su línea
+        self._etapas = []
+        for regla in reglas:
+            if isinstance(regla, DescuentoProducto):
+                _validar_porcentaje(regla.porcentaje)
+                self._factores[regla.nombre] = self._factores.get(regla.nombre, 1) * (1 - regla.porcentaje / 100)
+            else:
+                self._etapas.append(_etapa(regla))
+        self._memoria = weakref.WeakKeyDictionary()
+
+    def __call__(self, carrito):
+        version = getattr(carrito, "version", None)
+        if version is not None:
+            memorizado = self._memoria.get(carrito)
+            if memorizado is not None and memorizado[0] == version:
+                return memorizado[1]
+        cotizacion = self._evaluar(carrito)
+        if version is not None:
+            self._memoria[carrito] = (version, cotizacion)
+        return cotizacion
+
+    def _evaluar(self, carrito):
+        subtotal = carrito.calcular_total()
+        monto = subtotal
+        if self._factores:
+            factores = self._factores
+            # Única pasada: solo ajusta las líneas con regla propia
+            for item in carrito.obtener_items():
+                factor = factores.get(item.producto.nombre)
+                if factor is not None:
+                    monto -= item.total() * (1 - factor)
+        impuestos = 0
+        for etapa in self._etapas:
+            monto, impuestos = etapa(monto, impuestos)
+        return Cotizacion(subtotal, subtotal - monto, impuestos, monto + impuestos)
+
+
+def compilar(reglas):
+    """
+    Valida las reglas y las compila en un callable carrito -> Cotizacion.
+
+    Args:
+        reglas (iterable): DescuentoProducto, DescuentoCondicional, Cupon e Impuesto.
+
+    Raises:
+        ValueError: Si alguna regla no es válida.
+    """
+    return PipelinePrecios(reglas)
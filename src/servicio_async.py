@@ -0,0 +1,161 @@
+# src/servicio_async.py
+"""
+Fachada asyncio para atender carritos por id sin bloquear el event loop.
+
+    servicio = ServicioCarritos(umbral_executor=10_000)
+    await servicio.agregar_producto("c1", mouse, 2)
+    resultado = await servicio.cotizar("c1", EspecificacionPrecio(impuesto=18))
+
+Cada carrito tiene su propio asyncio.Lock: las operaciones sobre un mismo
+carrito se ejecutan de a una y en orden de llegada, y las de carritos
+distintos no compiten entre sí. Las cotizaciones concurrentes de un mismo
+carrito, versión y regla de precio se resuelven con un único cálculo que
+todos esperan. El trabajo que recorre el carrito (cotizar con reglas por
+producto, ordenar, serializar) se envía a un executor cuando el carrito
+tiene al menos `umbral_executor` líneas; las operaciones O(1) se hacen en
+el event loop.
+
+Con un executor de hilos el cálculo sigue compitiendo por el GIL, pero el
+intérprete lo interrumpe periódicamente, así que el event loop sigue
+atendiendo otras peticiones mientras tanto.
+"""
+import asyncio
+import functools
+
+from .carrito import Carrito
+from .precios_masivos import EspecificacionPrecio, precio_desde_total, validar_especificacion
+
+
+class ServicioCarritos:
+    """
+    Registro de carritos por id con acceso serializado por carrito.
+    """
+
+    def __init__(self, fabrica=Carrito, umbral_executor=10_000, executor=None):
+        """
+        Args:
+            fabrica (callable): Crea un carrito vacío cuando se usa un id nuevo.
+            umbral_executor (int): Líneas a partir de las cuales el trabajo
+                que recorre el carrito se hace en el executor; None para nunca.
+            executor (concurrent.futures.Executor): Executor a usar; None usa
+                el executor por defecto del event loop.
+        """
+        self._fabrica = fabrica
+        self._umbral = umbral_executor
+        self._executor = executor
+        self._carritos = {}
+        self._candados = {}
+        # (id, versión, regla) -> Task del cálculo en curso
+        self._en_curso = {}
+
+    def carrito(self, carrito_id):
+        """
+        Retorna el carrito con ese id, creándolo si no existe. Modificarlo
+        directamente salta la serialización del servicio.
+        """
+        carrito = self._carritos.get(carrito_id)
+        if carrito is None:
+            carrito = self._carritos[carrito_id] = self._fabrica()
+            self._candados[carrito_id] = asyncio.Lock()
+        return carrito
+
+    def __contains__(self, carrito_id):
+        return carrito_id in self._carritos
+
+    def __len__(self):
+        return len(self._carritos)
+
+    async def eliminar(self, carrito_id):
+        """
+        Vacía el carrito y lo quita del servicio, esperando las operaciones en curso.
+        """
+        while carrito_id in self._carritos:
+            candado = self._candados[carrito_id]
+            async with candado:
+                if self._candados.get(carrito_id) is not candado:
+                    continue
+                carrito = self._carritos.pop(carrito_id)
+                del self._candados[carrito_id]
+                carrito.vaciar()
+                return
+
+    async def _serializado(self, carrito_id, metodo, *args, recorre=False):
+        """
+        Ejecuta metodo (nombre de un método del carrito, o un callable que
+        recibe el carrito) con el candado del carrito tomado. Si el carrito
+        se elimina mientras la operación espera, se aplica al carrito nuevo.
+        """
+        while True:
+            carrito = self.carrito(carrito_id)
+            async with self._candados[carrito_id]:
+                if self._carritos.get(carrito_id) is not carrito:
+                    # Se eliminó mientras esperaba el candado: se usa el carrito
+                    # nuevo con ese id, igual que una operación posterior
+                    continue
+                if isinstance(metodo, str):
+                    llamada = functools.partial(getattr(carrito, metodo), *args)
+                else:
+                    llamada = functools.partial(metodo, carrito, *args)
+                if recorre and self._umbral is not None and len(carrito) >= self._umbral:
+                    return await asyncio.get_running_loop().run_in_executor(self._executor, llamada)
+                return llamada()
+
+    async def agregar_producto(self, carrito_id, producto, cantidad=1):
+        return await self._serializado(carrito_id, "agregar_producto", producto, cantidad)
+
+    async def remover_producto(self, carrito_id, producto, cantidad=1):
+        return await self._serializado(carrito_id, "remover_producto", producto, cantidad)
+
+    async def actualizar_cantidad(self, carrito_id, producto, nueva_cantidad):
+        return await self._serializado(carrito_id, "actualizar_cantidad", producto, nueva_cantidad)
+
+    async def aplicar_operaciones(self, carrito_id, operaciones):
+        return await self._serializado(carrito_id, "aplicar_operaciones", list(operaciones))
+
+    async def vaciar(self, carrito_id):
+        return await self._serializado(carrito_id, "vaciar", recorre=True)
+
+    async def calcular_total(self, carrito_id):
+        return await self._serializado(carrito_id, "calcular_total")
+
+    async def obtener_items_ordenados(self, carrito_id, criterio, offset=0, limit=None, descendente=False):
+        return await self._serializado(
+            carrito_id, "obtener_items_ordenados", criterio, offset, limit, descendente, recorre=True
+        )
+
+    async def to_bytes(self, carrito_id):
+        return await self._serializado(carrito_id, "to_bytes", recorre=True)
+
+    async def cotizar(self, carrito_id, regla):
+        """
+        Cotiza el carrito. Las peticiones concurrentes con la misma regla
+        sobre la misma versión del carrito comparten un único cálculo, y
+        cancelar una de ellas no cancela el cálculo para las demás.
+
+        Args:
+            regla: EspecificacionPrecio, o un callable carrito -> resultado
+                como el que devuelve promociones.compilar().
+
+        Raises:
+            ValueError: Si la especificación no es válida, o el error del cálculo.
+        """
+        if isinstance(regla, EspecificacionPrecio):
+            validar_especificacion(regla)
+            calcular, recorre = functools.partial(_cotizar_especificacion, regla), False
+        else:
+            calcular, recorre = regla, True
+        version = getattr(self.carrito(carrito_id), "version", None)
+        if version is None:
+            # Sin versión no se puede saber si el carrito cambió: no se comparte
+            return await self._serializado(carrito_id, calcular, recorre=recorre)
+        clave = (carrito_id, version, regla)
+        tarea = self._en_curso.get(clave)
+        if tarea is None:
+            tarea = asyncio.ensure_future(self._serializado(carrito_id, calcular, recorre=recorre))
+            self._en_curso[clave] = tarea
+            tarea.add_done_callback(lambda _: self._en_curso.pop(clave, None))
+        return await asyncio.shield(tarea)
+
+
+def _cotizar_especificacion(especificacion, carrito):
+    return precio_desde_total(carrito.calcular_total(), especificacion)
@@ -0,0 +1,193 @@
+# src/stock_compartido.py
+"""
+Stock compartido entre procesos sobre multiprocessing.shared_memory.
+
+    stock = StockCompartido(capacidad=100_000)       # proceso principal
+    Process(target=trabajador, args=(stock,)).start()
+
+    def trabajador(stock):                           # cada proceso
+        carrito = Carrito(inventario=stock, catalogo=catalogo)
+        carrito.agregar_producto(producto_id, 2)
+
+Cada producto ocupa una fila fija de dos contadores int64 (stock total y
+unidades reservadas) en un bloque de memoria compartida; la fila es el id
+del producto en su Catalogo, así que todos los procesos deben construir el
+catálogo de la misma manera. Las modificaciones de una fila se protegen con
+uno de `franjas` candados de multiprocessing elegido por el id.
+
+Ofrece la misma interfaz que Inventario para los carritos (reservar,
+liberar, disponible), sin vencimiento de reservas. Lo reservado por cada
+titular se lleva en el proceso que lo reservó.
+"""
+import multiprocessing
+from multiprocessing import shared_memory
+
+_CAMPOS = 2  # stock, reservado
+_SIN_REGISTRAR = -1
+
+
+class StockCompartido:
+    """
+    Tabla de stock de ancho fijo en memoria compartida. Se puede pasar como
+    argumento a un Process; el proceso que la creó debe llamar a destruir().
+    """
+
+    def __init__(self, capacidad, franjas=64, contexto=None):
+        """
+        Args:
+            capacidad (int): Número de filas; los ids de producto deben ser menores.
+            franjas (int): Número de candados entre los que se reparten las filas.
+            contexto: Contexto de multiprocessing para crear los candados.
+        """
+        if capacidad <= 0 or franjas <= 0:
+            raise ValueError("La capacidad y las franjas deben ser positivas")
+        contexto = contexto or multiprocessing
+        self._memoria = shared_memory.SharedMemory(create=True, size=capacidad * _CAMPOS * 8)
+        self._capacidad = capacidad
+        self._candados = [contexto.Lock() for _ in range(franjas)]
+        self._propietario = True
+        # Filas sin registrar: stock -1 y nada reservado
+        self._memoria.buf[:capacidad * _CAMPOS * 8] = (b"\xff" * 8 + bytes(8)) * capacidad
+        self._abrir()
+
+    def _abrir(self):
+        self._filas = self._memoria.buf.cast("q")
+        self._reservas = {}  # (fila, titular) -> unidades reservadas en este proceso
+
+    def __getstate__(self):
+        return {"nombre": self._memoria.name, "capacidad": self._capacidad, "candados": self._candados}
+
+    def __setstate__(self, estado):
+        self._memoria = shared_memory.SharedMemory(name=estado["nombre"])
+        self._capacidad = estado["capacidad"]
+        self._candados = estado["candados"]
+        self._propietario = False
+        self._abrir()
+
+    def _fila(self, producto):
+        fila = producto.id
+        if fila is None:
+            raise ValueError("El producto debe pertenecer a un catálogo")
+        if not 0 <= fila < self._capacidad:
+            raise ValueError("El id del producto excede la capacidad del stock compartido")
+        return fila
+
+    def _candado(self, fila):
+        return self._candados[fila % len(self._candados)]
+
+    def _registrar_si_falta(self, producto, fila):
+        # Se llama con el candado de la fila tomado
+        if self._filas[fila * _CAMPOS] == _SIN_REGISTRAR:
+            self._filas[fila * _CAMPOS] = producto.stock
+
+    def registrar(self, producto, stock=None):
+        """
+        Registra (o repone) el stock de un producto. Por defecto usa producto.stock.
+
+        Raises:
+            ValueError: Si el nuevo stock es menor que lo ya reservado.
+        """
+        stock = producto.stock if stock is None else stock
+        fila = self._fila(producto)
+        with self._candado(fila):
+            if stock < self._filas[fila * _CAMPOS + 1]:
+                raise ValueError("El stock no puede ser menor que lo reservado")
+            self._filas[fila * _CAMPOS] = stock
+
+    def disponible(self, producto):
+        """
+        Retorna las unidades del producto que aún no están reservadas.
+        """
+        fila = self._fila(producto)
+        with self._candado(fila):
+            self._registrar_si_falta(producto, fila)
+            return self._filas[fila * _CAMPOS] - self._filas[fila * _CAMPOS + 1]
+
+    def reservado(self, producto, titular=None):
+        """
+        Retorna las unidades reservadas del producto, en total o por un
+        titular de este proceso.
+        """
+        fila = self._fila(producto)
+        if titular is not None:
+            return self._reservas.get((fila, titular), 0)
+        with self._candado(fila):
+            return self._filas[fila * _CAMPOS + 1]
+
+    def reservar(self, producto, cantidad, titular):
+        """
+        Reserva unidades del producto para un titular (normalmente un carrito).
+
+        Raises:
+            ValueError: Si no hay suficientes unidades disponibles.
+        """
+        fila = self._fila(producto)
+        with self._candado(fila):
+            self._registrar_si_falta(producto, fila)
+            reservado = self._filas[fila * _CAMPOS + 1] + cantidad
+            if reservado > self._filas[fila * _CAMPOS]:
+                raise ValueError("Cantidad a agregar excede el stock disponible")
+            self._filas[fila * _CAMPOS + 1] = reservado
+        clave = (fila, titular)
+        self._reservas[clave] = self._reservas.get(clave, 0) + cantidad
+
+    def liberar(self, producto, cantidad, titular):
+        """
+        Libera unidades reservadas por el titular.
+
+        Returns:
+            int: Unidades efectivamente liberadas.
+        """
+        fila = self._fila(producto)
+        clave = (fila, titular)
+        liberadas = min(cantidad, self._reservas.get(clave, 0))
+        if liberadas == 0:
+            return 0
+        self._descontar_reserva(clave, liberadas)
+        with self._candado(fila):
+            self._filas[fila * _CAMPOS + 1] -= liberadas
+        return liberadas
+
+    def confirmar(self, producto, cantidad, titular):
+        """
+        Convierte una reserva en venta: descuenta las unidades del stock.
+
+        Raises:
+            ValueError: Si el titular no tiene reservada esa cantidad.
+        """
+        fila = self._fila(producto)
+        clave = (fila, titular)
+        if self._reservas.get(clave, 0) < cantidad:
+            raise ValueError("La cantidad a confirmar no está reservada")
+        self._descontar_reserva(clave, cantidad)
+        with self._candado(fila):
+            self._filas[fila * _CAMPOS + 1] -= cantidad
+            self._filas[fila * _CAMPOS] -= cantidad
+
+    def _descontar_reserva(self, clave, cantidad):
+        restante = self._reservas[clave] - cantidad
+        if restante:
+            self._reservas[clave] = restante
+        else:
+            del self._reservas[clave]
+
+    def cerrar(self):
+        """
+        Desconecta este proceso de la memoria compartida.
+        """
+        self._filas.release()
+        self._memoria.close()
+
+    def destruir(self):
+        """
+        Cierra y elimina la memoria compartida; solo en el proceso que la creó.
+        """
+        self.cerrar()
+        if self._propietario:
+            self._memoria.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excinfo):
+        self.destruir()
@@ -0,0 +1,172 @@
+# tests/test_cache_cotizaciones.py
+import pytest
+from src.cache_cotizaciones import CacheCotizaciones
+from src.carrito import Carrito, Producto
+from src.carrito_columnar import CarritoColumnar
+from src.precios_masivos import EspecificacionPrecio, precio_desde_total
+from src.promociones import DescuentoProducto, Impuesto, compilar
+
+ESPECIFICACION = EspecificacionPrecio(descuento=10, cupon_porcentaje=20, cupon_maximo=50, impuesto=18)
+
+@pytest.fixture
+def productos():
+    return Producto("Laptop", 1000.00, stock=10), Producto("Mouse", 50.00, stock=10)
+
+def _carrito(*lineas):
+    carrito = Carrito()
+    carrito.agregar_productos(lineas)
+    return carrito
+
+def test_carritos_iguales_comparten_la_entrada(productos):
+    """
+    AAA:
+    Arrange: Se crean dos carritos con el mismo contenido agregado en distinto orden.
+    Act: Se cotizan ambos con la misma especificación.
+    Assert: Se verifica que el segundo es un acierto y el resultado coincide con precio_desde_total.
+    """
+    # Arrange
+    laptop, mouse = productos
+    cache = CacheCotizaciones()
+    a = _carrito((laptop, 1), (mouse, 2))
+    b = _carrito((mouse, 2), (laptop, 1))
+
+    # Act
+    primero = cache.cotizar(a, ESPECIFICACION)
+    segundo = cache.cotizar(b, ESPECIFICACION)
+
+    # Assert
+    assert segundo is primero
+    assert primero == precio_desde_total(1100.00, ESPECIFICACION)
+    assert cache.huella(a) == cache.huella(b)
+    estadisticas = cache.estadisticas()
+    assert (estadisticas.aciertos, estadisticas.fallos, estadisticas.tamano) == (1, 1, 1)
+
+def test_cambios_de_contenido_o_parametros_no_reusan(productos):
+    """
+    AAA:
+    Arrange: Se crea un carrito y se cotiza.
+    Act: Se cotiza con otra especificación, y luego tras cambiar una cantidad y un precio.
+    Assert: Se verifica que cada variante es un fallo con su propio resultado.
+    """
+    # Arrange
+    laptop, mouse = productos
+    cache = CacheCotizaciones()
+    carrito = _carrito((laptop, 1))
+    cache.cotizar(carrito, ESPECIFICACION)
+
+    # Act
+    sin_impuesto = cache.cotizar(carrito, ESPECIFICACION._replace(impuesto=0))
+    carrito.agregar_producto(mouse, 1)
+    con_mouse = cache.cotizar(carrito, ESPECIFICACION)
+    laptop.precio = 900.00
+    rebajado = cache.cotizar(carrito, ESPECIFICACION)
+
+    # Assert
+    assert sin_impuesto.impuestos == 0
+    assert con_mouse.total == 1050.00
+    assert rebajado.total == 950.00
+    assert cache.estadisticas().fallos == 4
+
+def test_lru_ttl_e_invalidacion(productos):
+    """
+    AAA:
+    Arrange: Se crea una caché de 2 entradas con ttl de 10 segundos y un reloj controlado.
+    Act: Se cotizan tres carritos distintos, se avanza el reloj y se invalida un producto.
+    Assert: Se verifica el desalojo LRU, la expiración y la invalidación por producto.
+    """
+    # Arrange
+    laptop, mouse = productos
+    ahora = [0.0]
+    cache = CacheCotizaciones(maximo=2, ttl=10, reloj=lambda: ahora[0])
+    a, b, c = _carrito((laptop, 1)), _carrito((mouse, 1)), _carrito((laptop, 1), (mouse, 1))
+
+    # Act
+    cache.cotizar(a, ESPECIFICACION)
+    cache.cotizar(b, ESPECIFICACION)
+    cache.cotizar(a, ESPECIFICACION)  # a pasa a ser la más reciente
+    cache.cotizar(c, ESPECIFICACION)  # desaloja b
+    desalojados = cache.estadisticas().desalojados
+    ahora[0] = 20.0
+    cache.cotizar(a, ESPECIFICACION)  # expiró
+    invalidadas = cache.invalidar_producto("Laptop")
+
+    # Assert
+    assert desalojados == 1
+    assert cache.estadisticas().expirados == 1
+    assert invalidadas == 2
+    assert len(cache) == 0
+
+def test_especificacion_invalida(productos):
+    """
+    AAA:
+    Arrange: Se crea una caché y un carrito.
+    Act: Se cotiza con un porcentaje fuera de rango.
+    Assert: Se verifica que se lanza ValueError.
+    """
+    # Arrange
+    cache = CacheCotizaciones()
+    carrito = _carrito((productos[0], 1))
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        cache.cotizar(carrito, ESPECIFICACION._replace(descuento=150))
+    with pytest.raises(ValueError):
+        CacheCotizaciones(maximo=0)
+
+def test_pipeline_y_huella_incremental(productos):
+    """
+    AAA:
+    Arrange: Se crean dos carritos que llegan al mismo contenido por caminos
+             distintos (agregados, remociones y un cambio de precio) y una regla compilada.
+    Act: Se cotizan ambos con la regla compilada.
+    Assert: Se verifica que tienen la misma huella, que el segundo es un acierto
+            y que el resultado coincide con la regla.
+    """
+    # Arrange
+    laptop, mouse = productos
+    regla = compilar([DescuentoProducto("Mouse", 10), Impuesto(18)])
+    cache = CacheCotizaciones()
+    a = _carrito((laptop, 1), (mouse, 2))
+    b = _carrito((mouse, 5))
+    b.remover_producto(mouse, 3)
+    b.agregar_producto(laptop, 2)
+    b.actualizar_cantidad(laptop, 1)
+    a.vaciar()
+    a.agregar_productos([(laptop, 1), (mouse, 2)])
+    mouse.precio = 40.00
+
+    # Act
+    primero = cache.cotizar(a, regla)
+    segundo = cache.cotizar(b, regla)
+
+    # Assert
+    assert a.huella == b.huella != Carrito().huella
+    assert segundo is primero
+    assert primero == regla(b)
+    assert cache.estadisticas().aciertos == 1
+
+def test_carrito_columnar_comparte_entradas_con_carrito(productos):
+    """
+    AAA:
+    Arrange: Se crean un Carrito y un CarritoColumnar con el mismo contenido.
+    Act: Se cotizan ambos, se cambia el columnar y se vuelve a cotizar.
+    Assert: Se verifica que el columnar acierta la entrada del Carrito y que un cambio no la reusa.
+    """
+    # Arrange
+    laptop, mouse = productos
+    cache = CacheCotizaciones()
+    normal = _carrito((laptop, 1), (mouse, 2))
+    columnar = CarritoColumnar()
+    columnar.agregar_productos([(mouse, 2), (laptop, 1)])
+
+    # Act
+    primero = cache.cotizar(normal, ESPECIFICACION)
+    segundo = cache.cotizar(columnar, ESPECIFICACION)
+    columnar.actualizar_cantidad(mouse, 1)
+    tercero = cache.cotizar(columnar, ESPECIFICACION)
+
+    # Assert
+    assert cache.huella(columnar) != cache.huella(normal)
+    assert segundo is primero
+    assert tercero == precio_desde_total(1050.00, ESPECIFICACION)
+    assert cache.estadisticas().aciertos == 1
@@ -1,6 +1,11 @@
 ## Ejemplo de prueba
 # tests/test_carrito.py
 
+import copy
+import math
+import pickle
+import random
+
 import pytest
 from src.carrito import Carrito, Producto
 from src.factories import ProductoFactory
@@ -248,3 +253,142 @@ def test_items_ordenar_por_criterio_parametrizado(carrito, prod1, prod2, criteri
     else:
         with pytest.raises(ValueError):
             carrito.obtener_items_ordenados(criterio)
+
+
+def test_obtener_items_conserva_orden_de_insercion(carrito, producto_laptop, producto_mouse, producto_teclado):
+    """
+    AAA:
+    Arrange: Se crea un carrito y se agregan tres productos.
+    Act: Se remueve el producto del medio y se vuelve a agregar.
+    Assert: Se verifica que los items respetan el orden de inserción.
+    """
+    # Arrange
+    producto_mouse.stock = 10
+    carrito.agregar_producto(producto_laptop)
+    carrito.agregar_producto(producto_mouse)
+    carrito.agregar_producto(producto_teclado)
+
+    # Act
+    carrito.remover_producto(producto_mouse)
+    carrito.agregar_producto(producto_mouse, cantidad=2)
+
+    # Assert
+    nombres = [item.producto.nombre for item in carrito.obtener_items()]
+    assert nombres == ["Laptop", "Teclado", "Mouse"]
+    assert carrito.obtener_items()[2].cantidad == 2
+
+def test_vaciar_reinicia_indice(carrito, producto_smartphone):
+    """
+    AAA:
+    Arrange: Se crea un carrito con un producto de stock limitado.
+    Act: Se vacía el carrito y se agrega nuevamente el producto.
+    Assert: Se verifica que el índice no conserva cantidades previas.
+    """
+    # Arrange
+    carrito.agregar_producto(producto_smartphone, cantidad=5)
+
+    # Act
+    carrito.vaciar()
+    carrito.agregar_producto(producto_smartphone, cantidad=5)
+
+    # Assert
+    assert carrito.contar_items() == 5
+    with pytest.raises(ValueError):
+        carrito.remover_producto(producto_smartphone, cantidad=6)
+
+def test_total_se_actualiza_al_cambiar_precio(carrito, producto_impresora, producto_escaner):
+    """
+    AAA:
+    Arrange: Se crea un carrito con dos productos.
+    Act: Se cambia el precio de uno de los productos.
+    Assert: Se verifica que el total y la cantidad de items reflejan el nuevo precio.
+    """
+    # Arrange
+    producto_impresora.stock = 10
+    carrito.agregar_producto(producto_impresora, cantidad=2)  # Total 400
+    carrito.agregar_producto(producto_escaner, cantidad=1)  # Total 150
+
+    # Act
+    producto_impresora.precio = 250.00
+
+    # Assert
+    assert carrito.calcular_total() == 650.00
+    assert carrito.contar_items() == 3
+
+def test_cambio_de_precio_no_afecta_carrito_tras_remover(carrito, producto_impresora, producto_escaner):
+    """
+    AAA:
+    Arrange: Se crea un carrito con dos productos y se remueve uno.
+    Act: Se cambia el precio del producto removido.
+    Assert: Se verifica que el total del carrito no cambia.
+    """
+    # Arrange
+    carrito.agregar_producto(producto_impresora, cantidad=1)
+    carrito.agregar_producto(producto_escaner, cantidad=1)
+    carrito.actualizar_cantidad(producto_impresora, nueva_cantidad=0)
+
+    # Act
+    producto_impresora.precio = 1.00
+
+    # Assert
+    assert carrito.calcular_total() == 150.00
+
+def test_total_no_acumula_error_tras_muchas_altas_y_bajas():
+    """
+    AAA:
+    Arrange: Se crean productos con precios no representables exactamente en binario.
+    Act: Se aplican miles de altas, bajas, cambios de cantidad y de precio al azar.
+    Assert: Se verifica que el total coincide con la suma de las líneas.
+    """
+    # Arrange
+    rng = random.Random(7)
+    productos = [Producto(f"P{i}", rng.choice([0.1, 0.2, 0.3, 19.99, 1e-3, 12345.67]), stock=10**9) for i in range(30)]
+    carrito = Carrito()
+    a, b, c = productos[:3]
+    a.precio, b.precio, c.precio = 0.1, 0.2, 0.3
+    carrito.agregar_productos([(a, 1), (b, 1), (c, 1)])
+    carrito.remover_producto(b)
+    tres_lineas = carrito.calcular_total()
+
+    # Act
+    for _ in range(20_000):
+        producto = rng.choice(productos)
+        accion = rng.random()
+        if accion < 0.5:
+            carrito.agregar_producto(producto, rng.randint(1, 5))
+        elif accion < 0.8 and any(item.producto is producto for item in carrito.items):
+            carrito.actualizar_cantidad(producto, rng.randint(0, 5))
+        else:
+            producto.precio = round(rng.uniform(0.01, 100), 2)
+
+    # Assert
+    lineas = [item.total() for item in carrito.obtener_items()]
+    assert tres_lineas == 0.4
+    assert carrito.calcular_total() == math.fsum(lineas)
+    assert carrito.calcular_total() == pytest.approx(sum(lineas), rel=1e-15, abs=0)
+
+def test_carrito_y_producto_se_pueden_serializar_y_copiar():
+    """
+    AAA:
+    Arrange: Se crea un carrito con dos productos.
+    Act: Se serializa con pickle, se copia en profundidad y se cambia el precio de un producto copiado.
+    Assert: Se verifica que las copias conservan las líneas y siguen los precios de sus propios productos.
+    """
+    # Arrange
+    mouse = Producto("Mouse", 10.00, stock=10)
+    teclado = Producto("Teclado", 30.00, stock=10)
+    carrito = Carrito()
+    carrito.agregar_productos([(mouse, 2), (teclado, 1)])
+
+    # Act
+    restaurado = pickle.loads(pickle.dumps(carrito))
+    copia = copy.deepcopy(carrito)
+    copia.obtener_items()[0].producto.precio = 20.00
+    restaurado.obtener_items()[1].producto.precio = 40.00
+
+    # Assert
+    assert pickle.loads(pickle.dumps(mouse)).precio == 10.00
+    assert [(i.producto.nombre, i.cantidad) for i in restaurado.obtener_items()] == [("Mouse", 2), ("Teclado", 1)]
+    assert copia.calcular_total() == sum(item.total() for item in copia.obtener_items()) == 70.00
+    assert restaurado.calcular_total() == 60.00
+    assert carrito.calcular_total() == 50.00
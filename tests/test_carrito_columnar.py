@@ -0,0 +1,111 @@
+# tests/test_carrito_columnar.py
+import random
+
+import pytest
+from src.carrito import Carrito, Producto
+from src.carrito_columnar import CarritoColumnar
+
+def _contenido(carrito):
+    return [(item.producto.nombre, item.cantidad) for item in carrito.obtener_items()]
+
+def test_columnar_equivale_a_carrito():
+    """
+    AAA:
+    Arrange: Se crean un Carrito y un CarritoColumnar y un conjunto de productos.
+    Act: Se aplica la misma secuencia aleatoria de operaciones en ambos.
+    Assert: Se verifica que contenido, totales y orden coinciden.
+    """
+    # Arrange
+    rng = random.Random(7)
+    productos = [Producto(f"P{i:03d}", rng.randint(1, 500) / 4, stock=20) for i in range(60)]
+    normal, columnar = Carrito(), CarritoColumnar(capacidad=4)
+
+    # Act
+    for _ in range(2000):
+        producto = rng.choice(productos)
+        operacion = rng.choice(["agregar", "remover", "actualizar"])
+        cantidad = rng.randint(0, 6)
+        resultados = []
+        for carrito in (normal, columnar):
+            try:
+                if operacion == "agregar":
+                    carrito.agregar_producto(producto, cantidad)
+                elif operacion == "remover":
+                    carrito.remover_producto(producto, cantidad)
+                else:
+                    carrito.actualizar_cantidad(producto, cantidad)
+                resultados.append(True)
+            except ValueError:
+                resultados.append(False)
+        assert resultados[0] == resultados[1]
+
+    # Assert
+    assert _contenido(columnar) == _contenido(normal)
+    assert columnar.calcular_total() == pytest.approx(normal.calcular_total())
+    assert columnar.contar_items() == normal.contar_items()
+    for criterio in ("precio", "nombre"):
+        assert [i.producto.nombre for i in columnar.obtener_items_ordenados(criterio)] == \
+            [i.producto.nombre for i in normal.obtener_items_ordenados(criterio)]
+
+def test_columnar_reglas_de_precio(producto_impresora, producto_escaner):
+    """
+    AAA:
+    Arrange: Se crea un CarritoColumnar con dos productos (total 550).
+    Act: Se aplican descuento, cupón e impuestos.
+    Assert: Se verifica que los montos son los esperados.
+    """
+    # Arrange
+    producto_impresora.stock = producto_escaner.stock = 10
+    carrito = CarritoColumnar()
+    carrito.agregar_productos([(producto_impresora, 2), (producto_escaner, 1)])
+
+    # Act & Assert
+    assert carrito.calcular_total() == 550.00
+    assert carrito.aplicar_descuento(10) == 495.00
+    assert carrito.aplicar_cupon(20, 50) == 500.00
+    assert carrito.calcular_impuestos(10) == pytest.approx(55.00)
+    assert carrito.aplicar_descuento_condicional(10, 1000) == 550.00
+    with pytest.raises(ValueError):
+        carrito.aplicar_descuento(150)
+
+def test_columnar_cambio_de_precio_y_vaciar(producto_impresora):
+    """
+    AAA:
+    Arrange: Se crea un CarritoColumnar con un producto.
+    Act: Se cambia el precio del producto y luego se vacía el carrito.
+    Assert: Se verifica que el total refleja el precio nuevo y luego queda en cero.
+    """
+    # Arrange
+    producto_impresora.stock = 10
+    carrito = CarritoColumnar()
+    carrito.agregar_producto(producto_impresora, cantidad=3)
+
+    # Act & Assert
+    producto_impresora.precio = 100.00
+    assert carrito.calcular_total() == 300.00
+    carrito.vaciar()
+    assert carrito.obtener_items() == [] and carrito.calcular_total() == 0
+
+@pytest.mark.parametrize("clase", [Carrito, CarritoColumnar])
+@pytest.mark.parametrize("criterio", ["precio", "cantidad", "total"])
+@pytest.mark.parametrize("descendente", [True, False])
+def test_top_k_con_empates_coincide_con_la_pagina(clase, criterio, descendente):
+    """
+    AAA:
+    Arrange: Se crea un carrito de 40 líneas con precios y cantidades que se repiten.
+    Act: Se piden los 5 primeros con top_k y con obtener_items_ordenados.
+    Assert: Se verifica que ambos devuelven los mismos items en el mismo orden, igual que Carrito.
+    """
+    # Arrange
+    lineas = [(Producto(f"P{i}", float(i % 3), stock=10), i % 4 + 1) for i in range(40)]
+    carrito, referencia = clase(), Carrito()
+    carrito.agregar_productos(lineas)
+    referencia.agregar_productos(lineas)
+
+    # Act
+    top = [i.producto.nombre for i in carrito.top_k(criterio, 5, descendente=descendente)]
+    pagina = [i.producto.nombre for i in carrito.obtener_items_ordenados(criterio, limit=5, descendente=descendente)]
+
+    # Assert
+    assert top == pagina
+    assert top == [i.producto.nombre for i in referencia.top_k(criterio, 5, descendente=descendente)]
@@ -0,0 +1,159 @@
+# tests/test_catalogo.py
+import pytest
+from src.carrito import Carrito, Producto
+from src.catalogo import Catalogo
+
+def test_internar_comparte_producto_entre_carritos():
+    """
+    AAA:
+    Arrange: Se crea un catálogo y dos carritos.
+    Act: Se interna el mismo nombre dos veces y se agrega a cada carrito.
+    Assert: Se verifica que ambos carritos comparten el mismo objeto y ven el cambio de precio.
+    """
+    # Arrange
+    catalogo = Catalogo()
+    carrito1, carrito2 = Carrito(), Carrito()
+
+    # Act
+    carrito1.agregar_producto(catalogo.internar("Laptop", 1000.00, 10), cantidad=1)
+    carrito2.agregar_producto(catalogo.internar("Laptop", 999.00, 3), cantidad=2)
+    catalogo.obtener("Laptop").precio = 900.00
+
+    # Assert
+    assert carrito1.obtener_items()[0].producto is carrito2.obtener_items()[0].producto
+    assert len(catalogo) == 1
+    assert (carrito1.calcular_total(), carrito2.calcular_total()) == (900.00, 1800.00)
+
+def test_agregar_retorna_instancia_canonica():
+    """
+    AAA:
+    Arrange: Se crea un catálogo con un producto.
+    Act: Se registra otro objeto con el mismo nombre.
+    Assert: Se verifica que se retorna el producto ya registrado.
+    """
+    # Arrange
+    catalogo = Catalogo()
+    original = catalogo.agregar(Producto("Mouse", 50.00, 10))
+
+    # Act
+    canonico = catalogo.agregar(Producto("Mouse", 60.00, 5))
+
+    # Assert
+    assert canonico is original and "Mouse" in catalogo
+    with pytest.raises(ValueError):
+        catalogo.obtener("Teclado")
+
+def test_producto_e_item_no_tienen_dict():
+    """
+    AAA:
+    Arrange: Se crea un producto y un carrito con ese producto.
+    Act: Se obtiene el item del carrito.
+    Assert: Se verifica que producto e item usan __slots__.
+    """
+    # Arrange
+    carrito = Carrito()
+    carrito.agregar_producto(Producto("Cargador", 25.00, 5))
+
+    # Act
+    item = carrito.obtener_items()[0]
+
+    # Assert
+    assert not hasattr(item, "__dict__") and not hasattr(item.producto, "__dict__")
+
+def test_nombre_e_id_de_producto_son_de_solo_lectura():
+    """
+    AAA:
+    Arrange: Se interna un producto en un catálogo.
+    Act: Se intenta cambiar su nombre y su id, y se repone su stock.
+    Assert: Se verifica que nombre e id no cambian y el stock sí.
+    """
+    # Arrange
+    producto = Catalogo().internar("Cargador", 25.00, 5)
+
+    # Act / Assert
+    with pytest.raises(AttributeError):
+        producto.nombre = "Otro"
+    with pytest.raises(AttributeError):
+        producto.id = 7
+    producto.stock = 8
+    assert (producto.nombre, producto.id, producto.stock) == ("Cargador", 0, 8)
+
+def test_ids_estables_y_busqueda_por_prefijo():
+    """
+    AAA:
+    Arrange: Se crea un catálogo con varios productos.
+    Act: Se busca por id y por prefijo sin distinguir mayúsculas.
+    Assert: Se verifica que los ids son estables y la búsqueda respeta prefijo, orden y límite.
+    """
+    # Arrange
+    catalogo = Catalogo()
+    nombres = ["Monitor", "mouse", "Mochila", "Laptop", "MOUSEPAD", "Teclado"]
+    productos = [catalogo.internar(nombre, 10.00, 5) for nombre in nombres]
+    catalogo.internar("Mouse inalámbrico", 20.00, 5)
+
+    # Act
+    por_id = [catalogo.obtener_por_id(i) for i in range(len(nombres))]
+    mou = catalogo.buscar_prefijo("MOU")
+    mo = catalogo.buscar_prefijo("mo", limite=2)
+
+    # Assert
+    assert por_id == productos and [p.id for p in productos] == list(range(len(nombres)))
+    assert [p.nombre for p in mou] == ["mouse", "Mouse inalámbrico", "MOUSEPAD"]
+    assert [p.nombre for p in mo] == ["Mochila", "Monitor"]
+    assert catalogo.buscar_prefijo("z") == []
+    with pytest.raises(ValueError):
+        catalogo.obtener_por_id(99)
+
+def test_carrito_referencia_ids_de_catalogo():
+    """
+    AAA:
+    Arrange: Se crea un catálogo y un carrito asociado a él.
+    Act: Se agregan y actualizan productos usando sus ids.
+    Assert: Se verifica que el carrito resuelve los ids y combina las cantidades.
+    """
+    # Arrange
+    catalogo = Catalogo()
+    laptop = catalogo.internar("Laptop", 1000.00, 10)
+    mouse = catalogo.internar("Mouse", 50.00, 10)
+    carrito = Carrito(catalogo=catalogo)
+
+    # Act
+    carrito.agregar_producto(laptop.id, 1)
+    carrito.agregar_producto(laptop, 1)
+    carrito.agregar_productos([(mouse.id, 2)])
+    carrito.actualizar_cantidad(mouse.id, 3)
+
+    # Assert
+    assert [(i.producto, i.cantidad) for i in carrito.obtener_items()] == [(laptop, 2), (mouse, 3)]
+    assert carrito.calcular_total() == 2150.00
+    with pytest.raises(ValueError):
+        Carrito().agregar_producto(laptop.id)
+
+
+def test_lineas_se_identifican_por_nombre_aunque_haya_ids():
+    """
+    AAA:
+    Arrange: Se crean productos de dos catálogos con el mismo id, un producto
+             suelto con el nombre de uno catalogado y un producto ya en un carrito.
+    Act: Se agregan a un carrito y se intenta catalogar el que ya está en el carrito.
+    Assert: Se verifica que cada nombre es una línea y que el catálogo rechaza el producto.
+    """
+    # Arrange
+    laptop = Catalogo().internar("Laptop", 1000.00, 10)
+    mouse = Catalogo().internar("Mouse", 50.00, 10)
+    teclado = Catalogo().internar("Teclado", 80.00, 10)
+    suelto = Producto("Teclado", 80.00, 10)
+    monitor = Producto("Monitor", 300.00, 10)
+    carrito = Carrito()
+
+    # Act
+    carrito.agregar_productos([(laptop, 1), (mouse, 2), (teclado, 1), (suelto, 1), (monitor, 1)])
+
+    # Assert
+    assert laptop.id == mouse.id == 0
+    assert [(i.producto.nombre, i.cantidad) for i in carrito.obtener_items()] == \
+        [("Laptop", 1), ("Mouse", 2), ("Teclado", 2), ("Monitor", 1)]
+    with pytest.raises(ValueError):
+        Catalogo().agregar(monitor)
+    carrito.remover_producto(monitor)
+    assert carrito.contar_items() == 5
@@ -0,0 +1,83 @@
+# tests/test_centavos.py
+import pytest
+from src.carrito import Producto
+from src.centavos import (CarritoCentavos, ReglasRedondeo, dividir, porcentaje_de,
+                          HACIA_ABAJO, HACIA_ARRIBA, MITAD_ARRIBA, MITAD_PAR)
+
+@pytest.mark.parametrize("numerador, denominador, modo, esperado", [
+    (25, 10, MITAD_PAR, 2),
+    (35, 10, MITAD_PAR, 4),
+    (25, 10, MITAD_ARRIBA, 3),
+    (21, 10, HACIA_ARRIBA, 3),
+    (29, 10, HACIA_ABAJO, 2),
+    (-21, 10, HACIA_ABAJO, -3),
+    (-25, 10, MITAD_PAR, -2),
+])
+def test_dividir_con_redondeo(numerador, denominador, modo, esperado):
+    """
+    Red: Se espera que la división entera redondee según el modo indicado.
+    """
+    assert dividir(numerador, denominador, modo) == esperado
+
+def test_total_sin_error_de_redondeo():
+    """
+    AAA:
+    Arrange: Se crea un carrito en centavos y un producto de 0.10.
+    Act: Se agregan y quitan unidades muchas veces.
+    Assert: Se verifica que el total es exacto, a diferencia de la suma en float.
+    """
+    # Arrange
+    carrito = CarritoCentavos()
+    producto = Producto("Caramelo", 0.10, stock=1000)
+    suma_float = 0.0
+
+    # Act
+    for _ in range(10):
+        carrito.agregar_producto(producto, cantidad=1)
+        suma_float += 0.10
+
+    # Assert
+    assert carrito.calcular_total_centavos() == 100
+    assert carrito.calcular_total() == 1.00
+    assert suma_float != 1.00
+
+def test_reglas_de_precio_en_centavos():
+    """
+    AAA:
+    Arrange: Se crea un carrito en centavos con total 200.05.
+    Act: Se aplican descuento, impuesto y cupón con distintas reglas de redondeo.
+    Assert: Se verifica que cada monto se redondea a centavo con su regla.
+    """
+    # Arrange
+    carrito = CarritoCentavos(redondeo=ReglasRedondeo(descuento=HACIA_ABAJO, impuesto=HACIA_ARRIBA))
+    carrito.agregar_producto(Producto("Mochila", 200.05, stock=5), cantidad=1)
+
+    # Act & Assert
+    assert carrito.aplicar_descuento_centavos(10) == 20005 - 2000  # 2000.5 -> 2000
+    assert carrito.calcular_impuestos_centavos(18) == 3601  # 3600.9 -> 3601
+    assert carrito.aplicar_cupon_centavos(12.5, 20) == 20005 - 2000  # 2500.6 topado en 2000
+    assert carrito.aplicar_cupon(12.5, 100) == 175.04  # 2500.625 -> 2501
+    assert porcentaje_de(20005, 12.5, MITAD_PAR) == 2501
+    with pytest.raises(ValueError):
+        carrito.calcular_impuestos_centavos(101)
+
+def test_cambio_de_precio_y_vaciar():
+    """
+    AAA:
+    Arrange: Se crea un carrito en centavos con dos productos.
+    Act: Se cambia un precio, se remueve el otro producto y luego se vacía.
+    Assert: Se verifica que el total en centavos sigue siendo exacto.
+    """
+    # Arrange
+    carrito = CarritoCentavos()
+    laptop = Producto("Laptop", 1000.50, stock=5)
+    mouse = Producto("Mouse", 19.99, stock=5)
+    carrito.agregar_productos([(laptop, 2), (mouse, 3)])
+
+    # Act & Assert
+    laptop.precio = 999.99
+    assert carrito.calcular_total_centavos() == 2 * 99999 + 3 * 1999
+    carrito.remover_producto(mouse, cantidad=3)
+    assert carrito.calcular_total() == 1999.98
+    carrito.vaciar()
+    assert carrito.calcular_total_centavos() == 0
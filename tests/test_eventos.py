@@ -0,0 +1,139 @@
+# tests/test_eventos.py
+import threading
+
+import pytest
+from src.carrito import CantidadCambiada, Carrito, CarritoVaciado, ItemAgregado, ItemRemovido, Producto
+from src.eventos import ConteoPorProducto, FlujoEventos
+
+@pytest.fixture
+def mouse():
+    return Producto("Mouse", 50.00, stock=100)
+
+@pytest.fixture
+def teclado():
+    return Producto("Teclado", 75.00, stock=100)
+
+def test_eventos_de_cada_operacion(mouse, teclado):
+    """
+    AAA:
+    Arrange: Se crea un carrito con un suscriptor que guarda los eventos.
+    Act: Se agrega, actualiza, remueve y vacía.
+    Assert: Se verifica la secuencia de eventos tipados.
+    """
+    # Arrange
+    carrito = Carrito()
+    eventos = []
+    carrito.suscribir(eventos.append)
+
+    # Act
+    carrito.agregar_producto(mouse, 2)
+    carrito.agregar_producto(mouse, 1)
+    carrito.actualizar_cantidad(mouse, 5)
+    carrito.agregar_producto(teclado, 1)
+    carrito.remover_producto(teclado, 1)
+    carrito.vaciar()
+
+    # Assert
+    assert eventos == [
+        ItemAgregado(carrito, mouse, 2),
+        CantidadCambiada(carrito, mouse, 2, 3),
+        CantidadCambiada(carrito, mouse, 3, 5),
+        ItemAgregado(carrito, teclado, 1),
+        ItemRemovido(carrito, teclado, 1),
+        CarritoVaciado(carrito, ((mouse, 5),)),
+    ]
+
+def test_desuscribir_y_lote_fallido(mouse):
+    """
+    AAA:
+    Arrange: Se crea un carrito con un suscriptor.
+    Act: Se intenta un lote que excede el stock y luego se desuscribe.
+    Assert: Se verifica que el lote fallido no emite eventos y que tras desuscribir no llegan más.
+    """
+    # Arrange
+    carrito = Carrito()
+    eventos = []
+    carrito.suscribir(eventos.append)
+
+    # Act
+    with pytest.raises(ValueError):
+        carrito.agregar_productos([(mouse, 1), (mouse, 200)])
+    carrito.desuscribir(eventos.append)
+    carrito.agregar_producto(mouse, 1)
+
+    # Assert
+    assert eventos == []
+    with pytest.raises(ValueError):
+        carrito.desuscribir(eventos.append)
+
+def test_flujo_entrega_lotes_y_conteo_incremental(mouse, teclado):
+    """
+    AAA:
+    Arrange: Se crean dos carritos conectados a un flujo con lotes de 2 eventos.
+    Act: Se modifican los carritos y se consume lo pendiente.
+    Assert: Se verifica el tamaño de los lotes y que el conteo coincide con recorrer los carritos.
+    """
+    # Arrange
+    a, b = Carrito(), Carrito()
+    flujo = FlujoEventos([a, b], tamano_lote=2)
+    conteo = ConteoPorProducto()
+
+    # Act
+    a.agregar_productos([(mouse, 2), (teclado, 1)])
+    b.agregar_producto(mouse, 3)
+    b.actualizar_cantidad(mouse, 1)
+    a.vaciar()
+    b.agregar_producto(teclado, 4)
+    lotes = list(flujo.lotes(espera=0))
+    for lote in lotes:
+        conteo.aplicar(lote)
+
+    # Assert
+    assert [len(lote) for lote in lotes] == [2, 2, 2]
+    assert conteo.unidades == {"Mouse": 1, "Teclado": 4}
+    assert conteo.carritos == {"Mouse": 1, "Teclado": 1}
+
+def test_flujo_sin_bloquear_descarta_los_mas_antiguos(mouse):
+    """
+    AAA:
+    Arrange: Se conecta un carrito a un flujo de capacidad 2 que no bloquea.
+    Act: Se emiten cuatro eventos sin consumir.
+    Assert: Se verifica que se conservan los dos últimos y se cuentan los descartados.
+    """
+    # Arrange
+    carrito = Carrito()
+    flujo = FlujoEventos([carrito], capacidad=2, bloquear=False)
+
+    # Act
+    for _ in range(4):
+        carrito.agregar_producto(mouse, 1)
+
+    # Assert
+    assert flujo.descartados == 2
+    assert [evento.cantidad for lote in flujo.lotes(espera=0) for evento in lote] == [3, 4]
+
+def test_flujo_bloqueante_con_consumidor_en_otro_hilo(mouse):
+    """
+    AAA:
+    Arrange: Se conecta un carrito a un flujo de capacidad 4 consumido desde otro hilo.
+    Act: Se emiten 500 eventos y se cierra el flujo.
+    Assert: Se verifica que el consumidor recibió todos los eventos en orden, sin descartes.
+    """
+    # Arrange
+    carrito = Carrito()
+    flujo = FlujoEventos([carrito], capacidad=4, tamano_lote=3)
+    recibidos = []
+    consumidor = threading.Thread(target=lambda: [recibidos.extend(lote) for lote in flujo.lotes()])
+    consumidor.start()
+
+    # Act
+    for _ in range(250):
+        carrito.agregar_producto(mouse, 1)
+        carrito.remover_producto(mouse, 1)
+    flujo.cerrar()
+    consumidor.join(timeout=5)
+
+    # Assert
+    assert not consumidor.is_alive()
+    assert flujo.descartados == 0
+    assert [type(evento) for evento in recibidos] == [ItemAgregado, ItemRemovido] * 250
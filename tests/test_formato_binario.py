@@ -0,0 +1,115 @@
+# tests/test_formato_binario.py
+import pytest
+from src.carrito import Carrito, Producto
+from src.carrito_columnar import CarritoColumnar
+from src.catalogo import Catalogo
+from src.formato_binario import VistaCarrito
+
+def _carrito(clase=Carrito):
+    carrito = clase()
+    carrito.agregar_productos([
+        (Producto("Laptop", 1000.50, stock=5), 2),
+        (Producto("Teléfono", 800.00, stock=5), 1),
+        (Producto("Mouse", 50.25, stock=10), 4),
+    ])
+    return carrito
+
+@pytest.mark.parametrize("clase", [Carrito, CarritoColumnar])
+def test_ida_y_vuelta(clase):
+    """
+    AAA:
+    Arrange: Se crea un carrito con varios productos.
+    Act: Se codifica y se decodifica.
+    Assert: Se verifica que contenido, precios, stock y total se conservan.
+    """
+    # Arrange
+    carrito = _carrito(clase)
+
+    # Act
+    copia = clase.from_bytes(carrito.to_bytes())
+
+    # Assert
+    original = [(i.producto.nombre, i.producto.precio, i.producto.stock, i.cantidad) for i in carrito.obtener_items()]
+    assert [(i.producto.nombre, i.producto.precio, i.producto.stock, i.cantidad) for i in copia.obtener_items()] == original
+    assert copia.calcular_total() == pytest.approx(carrito.calcular_total())
+
+def test_from_bytes_interna_en_catalogo():
+    """
+    AAA:
+    Arrange: Se codifica un carrito y se prepara un catálogo con uno de sus productos.
+    Act: Se decodifica dos veces usando el catálogo.
+    Assert: Se verifica que ambos carritos comparten los productos del catálogo.
+    """
+    # Arrange
+    datos = _carrito().to_bytes()
+    catalogo = Catalogo()
+    laptop = catalogo.internar("Laptop", 1000.50, 5)
+
+    # Act
+    carrito1 = Carrito.from_bytes(datos, catalogo)
+    carrito2 = Carrito.from_bytes(datos, catalogo)
+
+    # Assert
+    assert carrito1.obtener_items()[0].producto is laptop
+    assert carrito1.obtener_items()[1].producto is carrito2.obtener_items()[1].producto
+
+@pytest.mark.parametrize("clase", [Carrito, CarritoColumnar])
+def test_from_bytes_reconstruye_aunque_baje_el_stock(clase):
+    """
+    AAA:
+    Arrange: Se llena un carrito y luego se reduce el stock de un producto por debajo de su cantidad.
+    Act: Se codifica y se decodifica con un catálogo.
+    Assert: Se verifica que las líneas se reconstruyen tal cual y el carrito usa el catálogo.
+    """
+    # Arrange
+    carrito = _carrito(clase)
+    carrito.obtener_items()[2].producto.stock = 2
+    catalogo = Catalogo()
+
+    # Act
+    copia = clase.from_bytes(carrito.to_bytes(), catalogo)
+
+    # Assert
+    assert [(i.producto.nombre, i.cantidad) for i in copia.obtener_items()] == \
+        [("Laptop", 2), ("Teléfono", 1), ("Mouse", 4)]
+    assert copia._catalogo is catalogo
+    copia.actualizar_cantidad(catalogo.obtener("Mouse").id, 1)
+    assert copia.contar_items() == 4
+
+def test_vista_calcula_sin_decodificar():
+    """
+    AAA:
+    Arrange: Se codifica un carrito.
+    Act: Se crea una vista de solo lectura sobre los bytes.
+    Assert: Se verifica que total y cantidad coinciden con el carrito.
+    """
+    # Arrange
+    carrito = _carrito()
+    datos = bytearray(carrito.to_bytes())
+
+    # Act
+    vista = VistaCarrito(datos)
+
+    # Assert
+    assert len(vista) == 3
+    assert vista.contar_items() == carrito.contar_items() == 7
+    assert vista.calcular_total() == pytest.approx(carrito.calcular_total())
+
+@pytest.mark.parametrize("datos", [
+    b"",
+    b"XXXX" + bytes(12),
+    b"CRTB\x09\x00" + bytes(10),
+    _carrito().to_bytes()[:40],
+])
+def test_datos_invalidos(datos):
+    """
+    AAA:
+    Arrange: Se preparan bytes inválidos, de otra versión o truncados.
+    Act: Se intenta decodificar o crear una vista.
+    Assert: Se verifica que se lanza ValueError.
+    """
+    # Act & Assert
+    with pytest.raises(ValueError):
+        Carrito.from_bytes(datos)
+    with pytest.raises(ValueError):
+        VistaCarrito(datos)
@@ -0,0 +1,107 @@
+# tests/test_fusion.py
+import pytest
+from src.carrito import ACTUALIZAR, AGREGAR, MAXIMO, PREFERIR_OTRO, REMOVER, SUMAR, Carrito, Producto
+from src.inventario import Inventario
+
+def _cantidades(carrito):
+    return {item.producto.nombre: item.cantidad for item in carrito.items}
+
+@pytest.fixture
+def productos():
+    return {
+        "Laptop": Producto("Laptop", 1000.00, stock=3),
+        "Mouse": Producto("Mouse", 50.00, stock=10),
+        "Teclado": Producto("Teclado", 75.00, stock=10),
+    }
+
+@pytest.fixture
+def usuario(productos):
+    carrito = Carrito()
+    carrito.agregar_productos([(productos["Laptop"], 2), (productos["Mouse"], 4)])
+    return carrito
+
+@pytest.fixture
+def invitado(productos):
+    carrito = Carrito()
+    carrito.agregar_productos([(productos["Laptop"], 2), (productos["Mouse"], 1), (productos["Teclado"], 2)])
+    return carrito
+
+@pytest.mark.parametrize("politica, esperado", [
+    (SUMAR, {"Laptop": 3, "Mouse": 5, "Teclado": 2}),
+    (MAXIMO, {"Laptop": 2, "Mouse": 4, "Teclado": 2}),
+    (PREFERIR_OTRO, {"Laptop": 2, "Mouse": 1, "Teclado": 2}),
+])
+def test_fusionar_politicas(usuario, invitado, politica, esperado):
+    """
+    AAA:
+    Arrange: Se crean el carrito del usuario y el del invitado con productos en común.
+    Act: Se fusiona el carrito del invitado con cada política.
+    Assert: Se verifican las cantidades, acotadas al stock, y que el invitado no cambia.
+    """
+    # Arrange
+    antes = _cantidades(invitado)
+
+    # Act
+    usuario.fusionar(invitado, politica)
+
+    # Assert
+    assert _cantidades(usuario) == esperado
+    assert _cantidades(invitado) == antes
+    assert usuario.calcular_total() == pytest.approx(
+        sum(p * c for p, c in ((1000.00, esperado["Laptop"]), (50.00, esperado["Mouse"]), (75.00, esperado["Teclado"]))))
+
+def test_fusionar_respeta_el_inventario(productos):
+    """
+    AAA:
+    Arrange: Se crea un inventario donde otro titular reservó casi todas las laptops.
+    Act: Se fusiona en un carrito del inventario un invitado con dos laptops.
+    Assert: Se verifica que solo se agrega lo que queda disponible.
+    """
+    # Arrange
+    inventario = Inventario()
+    inventario.reservar(productos["Laptop"], 2, "otro")
+    usuario = Carrito(inventario=inventario)
+    invitado = Carrito()
+    invitado.agregar_producto(productos["Laptop"], 2)
+
+    # Act
+    usuario.fusionar(invitado)
+
+    # Assert
+    assert _cantidades(usuario) == {"Laptop": 1}
+    assert inventario.disponible(productos["Laptop"]) == 0
+
+def test_fusionar_politica_invalida(usuario, invitado):
+    """
+    AAA:
+    Arrange: Se crean dos carritos.
+    Act: Se fusionan con una política desconocida.
+    Assert: Se verifica que se lanza ValueError y el carrito no cambia.
+    """
+    # Arrange
+    antes = _cantidades(usuario)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        usuario.fusionar(invitado, "promedio")
+    assert _cantidades(usuario) == antes
+
+def test_diferencia_sincroniza_carritos(usuario, invitado):
+    """
+    AAA:
+    Arrange: Se crean dos carritos distintos.
+    Act: Se calcula la diferencia y se aplica al primero.
+    Assert: Se verifica que hay una operación por producto distinto y que los carritos quedan iguales.
+    """
+    # Arrange
+    usuario.agregar_producto(Producto("Monitor", 300.00, stock=5), 1)
+
+    # Act
+    operaciones = usuario.diferencia(invitado)
+    usuario.aplicar_operaciones(operaciones)
+
+    # Assert
+    assert sorted((tipo, producto.nombre, cantidad) for tipo, producto, cantidad in operaciones) == [
+        (ACTUALIZAR, "Mouse", 1), (AGREGAR, "Teclado", 2), (REMOVER, "Monitor", 1)]
+    assert _cantidades(usuario) == _cantidades(invitado)
+    assert usuario.diferencia(invitado) == []
@@ -0,0 +1,99 @@
+# tests/test_generadores.py
+import pytest
+from src.generadores import Constante, LogNormal, Uniforme, Zipf, generar_carritos, generar_productos
+
+def _resumen(carritos):
+    return [[(item.producto.nombre, item.cantidad) for item in carrito.items] for carrito in carritos]
+
+def test_misma_semilla_mismos_productos_sin_importar_el_lote():
+    """
+    AAA:
+    Arrange: Se fija una semilla.
+    Act: Se generan productos con dos tamaños de lote distintos y con otra semilla.
+    Assert: Se verifica que la misma semilla da los mismos productos y otra semilla no.
+    """
+    # Arrange
+    semilla = 42
+
+    # Act
+    a = [(p.nombre, p.precio, p.stock) for p in generar_productos(1000, semilla=semilla, lote=64)]
+    b = [(p.nombre, p.precio, p.stock) for p in generar_productos(1000, semilla=semilla, lote=1000)]
+    c = [(p.nombre, p.precio, p.stock) for p in generar_productos(1000, semilla=semilla + 1)]
+
+    # Assert
+    assert a == b
+    assert a != c
+    assert a[0][0] == "SKU00000000"
+
+def test_distribuciones_configurables():
+    """
+    AAA:
+    Arrange: Se definen un precio constante y un stock uniforme acotado.
+    Act: Se generan productos.
+    Assert: Se verifica que los valores respetan las distribuciones.
+    """
+    # Arrange
+    precio, stock = Constante(9.99), Uniforme(3, 4)
+
+    # Act
+    productos = list(generar_productos(500, precio=precio, stock=stock))
+
+    # Assert
+    assert {p.precio for p in productos} == {9.99}
+    assert {p.stock for p in productos} == {3, 4}
+    assert all(p.precio >= 0.01 for p in generar_productos(500, precio=LogNormal(0.01, 3)))
+
+def test_carritos_deterministas_y_dentro_del_stock():
+    """
+    AAA:
+    Arrange: Se generan productos con poco stock.
+    Act: Se generan carritos dos veces con la misma semilla y lotes distintos.
+    Assert: Se verifica que son idénticos y que ninguna línea excede el stock.
+    """
+    # Arrange
+    productos = list(generar_productos(50, stock=Uniforme(1, 3)))
+
+    # Act
+    a = list(generar_carritos(productos, 200, semilla=7, cantidad=Uniforme(1, 5), lote=16))
+    b = list(generar_carritos(productos, 200, semilla=7, cantidad=Uniforme(1, 5), lote=200))
+
+    # Assert
+    assert _resumen(a) == _resumen(b)
+    assert len(a) == 200
+    assert all(item.cantidad <= item.producto.stock for carrito in a for item in carrito.items)
+
+def test_popularidad_zipf_concentra_en_los_primeros():
+    """
+    AAA:
+    Arrange: Se generan 1000 productos.
+    Act: Se generan carritos de una línea con popularidad Zipf.
+    Assert: Se verifica que el primer producto es el más elegido y que los índices están en rango.
+    """
+    # Arrange
+    productos = list(generar_productos(1000, stock=Constante(10**6)))
+
+    # Act
+    carritos = generar_carritos(productos, 2000, lineas=Constante(1), popularidad=Zipf(1.2))
+    elegidos = [carrito.items[0].producto.nombre for carrito in carritos]
+
+    # Assert
+    assert elegidos.count("SKU00000000") > elegidos.count("SKU00000010") * 5
+    assert elegidos.count("SKU00000000") > 2000 * 0.2
+
+def test_parametros_invalidos():
+    """
+    AAA:
+    Arrange: Se generan productos.
+    Act: Se piden carritos con parámetros no válidos.
+    Assert: Se verifica que se lanza ValueError.
+    """
+    # Arrange
+    productos = list(generar_productos(10))
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        next(generar_carritos([], 1))
+    with pytest.raises(ValueError):
+        next(generar_carritos(productos, 1, popularidad=Zipf(-1)))
+    with pytest.raises(ValueError):
+        next(generar_productos(1, stock=Uniforme(5, 1)))
@@ -0,0 +1,140 @@
+# tests/test_importacion.py
+import io
+from collections import defaultdict
+
+import pytest
+from src.carrito import Carrito
+from src.catalogo import Catalogo
+from src.importacion import CSV, JSONL, importar_catalogo, importar_pedidos, leer_filas
+
+CATALOGO_CSV = """nombre,precio,stock
+Laptop,1000.00,3
+Mouse,50.00,10
+Teclado,abc,5
+Monitor,300.00,-1
+,10.00,1
+"""
+
+def test_importar_catalogo_csv_registra_errores_por_fila(tmp_path):
+    """
+    AAA:
+    Arrange: Se escribe un CSV con dos filas válidas y tres inválidas.
+    Act: Se importa el catálogo en lotes de 2 filas.
+    Assert: Se verifica que se importan las válidas y que cada error indica su fila.
+    """
+    # Arrange
+    ruta = tmp_path / "catalogo.csv"
+    ruta.write_text(CATALOGO_CSV, encoding="utf-8")
+    catalogo = Catalogo()
+
+    # Act
+    resultado = importar_catalogo(ruta, catalogo, tamano_lote=2)
+
+    # Assert
+    assert (resultado.filas, resultado.importadas, resultado.fallidas) == (5, 2, 3)
+    assert [error.fila for error in resultado.errores] == [3, 4, 5]
+    assert "precio" in resultado.errores[0].mensaje
+    assert catalogo.obtener("Laptop").stock == 3
+    assert resultado.filas_por_segundo > 0
+
+def test_importar_catalogo_actualiza_productos_existentes():
+    """
+    AAA:
+    Arrange: Se crea un catálogo con un producto que ya está en un carrito.
+    Act: Se importa un JSONL que cambia su precio y stock.
+    Assert: Se verifica que el producto se actualiza y el carrito ve el nuevo total.
+    """
+    # Arrange
+    catalogo = Catalogo()
+    mouse = catalogo.internar("Mouse", 50.00, 10)
+    carrito = Carrito()
+    carrito.agregar_producto(mouse, 2)
+    fuente = io.StringIO('{"nombre": "Mouse", "precio": 40.0, "stock": 20}\n')
+
+    # Act
+    resultado = importar_catalogo(fuente, catalogo, formato=JSONL)
+
+    # Assert
+    assert resultado.importadas == 1
+    assert catalogo.obtener("Mouse") is mouse
+    assert (mouse.precio, mouse.stock) == (40.0, 20)
+    assert carrito.calcular_total() == 80.0
+
+def test_importar_pedidos_agrupa_por_carrito_y_sigue_ante_errores():
+    """
+    AAA:
+    Arrange: Se crea un catálogo y un JSONL de pedidos con una línea sin stock,
+        un producto desconocido y una línea mal formada.
+    Act: Se importan los pedidos.
+    Assert: Se verifica el contenido de cada carrito y los errores por fila.
+    """
+    # Arrange
+    catalogo = Catalogo()
+    catalogo.internar("Laptop", 1000.00, 3)
+    catalogo.internar("Mouse", 50.00, 10)
+    fuente = io.StringIO(
+        '{"carrito": "a", "producto": "Laptop", "cantidad": 2}\n'
+        '{"carrito": "b", "producto": "Mouse", "cantidad": 1}\n'
+        '{"carrito": "a", "producto": "Mouse", "cantidad": 3}\n'
+        '{"carrito": "a", "producto": "Laptop", "cantidad": 2}\n'
+        '{"carrito": "b", "producto": "Tablet", "cantidad": 1}\n'
+        '{"carrito": "b", "producto": "Mouse"\n'
+    )
+    carritos = defaultdict(lambda: Carrito(catalogo=catalogo))
+
+    # Act
+    resultado = importar_pedidos(fuente, catalogo, carritos.__getitem__, formato=JSONL)
+
+    # Assert
+    assert {item.producto.nombre: item.cantidad for item in carritos["a"].items} == {"Laptop": 2, "Mouse": 3}
+    assert {item.producto.nombre: item.cantidad for item in carritos["b"].items} == {"Mouse": 1}
+    assert (resultado.filas, resultado.importadas, resultado.fallidas) == (6, 3, 3)
+    assert sorted(error.fila for error in resultado.errores) == [4, 5, 6]
+
+def test_importar_pedidos_rechaza_cantidad_cero():
+    """
+    AAA:
+    Arrange: Se crea un JSONL con una línea de cantidad cero en un lote que
+        se aplica entero y otra en un lote que cae a la importación fila a fila.
+    Act: Se importan los pedidos.
+    Assert: Se verifica que ambas filas se rechazan y no dejan líneas vacías.
+    """
+    # Arrange
+    catalogo = Catalogo()
+    catalogo.internar("Laptop", 1000.00, 3)
+    catalogo.internar("Mouse", 50.00, 10)
+    fuente = io.StringIO(
+        '{"carrito": "a", "producto": "Laptop", "cantidad": 1}\n'
+        '{"carrito": "a", "producto": "Mouse", "cantidad": 0}\n'
+        '{"carrito": "b", "producto": "Laptop", "cantidad": 5}\n'
+        '{"carrito": "b", "producto": "Mouse", "cantidad": 0}\n'
+    )
+    carritos = defaultdict(lambda: Carrito(catalogo=catalogo))
+
+    # Act
+    resultado = importar_pedidos(fuente, catalogo, carritos.__getitem__, formato=JSONL)
+
+    # Assert
+    assert {item.producto.nombre: item.cantidad for item in carritos["a"].items} == {"Laptop": 1}
+    assert carritos["b"].items == []
+    assert (resultado.importadas, resultado.fallidas) == (1, 3)
+    assert sorted(error.fila for error in resultado.errores) == [2, 3, 4]
+
+def test_max_errores_y_formato_desconocido():
+    """
+    AAA:
+    Arrange: Se crea un CSV con tres filas inválidas.
+    Act: Se importa guardando como máximo un error, y se lee una ruta sin extensión conocida.
+    Assert: Se verifica que se cuentan todos los errores y que el formato desconocido falla.
+    """
+    # Arrange
+    fuente = io.StringIO("nombre,precio,stock\nA,x,1\nB,y,1\nC,z,1\n")
+
+    # Act
+    resultado = importar_catalogo(fuente, Catalogo(), formato=CSV, max_errores=1)
+
+    # Assert
+    assert resultado.fallidas == 3
+    assert len(resultado.errores) == 1
+    with pytest.raises(ValueError):
+        next(leer_filas("datos.txt"))
@@ -0,0 +1,225 @@
+# tests/test_instantaneas.py
+import gc
+
+import pytest
+from src.carrito import Carrito, Producto
+from src.historial import Historial
+from src.inventario import Inventario
+
+def _cantidades(fuente):
+    return {producto.nombre: cantidad for producto, cantidad in fuente}
+
+def _lineas(carrito):
+    return [(item.producto, item.cantidad) for item in carrito.items]
+
+@pytest.fixture
+def productos():
+    return Producto("Laptop", 1000.00, stock=5), Producto("Mouse", 50.00, stock=10), Producto("Teclado", 75.00, stock=10)
+
+@pytest.fixture
+def carrito(productos):
+    laptop, mouse, _ = productos
+    carrito = Carrito()
+    carrito.agregar_productos([(laptop, 1), (mouse, 2)])
+    return carrito
+
+def test_snapshot_comparte_hasta_la_siguiente_modificacion(carrito, productos):
+    """
+    AAA:
+    Arrange: Se crea un carrito con dos productos.
+    Act: Se toma una instantánea y luego se modifica, remueve y vacía el carrito.
+    Assert: Se verifica que la instantánea compartía los items y no ve los cambios posteriores.
+    """
+    # Arrange
+    laptop, mouse, teclado = productos
+
+    # Act
+    instantanea = carrito.snapshot()
+    compartia = instantanea._items is carrito._items
+    carrito.agregar_producto(mouse, 3)
+    carrito.agregar_producto(teclado, 1)
+    carrito.remover_producto(laptop, 1)
+    carrito.vaciar()
+
+    # Assert
+    assert compartia
+    assert carrito.snapshot() is not instantanea
+    assert _cantidades(instantanea) == {"Laptop": 1, "Mouse": 2}
+    assert instantanea.cantidad(mouse) == 2 and instantanea.cantidad(teclado) == 0
+    assert (instantanea.calcular_total(), instantanea.contar_items(), len(instantanea)) == (1100.00, 3, 2)
+
+def test_snapshot_sin_cambios_reusa_la_misma(carrito):
+    """
+    AAA:
+    Arrange: Se crea un carrito.
+    Act: Se toman dos instantáneas sin modificarlo entre ellas.
+    Assert: Se verifica que son el mismo objeto.
+    """
+    # Arrange & Act
+    primera, segunda = carrito.snapshot(), carrito.snapshot()
+
+    # Assert
+    assert primera is segunda
+
+def test_instantaneas_sucesivas_conservan_su_contenido(carrito, productos):
+    """
+    AAA:
+    Arrange: Se crea un carrito y se toma una instantánea.
+    Act: Se modifica, se toma otra instantánea y se vuelve a modificar el mismo item.
+    Assert: Se verifica que cada instantánea conserva la cantidad de su momento.
+    """
+    # Arrange
+    _, mouse, _ = productos
+    primera = carrito.snapshot()
+
+    # Act
+    carrito.actualizar_cantidad(mouse, 5)
+    segunda = carrito.snapshot()
+    carrito.actualizar_cantidad(mouse, 7)
+
+    # Assert
+    assert primera.cantidad(mouse) == 2
+    assert segunda.cantidad(mouse) == 5
+    assert _cantidades(_lineas(carrito))["Mouse"] == 7
+    assert carrito.calcular_total() == 1000.00 + 7 * 50.00
+
+def test_instantanea_antigua_sobrevive_a_la_ultima(carrito, productos):
+    """
+    AAA:
+    Arrange: Se toma una instantánea, se agrega un producto y se toma otra.
+    Act: Se descarta la última instantánea y se vuelve a agregar el producto.
+    Assert: Se verifica que la primera instantánea no ve el cambio.
+    """
+    # Arrange
+    laptop, mouse, _ = productos
+    primera = carrito.snapshot()
+    carrito.agregar_producto(laptop, 1)
+    segunda = carrito.snapshot()
+
+    # Act
+    del segunda
+    gc.collect()
+    carrito.agregar_producto(mouse, 5)
+
+    # Assert
+    assert (primera.cantidad(laptop), primera.cantidad(mouse)) == (1, 2)
+    assert _cantidades(_lineas(carrito)) == {"Laptop": 2, "Mouse": 7}
+
+def test_restaurar_aplica_solo_la_diferencia(productos):
+    """
+    AAA:
+    Arrange: Se crea un carrito con inventario y se toma una instantánea.
+    Act: Se modifica el carrito y se restaura la instantánea.
+    Assert: Se verifica el contenido, las reservas y que solo se aplicaron los cambios.
+    """
+    # Arrange
+    laptop, mouse, teclado = productos
+    inventario = Inventario()
+    carrito = Carrito(inventario=inventario)
+    carrito.agregar_productos([(laptop, 1), (mouse, 2)])
+    instantanea = carrito.snapshot()
+    carrito.agregar_producto(teclado, 4)
+    carrito.actualizar_cantidad(mouse, 6)
+
+    # Act
+    operaciones = carrito.restaurar(instantanea)
+
+    # Assert
+    assert len(operaciones) == 2
+    assert _cantidades(_lineas(carrito)) == {"Laptop": 1, "Mouse": 2}
+    assert inventario.reservado(teclado) == 0
+    assert inventario.reservado(mouse) == 2
+
+def test_historial_deshacer_rehacer(carrito, productos):
+    """
+    AAA:
+    Arrange: Se crea un historial sobre un carrito.
+    Act: Se hacen tres cambios, se deshacen dos y se rehace uno.
+    Assert: Se verifica el contenido tras cada paso y que un cambio nuevo borra lo rehacible.
+    """
+    # Arrange
+    laptop, mouse, teclado = productos
+    historial = Historial(carrito)
+    inicial = _cantidades(_lineas(carrito))
+
+    # Act
+    carrito.agregar_producto(teclado, 2)
+    carrito.actualizar_cantidad(mouse, 5)
+    carrito.remover_producto(laptop, 1)
+    historial.deshacer()
+    historial.deshacer()
+    intermedio = _cantidades(_lineas(carrito))
+    historial.rehacer()
+
+    # Assert
+    assert intermedio == {**inicial, "Teclado": 2}
+    assert _cantidades(_lineas(carrito)) == {"Laptop": 1, "Mouse": 5, "Teclado": 2}
+    assert historial.puede_rehacer()
+    carrito.agregar_producto(mouse, 1)
+    assert not historial.puede_rehacer()
+    with pytest.raises(ValueError):
+        historial.rehacer()
+
+def test_historial_agrupa_vaciar_y_lotes(carrito, productos):
+    """
+    AAA:
+    Arrange: Se crea un historial sobre un carrito.
+    Act: Se vacía el carrito y se agrega un lote agrupado; luego se deshacen ambos pasos.
+    Assert: Se verifica que cada acción se deshace en un único paso.
+    """
+    # Arrange
+    laptop, mouse, teclado = productos
+    historial = Historial(carrito)
+    inicial = _cantidades(_lineas(carrito))
+
+    # Act
+    carrito.vaciar()
+    with historial.agrupar():
+        carrito.agregar_productos([(teclado, 1), (mouse, 1)])
+        carrito.actualizar_cantidad(teclado, 3)
+    historial.deshacer()
+    vacio = _lineas(carrito)
+    historial.deshacer()
+
+    # Assert
+    assert vacio == []
+    assert _cantidades(_lineas(carrito)) == inicial
+    assert not historial.puede_deshacer()
+
+def test_historial_acotado(productos):
+    """
+    AAA:
+    Arrange: Se crea un historial de 2 pasos.
+    Act: Se hacen tres cambios.
+    Assert: Se verifica que solo se pueden deshacer los dos últimos.
+    """
+    # Arrange
+    _, mouse, _ = productos
+    carrito = Carrito()
+    historial = Historial(carrito, maximo=2)
+
+    # Act
+    for _ in range(3):
+        carrito.agregar_producto(mouse, 1)
+    historial.deshacer()
+    historial.deshacer()
+
+    # Assert
+    assert _cantidades(_lineas(carrito)) == {"Mouse": 1}
+    assert not historial.puede_deshacer()
+
+def test_instantanea_es_de_solo_lectura(carrito):
+    """
+    AAA:
+    Arrange: Se toma una instantánea del carrito.
+    Act: Se intenta cambiar su total, su cantidad y su versión.
+    Assert: Se verifica que los atributos no cambian.
+    """
+    # Arrange
+    instantanea = carrito.snapshot()
+
+    # Act & Assert
+    for atributo in ("total", "cantidad_total", "version"):
+        with pytest.raises(AttributeError):
+            setattr(instantanea, atributo, 0)
+    assert (instantanea.total, instantanea.cantidad_total, instantanea.version) == (1100.00, 3, carrito.version)
@@ -0,0 +1,105 @@
+# tests/test_instrumentacion.py
+import pytest
+from src import instrumentacion
+from src.carrito import Carrito, Producto
+
+@pytest.fixture(autouse=True)
+def metricas_limpias():
+    instrumentacion.reiniciar()
+    yield
+    while instrumentacion.activa():
+        instrumentacion.desactivar()
+    instrumentacion.reiniciar()
+
+def test_desactivada_no_envuelve_los_metodos():
+    """
+    AAA:
+    Arrange: Se guarda el método original de Carrito.
+    Act: Se activa y se desactiva la instrumentación, y se usa un carrito.
+    Assert: Se verifica que el método original se restauró y que no se registró nada.
+    """
+    # Arrange
+    original = Carrito.__dict__["agregar_producto"]
+
+    # Act
+    instrumentacion.activar()
+    envuelto = Carrito.__dict__["agregar_producto"]
+    instrumentacion.desactivar()
+    Carrito().agregar_producto(Producto("Mouse", 50.00, stock=5), 1)
+
+    # Assert
+    assert envuelto is not original
+    assert Carrito.__dict__["agregar_producto"] is original
+    assert instrumentacion.instantanea() == {}
+
+def test_registra_llamadas_errores_y_tamano():
+    """
+    AAA:
+    Arrange: Se activa la instrumentación y se crea un carrito.
+    Act: Se agregan dos productos, se calcula el total y se falla una remoción.
+    Assert: Se verifica el conteo de llamadas, errores y la distribución de líneas.
+    """
+    # Arrange
+    instrumentacion.activar()
+    carrito = Carrito()
+
+    # Act
+    carrito.agregar_producto(Producto("Mouse", 50.00, stock=5), 1)
+    carrito.agregar_producto(Producto("Teclado", 75.00, stock=5), 2)
+    carrito.calcular_total()
+    with pytest.raises(ValueError):
+        carrito.remover_producto(Producto("Monitor", 300.00, stock=5))
+    metricas = instrumentacion.instantanea()
+
+    # Assert
+    assert metricas["agregar_producto"]["llamadas"] == 2
+    assert metricas["agregar_producto"]["errores"] == 0
+    assert metricas["agregar_producto"]["lineas"] == 3
+    assert metricas["agregar_producto"]["tamano"][1] == 1
+    assert metricas["agregar_producto"]["tamano"][5] == 1
+    assert metricas["calcular_total"]["llamadas"] == 1
+    assert metricas["remover_producto"]["errores"] == 1
+    assert sum(metricas["calcular_total"]["latencia"].values()) == 1
+
+def test_exportar_prometheus():
+    """
+    AAA:
+    Arrange: Se activa la instrumentación y se agrega un producto a un carrito.
+    Act: Se exportan las métricas en formato Prometheus.
+    Assert: Se verifica el contador y que el histograma es acumulativo y cierra en +Inf.
+    """
+    # Arrange
+    instrumentacion.activar()
+    Carrito().agregar_producto(Producto("Mouse", 50.00, stock=5), 1)
+
+    # Act
+    texto = instrumentacion.exportar_prometheus()
+
+    # Assert
+    assert 'carrito_llamadas_total{metodo="agregar_producto"} 1' in texto
+    assert "# TYPE carrito_latencia_segundos histogram" in texto
+    assert 'carrito_latencia_segundos_bucket{metodo="agregar_producto",le="+Inf"} 1' in texto
+    assert 'carrito_lineas_bucket{metodo="agregar_producto",le="0"} 0' in texto
+    assert 'carrito_lineas_bucket{metodo="agregar_producto",le="1"} 1' in texto
+    assert 'carrito_lineas_sum{metodo="agregar_producto"} 1' in texto
+
+def test_perfilar_aisla_las_operaciones_del_bloque():
+    """
+    AAA:
+    Arrange: Se crea un carrito con un producto fuera de cualquier perfil.
+    Act: Se perfila un bloque que calcula el total dos veces.
+    Assert: Se verifica que el perfil solo ve el bloque y que al salir se desactiva.
+    """
+    # Arrange
+    carrito = Carrito()
+    carrito.agregar_producto(Producto("Mouse", 50.00, stock=5), 1)
+
+    # Act
+    with instrumentacion.perfilar() as perfil:
+        carrito.calcular_total()
+        carrito.calcular_total()
+
+    # Assert
+    assert list(perfil.instantanea()) == ["calcular_total"]
+    assert perfil.instantanea()["calcular_total"]["llamadas"] == 2
+    assert not instrumentacion.activa()
@@ -0,0 +1,170 @@
+# tests/test_inventario.py
+import random
+import threading
+
+import pytest
+from src.carrito import Carrito, Producto
+from src.inventario import Inventario
+
+def test_carritos_no_pueden_reservar_mas_que_el_stock():
+    """
+    AAA:
+    Arrange: Se crea un inventario compartido y dos carritos.
+    Act: El primer carrito reserva casi todo el stock y el segundo intenta reservar más.
+    Assert: Se verifica que el segundo carrito recibe ValueError y el stock disponible es correcto.
+    """
+    # Arrange
+    inventario = Inventario()
+    producto = Producto("Smartphone", 800.00, stock=5)
+    carrito1, carrito2 = Carrito(inventario), Carrito(inventario)
+
+    # Act
+    carrito1.agregar_producto(producto, cantidad=4)
+
+    # Assert
+    with pytest.raises(ValueError):
+        carrito2.agregar_producto(producto, cantidad=2)
+    carrito2.agregar_producto(producto, cantidad=1)
+    assert inventario.disponible(producto) == 0
+
+@pytest.mark.parametrize("liberar", [
+    lambda carrito, producto: carrito.remover_producto(producto, cantidad=3),
+    lambda carrito, producto: carrito.actualizar_cantidad(producto, 1),
+    lambda carrito, producto: carrito.vaciar(),
+])
+def test_carrito_libera_reservas(liberar):
+    """
+    AAA:
+    Arrange: Se crea un carrito con inventario que reserva 4 unidades.
+    Act: Se remueve, actualiza o vacía el carrito.
+    Assert: Se verifica que lo reservado coincide con lo que queda en el carrito.
+    """
+    # Arrange
+    inventario = Inventario()
+    producto = Producto("Tablet", 500.00, stock=10)
+    carrito = Carrito(inventario)
+    carrito.agregar_producto(producto, cantidad=4)
+
+    # Act
+    liberar(carrito, producto)
+
+    # Assert
+    assert inventario.reservado(producto, carrito) == carrito.contar_items()
+    assert inventario.disponible(producto) == 10 - carrito.contar_items()
+
+def test_lote_con_inventario_es_atomico():
+    """
+    AAA:
+    Arrange: Se crea un inventario con dos productos y un carrito.
+    Act: Se agrega un lote en el que el segundo producto no alcanza.
+    Assert: Se verifica que no queda ninguna reserva del lote.
+    """
+    # Arrange
+    inventario = Inventario()
+    laptop = Producto("Laptop", 1000.00, stock=5)
+    mouse = Producto("Mouse", 50.00, stock=1)
+    carrito = Carrito(inventario)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        carrito.agregar_productos([(laptop, 2), (mouse, 2)])
+    assert inventario.disponible(laptop) == 5
+    assert carrito.obtener_items() == []
+
+def test_reservas_expiran():
+    """
+    AAA:
+    Arrange: Se crea un inventario con reservas de 30 segundos y un reloj controlado.
+    Act: Se avanza el reloj y se liberan las reservas expiradas.
+    Assert: Se verifica que el stock vuelve a estar disponible y que el carrito ya no tiene esas unidades.
+    """
+    # Arrange
+    ahora = [0.0]
+    inventario = Inventario(ttl=30, reloj=lambda: ahora[0])
+    producto = Producto("Monitor", 300.00, stock=3)
+    carrito = Carrito(inventario)
+    carrito.agregar_producto(producto, cantidad=3)
+    eventos = []
+    carrito.suscribir(eventos.append)
+
+    # Act
+    ahora[0] = 10.0
+    sin_expirar = inventario.liberar_expiradas()
+    ahora[0] = 31.0
+    expiradas = inventario.liberar_expiradas()
+
+    # Assert
+    assert (sin_expirar, expiradas) == (0, 3)
+    assert inventario.disponible(producto) == 3
+    assert (len(carrito), carrito.calcular_total(), carrito.contar_items()) == (0, 0, 0)
+    assert [type(evento).__name__ for evento in eventos] == ["ItemRemovido"]
+
+
+def test_reserva_expirada_no_permite_vender_dos_veces():
+    """
+    AAA:
+    Arrange: Un carrito reserva todo el stock y su reserva expira; otro carrito lo reserva después.
+    Act: El primer carrito intenta volver a agregar el producto.
+    Assert: Se verifica que no puede, porque ya no tiene la línea ni hay stock libre.
+    """
+    # Arrange
+    ahora = [0.0]
+    inventario = Inventario(ttl=30, reloj=lambda: ahora[0])
+    producto = Producto("Monitor", 300.00, stock=3)
+    primero = Carrito(inventario)
+    segundo = Carrito(inventario)
+    primero.agregar_producto(producto, cantidad=2)
+    primero.agregar_producto(Producto("Mouse", 20.00, stock=5), cantidad=1)
+    ahora[0] = 31.0
+    inventario.liberar_expiradas()
+    segundo.agregar_producto(producto, cantidad=3)
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        primero.agregar_producto(producto, cantidad=2)
+    assert len(primero) == 0
+    assert inventario.reservado(producto) == inventario.reservado(producto, segundo) == 3
+
+def test_estres_muchos_hilos_sobre_productos_populares():
+    """
+    AAA:
+    Arrange: Se crea un inventario con pocos productos de stock escaso.
+    Act: Muchos hilos, cada uno con su carrito, agregan y remueven los mismos productos.
+    Assert: Se verifica que nunca se reserva más que el stock y que las reservas cuadran con los carritos.
+    """
+    # Arrange
+    inventario = Inventario(franjas=4)
+    productos = [Producto(f"Hot{i}", 10.00, stock=25) for i in range(3)]
+    carritos = [Carrito(inventario) for _ in range(32)]
+    errores = []
+
+    def trabajar(carrito, semilla):
+        rng = random.Random(semilla)
+        try:
+            for _ in range(300):
+                producto = rng.choice(productos)
+                try:
+                    if rng.random() < 0.6:
+                        carrito.agregar_producto(producto, cantidad=rng.randint(1, 3))
+                    else:
+                        carrito.remover_producto(producto, cantidad=1)
+                except ValueError:
+                    pass
+                if inventario.disponible(producto) < 0:
+                    errores.append("sobreventa")
+        except Exception as error:  # pragma: no cover - se reporta abajo
+            errores.append(error)
+
+    hilos = [threading.Thread(target=trabajar, args=(c, i)) for i, c in enumerate(carritos)]
+
+    # Act
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    # Assert
+    assert errores == []
+    for producto in productos:
+        en_carritos = sum(i.cantidad for c in carritos for i in c.obtener_items() if i.producto is producto)
+        assert en_carritos == inventario.reservado(producto) <= producto.stock
@@ -0,0 +1,94 @@
+# tests/test_lote.py
+import pytest
+from src.carrito import Carrito, Producto, Operacion, AGREGAR, REMOVER, ACTUALIZAR
+
+def test_agregar_productos_combina_duplicados():
+    """
+    AAA:
+    Arrange: Se crea un carrito y dos productos.
+    Act: Se agregan en lote, repitiendo uno de ellos.
+    Assert: Se verifica que las cantidades se combinan en un solo item.
+    """
+    # Arrange
+    carrito = Carrito()
+    laptop = Producto("Laptop", 1000.00, stock=3)
+    mouse = Producto("Mouse", 50.00, stock=10)
+
+    # Act
+    carrito.agregar_productos([(laptop, 1), (mouse, 4), (laptop, 2)])
+
+    # Assert
+    items = carrito.obtener_items()
+    assert [(i.producto.nombre, i.cantidad) for i in items] == [("Laptop", 3), ("Mouse", 4)]
+    assert carrito.calcular_total() == 3200.00
+    assert carrito.contar_items() == 7
+
+def test_agregar_productos_es_atomico():
+    """
+    AAA:
+    Arrange: Se crea un carrito con un producto y otro producto de stock limitado.
+    Act: Se intenta agregar un lote cuyo último elemento excede el stock.
+    Assert: Se verifica que se lanza ValueError y el carrito no cambia.
+    """
+    # Arrange
+    carrito = Carrito()
+    laptop = Producto("Laptop", 1000.00, stock=3)
+    mouse = Producto("Mouse", 50.00, stock=2)
+    carrito.agregar_producto(mouse, cantidad=1)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        carrito.agregar_productos([(laptop, 1), (mouse, 1), (mouse, 1)])
+    assert [(i.producto.nombre, i.cantidad) for i in carrito.obtener_items()] == [("Mouse", 1)]
+    assert carrito.calcular_total() == 50.00
+
+@pytest.mark.parametrize("operaciones, esperado", [
+    ([(AGREGAR, "Mouse", 2), (REMOVER, "Laptop", 1)], [("Laptop", 1), ("Mouse", 3)]),
+    ([(ACTUALIZAR, "Laptop", 0), (AGREGAR, "Teclado", 1)], [("Mouse", 1), ("Teclado", 1)]),
+    ([(REMOVER, "Mouse", 1), (AGREGAR, "Mouse", 5)], [("Laptop", 2), ("Mouse", 5)]),
+])
+def test_aplicar_operaciones_mixtas(operaciones, esperado):
+    """
+    AAA:
+    Arrange: Se crea un carrito con dos productos.
+    Act: Se aplica un lote de operaciones mixtas.
+    Assert: Se verifica el contenido final del carrito.
+    """
+    # Arrange
+    productos = {
+        "Laptop": Producto("Laptop", 1000.00, stock=5),
+        "Mouse": Producto("Mouse", 50.00, stock=5),
+        "Teclado": Producto("Teclado", 75.00, stock=5),
+    }
+    carrito = Carrito()
+    carrito.agregar_producto(productos["Laptop"], cantidad=2)
+    carrito.agregar_producto(productos["Mouse"], cantidad=1)
+
+    # Act
+    carrito.aplicar_operaciones(Operacion(t, productos[n], c) for t, n, c in operaciones)
+
+    # Assert
+    assert [(i.producto.nombre, i.cantidad) for i in carrito.obtener_items()] == esperado
+    assert carrito.calcular_total() == sum(productos[n].precio * c for n, c in esperado)
+
+@pytest.mark.parametrize("operacion", [
+    (REMOVER, 1),
+    (ACTUALIZAR, 3),
+    ("vender", 1),
+])
+def test_aplicar_operaciones_invalidas(operacion):
+    """
+    AAA:
+    Arrange: Se crea un carrito vacío.
+    Act: Se aplica una operación que no puede realizarse.
+    Assert: Se verifica que se lanza ValueError.
+    """
+    # Arrange
+    carrito = Carrito()
+    producto = Producto("Monitor", 300.00, stock=5)
+    tipo, cantidad = operacion
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        carrito.aplicar_operaciones([(tipo, producto, cantidad)])
+    assert carrito.obtener_items() == []
@@ -0,0 +1,94 @@
+# tests/test_ordenamiento.py
+import random
+
+import pytest
+from src.carrito import Carrito, Producto
+from src.carrito_columnar import CarritoColumnar
+
+CRITERIOS = {
+    "precio": lambda item: item.producto.precio,
+    "nombre": lambda item: item.producto.nombre.casefold(),
+    "total": lambda item: item.total(),
+    "cantidad": lambda item: item.cantidad,
+}
+
+def _nombres(items):
+    return [item.producto.nombre for item in items]
+
+@pytest.mark.parametrize("criterio", list(CRITERIOS))
+def test_orden_incremental_equivale_a_sorted(criterio):
+    """
+    AAA:
+    Arrange: Se crea un carrito y se pide un orden para activar la vista incremental.
+    Act: Se modifica el carrito con agregados, remociones, actualizaciones y cambios de precio.
+    Assert: Se verifica que el orden mantenido coincide con sorted() en cada paso.
+    """
+    # Arrange
+    rng = random.Random(11)
+    productos = [Producto(f"{rng.choice('abcXYZ')}prod{i}", rng.randint(1, 20), stock=30) for i in range(40)]
+    carrito = Carrito()
+    carrito.obtener_items_ordenados(criterio)
+
+    for paso in range(600):
+        # Act
+        producto = rng.choice(productos)
+        accion = rng.random()
+        try:
+            if accion < 0.5:
+                carrito.agregar_producto(producto, rng.randint(1, 3))
+            elif accion < 0.7:
+                carrito.remover_producto(producto, 1)
+            elif accion < 0.85:
+                carrito.actualizar_cantidad(producto, rng.randint(0, 5))
+            else:
+                producto.precio = rng.randint(1, 20)
+        except ValueError:
+            pass
+
+        # Assert
+        esperado = sorted(carrito.obtener_items(), key=CRITERIOS[criterio])
+        assert _nombres(carrito.obtener_items_ordenados(criterio)) == _nombres(esperado)
+
+@pytest.mark.parametrize("clase", [Carrito, CarritoColumnar])
+def test_paginas_y_top_k(clase):
+    """
+    AAA:
+    Arrange: Se crea un carrito con productos de precios distintos.
+    Act: Se piden páginas ascendentes, descendentes y el top 3.
+    Assert: Se verifica que cada página es el tramo correspondiente del orden completo.
+    """
+    # Arrange
+    carrito = clase()
+    precios = [30, 10, 50, 20, 40, 60, 5]
+    carrito.agregar_productos((Producto(f"P{p}", p, stock=10), i + 1) for i, p in enumerate(precios))
+    ascendente = [f"P{p}" for p in sorted(precios)]
+
+    # Act & Assert
+    assert _nombres(carrito.obtener_items_ordenados("precio", offset=2, limit=3)) == ascendente[2:5]
+    assert _nombres(carrito.obtener_items_ordenados("precio", offset=5, limit=10)) == ascendente[5:]
+    assert _nombres(carrito.obtener_items_ordenados("precio", offset=1, limit=2, descendente=True)) == ascendente[::-1][1:3]
+    assert _nombres(carrito.top_k("precio", 3)) == ascendente[::-1][:3]
+    assert _nombres(carrito.top_k("cantidad", 2, descendente=False)) == ["P30", "P10"]
+    assert _nombres(carrito.top_k("total", 1)) == ["P60"]
+    with pytest.raises(ValueError):
+        carrito.top_k("stock", 2)
+
+def test_vaciar_descarta_orden(producto_smartphone, producto_mochila):
+    """
+    AAA:
+    Arrange: Se crea un carrito con dos productos y se pide el orden por nombre.
+    Act: Se vacía el carrito y se agrega un solo producto.
+    Assert: Se verifica que el orden solo contiene el nuevo producto.
+    """
+    # Arrange
+    carrito = Carrito()
+    carrito.agregar_producto(producto_smartphone)
+    carrito.agregar_producto(producto_mochila)
+    carrito.obtener_items_ordenados("nombre")
+
+    # Act
+    carrito.vaciar()
+    carrito.agregar_producto(producto_mochila)
+
+    # Assert
+    assert _nombres(carrito.obtener_items_ordenados("nombre")) == ["Mochila"]
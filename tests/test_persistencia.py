@@ -0,0 +1,113 @@
+# tests/test_persistencia.py
+import os
+
+from src.carrito import Producto
+from src.catalogo import Catalogo
+from src.persistencia import DiarioCarritos
+
+def _contenido(carrito):
+    return [(item.producto.nombre, item.cantidad) for item in carrito.obtener_items()]
+
+def _llenar(diario):
+    laptop = Producto("Laptop", 1000.00, stock=10)
+    mouse = Producto("Mouse", 50.00, stock=10)
+    carrito1, carrito2 = diario.carrito(1), diario.carrito(2)
+    carrito1.agregar_producto(laptop, cantidad=2)
+    carrito1.agregar_productos([(mouse, 3), (laptop, 1)])
+    carrito1.remover_producto(mouse, cantidad=1)
+    carrito2.agregar_producto(mouse, cantidad=5)
+    carrito2.actualizar_cantidad(mouse, 4)
+    return laptop, mouse
+
+def test_recuperar_solo_desde_diario(tmp_path):
+    """
+    AAA:
+    Arrange: Se crean carritos persistentes y se modifican.
+    Act: Se cierra el diario y se recupera desde otro proceso simulado.
+    Assert: Se verifica que el contenido y los totales coinciden.
+    """
+    # Arrange
+    diario = DiarioCarritos(tmp_path, fsync_cada=2)
+    _llenar(diario)
+    esperado = {i: _contenido(c) for i, c in diario.carritos().items()}
+    diario.cerrar()
+
+    # Act
+    recuperados = DiarioCarritos(tmp_path).recuperar()
+
+    # Assert
+    assert {i: _contenido(c) for i, c in recuperados.items()} == esperado
+    assert recuperados[1].calcular_total() == 3100.00
+
+def test_recuperar_instantanea_mas_cola(tmp_path):
+    """
+    AAA:
+    Arrange: Se modifican carritos, se compacta y se hacen más cambios.
+    Act: Se recupera con un catálogo.
+    Assert: Se verifica el estado final y que los productos quedan internados.
+    """
+    # Arrange
+    diario = DiarioCarritos(tmp_path)
+    laptop, mouse = _llenar(diario)
+    diario.compactar()
+    diario.carrito(2).vaciar()
+    diario.carrito(3).agregar_producto(laptop, cantidad=1)
+    diario.carrito(1).remover_producto(laptop, cantidad=3)
+    diario.cerrar()
+    catalogo = Catalogo()
+
+    # Act
+    recuperados = DiarioCarritos(tmp_path, catalogo=catalogo).recuperar()
+
+    # Assert
+    assert sorted(os.listdir(tmp_path)) == ["diario.1.log", "instantanea.bin"]
+    assert {i: _contenido(c) for i, c in recuperados.items()} == {1: [("Mouse", 2)], 3: [("Laptop", 1)]}
+    assert recuperados[3].obtener_items()[0].producto is catalogo.obtener("Laptop")
+
+def test_recuperar_ignora_registro_truncado(tmp_path):
+    """
+    AAA:
+    Arrange: Se escribe un diario y se corta el último registro a la mitad.
+    Act: Se recupera y se siguen registrando cambios.
+    Assert: Se verifica que se descarta el registro incompleto y los nuevos se leen bien.
+    """
+    # Arrange
+    diario = DiarioCarritos(tmp_path, compactar_cada=1000)
+    laptop, mouse = _llenar(diario)
+    diario.cerrar()
+    ruta = tmp_path / "diario.0.log"
+    ruta.write_bytes(ruta.read_bytes()[:-3])
+
+    # Act
+    diario = DiarioCarritos(tmp_path)
+    recuperados = diario.recuperar()
+    recuperados[2].agregar_producto(mouse, cantidad=1)
+    diario.cerrar()
+
+    # Assert
+    assert _contenido(recuperados[2]) == [("Mouse", 6)]
+    assert _contenido(DiarioCarritos(tmp_path).recuperar()[2]) == [("Mouse", 6)]
+
+def test_recuperar_usa_el_ultimo_precio_registrado(tmp_path):
+    """
+    AAA:
+    Arrange: Se agrega un producto, se sube su precio y se agrega otra unidad.
+    Act: Se cierra el diario y se recupera.
+    Assert: Se verifica que el carrito recuperado usa el precio y stock más recientes.
+    """
+    # Arrange
+    diario = DiarioCarritos(tmp_path)
+    mouse = Producto("Mouse", 50.00, stock=10)
+    carrito = diario.carrito(1)
+    carrito.agregar_producto(mouse, cantidad=1)
+    mouse.precio = 60.00
+    mouse.stock = 8
+    carrito.agregar_producto(mouse, cantidad=1)
+    diario.cerrar()
+
+    # Act
+    recuperado = DiarioCarritos(tmp_path).recuperar()[1]
+
+    # Assert
+    assert recuperado.calcular_total() == 120.00
+    assert recuperado.obtener_items()[0].producto.stock == 8
@@ -0,0 +1,53 @@
+# tests/test_precios_masivos.py
+import pytest
+from src.carrito import Carrito, Producto
+from src.carrito_columnar import CarritoColumnar
+from src.precios_masivos import EspecificacionPrecio, precio_desde_total, repreciar_carritos
+
+def _carritos(n):
+    carritos = []
+    for i in range(n):
+        carrito = CarritoColumnar() if i % 2 else Carrito()
+        for j in range(i % 7 + 1):
+            carrito.agregar_producto(Producto(f"P{j}", 10.0 * (j + 1) + i, stock=50), cantidad=j + 1)
+        carritos.append(carrito)
+    return carritos
+
+@pytest.mark.parametrize("procesos", [1, 2])
+def test_repreciar_coincide_con_carrito(procesos):
+    """
+    AAA:
+    Arrange: Se crean varios carritos y una especificación de precios.
+    Act: Se repreciarán en lote usando uno o varios procesos.
+    Assert: Se verifica que los resultados llegan en orden y coinciden con los métodos de Carrito.
+    """
+    # Arrange
+    carritos = _carritos(40)
+    especificacion = EspecificacionPrecio(descuento=0, cupon_porcentaje=20, cupon_maximo=50, impuesto=18)
+
+    # Act
+    resultados = list(repreciar_carritos(iter(carritos), especificacion, procesos=procesos, tamano_lote=3))
+
+    # Assert
+    assert len(resultados) == len(carritos)
+    for carrito, resultado in zip(carritos, resultados):
+        assert resultado.total == pytest.approx(carrito.calcular_total())
+        assert resultado.total_cupon == pytest.approx(carrito.aplicar_cupon(20, 50))
+        assert resultado.impuestos == pytest.approx(carrito.aplicar_cupon(20, 50) * 0.18)
+        assert resultado == precio_desde_total(carrito.calcular_total(), especificacion)
+
+@pytest.mark.parametrize("especificacion", [
+    EspecificacionPrecio(descuento=-1),
+    EspecificacionPrecio(impuesto=101),
+    EspecificacionPrecio(cupon_porcentaje=10, cupon_maximo=-5),
+])
+def test_repreciar_especificacion_invalida(especificacion):
+    """
+    AAA:
+    Arrange: Se prepara una especificación fuera de rango.
+    Act: Se solicita repreciar.
+    Assert: Se verifica que se lanza ValueError de inmediato.
+    """
+    # Act & Assert
+    with pytest.raises(ValueError):
+        repreciar_carritos([], especificacion)
@@ -0,0 +1,88 @@
+# tests/test_promociones.py
+import pytest
+from src.carrito import Carrito, Producto
+from src.carrito_columnar import CarritoColumnar
+from src.promociones import Cupon, DescuentoCondicional, DescuentoProducto, Impuesto, compilar
+
+def _carrito(clase=Carrito):
+    carrito = clase()
+    carrito.agregar_productos([
+        (Producto("Impresora", 200.00, stock=5), 2),  # 400
+        (Producto("Mouse", 50.00, stock=5), 2),  # 100
+    ])
+    return carrito
+
+@pytest.mark.parametrize("clase", [Carrito, CarritoColumnar])
+def test_pipeline_equivale_a_metodos_encadenados(clase):
+    """
+    AAA:
+    Arrange: Se crea un carrito de total 500 y un pipeline de descuento condicional, cupón e impuesto.
+    Act: Se evalúa el pipeline.
+    Assert: Se verifica que coincide con aplicar las reglas una tras otra.
+    """
+    # Arrange
+    carrito = _carrito(clase)
+    precio = compilar([DescuentoCondicional(10, minimo=500), Cupon(20, maximo=50), Impuesto(18)])
+
+    # Act
+    cotizacion = precio(carrito)
+
+    # Assert
+    con_descuento = carrito.aplicar_descuento_condicional(10, 500)  # 450
+    con_cupon = con_descuento - min(con_descuento * 0.2, 50)  # 400
+    assert cotizacion.subtotal == 500.00
+    assert cotizacion.descuento == pytest.approx(500.00 - con_cupon)
+    assert cotizacion.impuestos == pytest.approx(con_cupon * 0.18)
+    assert cotizacion.total == pytest.approx(con_cupon * 1.18)
+
+def test_reglas_por_producto():
+    """
+    AAA:
+    Arrange: Se crea un carrito y un pipeline con descuento sobre un solo producto.
+    Act: Se evalúa el pipeline.
+    Assert: Se verifica que el descuento solo afecta a la línea de ese producto.
+    """
+    # Arrange
+    carrito = _carrito()
+    precio = compilar([DescuentoProducto("Mouse", 50), Impuesto(10)])
+
+    # Act
+    cotizacion = precio(carrito)
+
+    # Assert
+    assert cotizacion.descuento == 50.00
+    assert cotizacion.total == pytest.approx(450.00 * 1.1)
+
+def test_resultado_memorizado_por_version():
+    """
+    AAA:
+    Arrange: Se crea un carrito y un pipeline y se cotiza una vez.
+    Act: Se cotiza de nuevo sin cambios, y luego tras cambiar un precio.
+    Assert: Se verifica que sin cambios se reutiliza el resultado y con cambios se recalcula.
+    """
+    # Arrange
+    carrito = _carrito()
+    precio = compilar([Cupon(10, maximo=1000)])
+    primera = precio(carrito)
+
+    # Act
+    segunda = precio(carrito)
+    carrito.obtener_items()[1].producto.precio = 100.00
+    tercera = precio(carrito)
+
+    # Assert
+    assert segunda is primera
+    assert tercera.subtotal == 600.00 and tercera.total == pytest.approx(540.00)
+
+@pytest.mark.parametrize("regla", [
+    Impuesto(120),
+    Cupon(-1, 10),
+    DescuentoProducto("Mouse", 101),
+    "descuento",
+])
+def test_reglas_invalidas(regla):
+    """
+    Red: Se espera que compilar rechace reglas fuera de rango o desconocidas.
+    """
+    with pytest.raises(ValueError):
+        compilar([regla])
@@ -0,0 +1,168 @@
+# tests/test_servicio_async.py
+import asyncio
+import threading
+
+import pytest
+from src.carrito import AGREGAR, Producto
+from src.carrito_columnar import CarritoColumnar
+from src.precios_masivos import EspecificacionPrecio, precio_desde_total
+from src.servicio_async import ServicioCarritos
+
+def test_mutaciones_concurrentes_se_serializan_por_carrito():
+    """
+    AAA:
+    Arrange: Se crea un servicio y un producto con stock para 100 unidades.
+    Act: Se lanzan 150 agregados concurrentes de una unidad sobre el mismo carrito.
+    Assert: Se verifica que exactamente 100 tienen éxito y el resto falla por stock.
+    """
+    # Arrange
+    servicio = ServicioCarritos()
+    producto = Producto("Mouse", 50.00, stock=100)
+
+    # Act
+    async def escenario():
+        return await asyncio.gather(
+            *(servicio.agregar_producto("c1", producto, 1) for _ in range(150)), return_exceptions=True
+        )
+    resultados = asyncio.run(escenario())
+
+    # Assert
+    assert sum(isinstance(r, ValueError) for r in resultados) == 50
+    assert servicio.carrito("c1").contar_items() == 100
+
+def test_cotizaciones_concurrentes_se_calculan_una_vez():
+    """
+    AAA:
+    Arrange: Se crea un carrito en el servicio y una regla que cuenta sus cálculos.
+    Act: Se piden 20 cotizaciones concurrentes, luego se modifica el carrito y se cotiza de nuevo.
+    Assert: Se verifica que hubo un cálculo por versión y que todos reciben el mismo resultado.
+    """
+    # Arrange
+    servicio = ServicioCarritos()
+    producto = Producto("Laptop", 1000.00, stock=10)
+    llamadas = []
+    def regla(carrito):
+        llamadas.append(carrito.version)
+        return carrito.calcular_total()
+
+    # Act
+    async def escenario():
+        await servicio.agregar_producto("c1", producto, 1)
+        primeras = await asyncio.gather(*(servicio.cotizar("c1", regla) for _ in range(20)))
+        await servicio.agregar_producto("c1", producto, 1)
+        return primeras, await servicio.cotizar("c1", regla)
+    primeras, despues = asyncio.run(escenario())
+
+    # Assert
+    assert primeras == [1000.00] * 20
+    assert despues == 2000.00
+    assert len(llamadas) == 2
+
+def test_cotizar_con_especificacion_y_errores():
+    """
+    AAA:
+    Arrange: Se crea un carrito en el servicio.
+    Act: Se cotiza con una especificación válida y con una inválida.
+    Assert: Se verifica el resultado y que la inválida lanza ValueError.
+    """
+    # Arrange
+    servicio = ServicioCarritos()
+    especificacion = EspecificacionPrecio(descuento=10, impuesto=18)
+
+    # Act
+    async def escenario():
+        await servicio.agregar_producto("c1", Producto("Mouse", 50.00, stock=10), 2)
+        resultado = await servicio.cotizar("c1", especificacion)
+        with pytest.raises(ValueError):
+            await servicio.cotizar("c1", especificacion._replace(impuesto=200))
+        return resultado
+    resultado = asyncio.run(escenario())
+
+    # Assert
+    assert resultado == precio_desde_total(100.00, especificacion)
+
+def test_carritos_grandes_se_procesan_en_el_executor():
+    """
+    AAA:
+    Arrange: Se crea un servicio con umbral de 3 líneas y dos carritos, uno chico y uno grande.
+    Act: Se cotiza cada uno con una regla que registra el hilo en que corre.
+    Assert: Se verifica que solo el carrito grande se calcula fuera del hilo del event loop.
+    """
+    # Arrange
+    servicio = ServicioCarritos(umbral_executor=3)
+    hilos = {}
+    def regla(carrito):
+        hilos[len(carrito.items)] = threading.current_thread()
+        return carrito.calcular_total()
+
+    # Act
+    async def escenario():
+        await servicio.aplicar_operaciones("chico", [(AGREGAR, Producto("A", 1.00, 5), 1)])
+        await servicio.aplicar_operaciones(
+            "grande", [(AGREGAR, Producto(f"P{i}", 1.00, 5), 1) for i in range(5)])
+        await servicio.cotizar("chico", regla)
+        await servicio.cotizar("grande", regla)
+        await servicio.eliminar("grande")
+    asyncio.run(escenario())
+
+    # Assert
+    assert hilos[1] is threading.main_thread()
+    assert hilos[5] is not threading.main_thread()
+    assert "grande" not in servicio and "chico" in servicio
+
+def test_operacion_en_espera_no_usa_un_carrito_eliminado():
+    """
+    AAA:
+    Arrange: Se crea un carrito en el servicio y se toma su candado.
+    Act: Se encolan eliminar y un agregado sobre el mismo id, y se libera el candado.
+    Assert: Se verifica que el agregado se aplica al carrito nuevo registrado con ese id.
+    """
+    # Arrange
+    servicio = ServicioCarritos()
+    producto = Producto("Mouse", 50.00, stock=10)
+    original = servicio.carrito("c")
+
+    # Act
+    async def escenario():
+        candado = servicio._candados["c"]
+        await candado.acquire()
+        eliminar = asyncio.ensure_future(servicio.eliminar("c"))
+        agregar = asyncio.ensure_future(servicio.agregar_producto("c", producto, 5))
+        await asyncio.sleep(0)
+        candado.release()
+        await asyncio.gather(eliminar, agregar)
+    asyncio.run(escenario())
+
+    # Assert
+    assert original.contar_items() == 0
+    assert "c" in servicio and servicio.carrito("c") is not original
+    assert servicio.carrito("c").contar_items() == 5
+
+def test_servicio_con_carritos_columnares():
+    """
+    AAA:
+    Arrange: Se crea un servicio que fabrica CarritoColumnar con umbral de 2 líneas.
+    Act: Se agregan productos, se cotiza varias veces de forma concurrente y se modifica el carrito.
+    Assert: Se verifica que las cotizaciones concurrentes se comparten y siguen los cambios.
+    """
+    # Arrange
+    servicio = ServicioCarritos(fabrica=CarritoColumnar, umbral_executor=2)
+    laptop, mouse = Producto("Laptop", 1000.00, stock=10), Producto("Mouse", 50.00, stock=10)
+    especificacion = EspecificacionPrecio(impuesto=10)
+    llamadas = []
+    def regla(carrito):
+        llamadas.append(carrito.version)
+        return carrito.calcular_total()
+
+    # Act
+    async def escenario():
+        await servicio.aplicar_operaciones("c", [(AGREGAR, laptop, 1), (AGREGAR, mouse, 2)])
+        primeras = await asyncio.gather(*(servicio.cotizar("c", regla) for _ in range(5)))
+        await servicio.remover_producto("c", mouse, 1)
+        return primeras, await servicio.cotizar("c", especificacion), await servicio.to_bytes("c")
+    primeras, final, datos = asyncio.run(escenario())
+
+    # Assert
+    assert primeras == [1100.00] * 5 and len(llamadas) == 1
+    assert final == precio_desde_total(1050.00, especificacion)
+    assert CarritoColumnar.from_bytes(datos).contar_items() == 2
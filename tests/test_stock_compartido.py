@@ -0,0 +1,124 @@
+# tests/test_stock_compartido.py
+import multiprocessing
+
+import pytest
+from src.carrito import Carrito, Producto
+from src.catalogo import Catalogo
+from src.stock_compartido import StockCompartido
+
+@pytest.fixture
+def catalogo():
+    catalogo = Catalogo()
+    catalogo.internar("Laptop", 1000.00, 5)
+    catalogo.internar("Mouse", 50.00, 100)
+    return catalogo
+
+@pytest.fixture
+def stock():
+    stock = StockCompartido(capacidad=16)
+    yield stock
+    stock.destruir()
+
+def _agregar_uno_a_uno(stock, catalogo, intentos, resultados):
+    carrito = Carrito(inventario=stock, catalogo=catalogo)
+    agregados = 0
+    for _ in range(intentos):
+        try:
+            carrito.agregar_producto(0, 1)
+            agregados += 1
+        except ValueError:
+            pass
+    resultados.put(agregados)
+
+def test_carrito_reserva_en_el_stock_compartido(stock, catalogo):
+    """
+    AAA:
+    Arrange: Se crean dos carritos que usan el mismo stock compartido.
+    Act: El primero reserva 4 laptops y el segundo intenta reservar 2.
+    Assert: Se verifica que el segundo falla y que liberar devuelve las unidades.
+    """
+    # Arrange
+    carrito1 = Carrito(inventario=stock, catalogo=catalogo)
+    carrito2 = Carrito(inventario=stock, catalogo=catalogo)
+    laptop = catalogo.obtener("Laptop")
+
+    # Act
+    carrito1.agregar_producto(laptop.id, 4)
+
+    # Assert
+    with pytest.raises(ValueError):
+        carrito2.agregar_producto(laptop.id, 2)
+    assert stock.disponible(laptop) == 1
+    carrito1.actualizar_cantidad(laptop.id, 1)
+    carrito2.agregar_producto(laptop.id, 2)
+    assert stock.reservado(laptop) == 3
+    assert stock.reservado(laptop, carrito2) == 2
+
+def test_confirmar_y_registrar(stock, catalogo):
+    """
+    AAA:
+    Arrange: Se crea un carrito que reserva 3 mouses.
+    Act: Se confirman 2 y se intenta reponer un stock menor a lo reservado.
+    Assert: Se verifica el stock restante y que la reposición inválida falla.
+    """
+    # Arrange
+    mouse = catalogo.obtener("Mouse")
+    carrito = Carrito(inventario=stock)
+    carrito.agregar_producto(mouse, 3)
+
+    # Act
+    stock.confirmar(mouse, 2, carrito)
+
+    # Assert
+    assert stock.disponible(mouse) == 97
+    with pytest.raises(ValueError):
+        stock.registrar(mouse, 0)
+    with pytest.raises(ValueError):
+        stock.confirmar(mouse, 5, carrito)
+
+def test_producto_sin_catalogo_o_fuera_de_capacidad(stock, catalogo):
+    """
+    AAA:
+    Arrange: Se crea un producto fuera de catálogo y otro con id mayor a la capacidad.
+    Act: Se intenta reservarlos.
+    Assert: Se verifica que ambos lanzan ValueError.
+    """
+    # Arrange
+    suelto = Producto("Suelto", 10.00, 5)
+    for i in range(20):
+        catalogo.internar(f"SKU{i}", 1.00, 5)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        stock.reservar(suelto, 1, "titular")
+    with pytest.raises(ValueError):
+        stock.reservar(catalogo.obtener("SKU19"), 1, "titular")
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="requiere fork")
+def test_procesos_no_reservan_mas_que_el_stock(catalogo):
+    """
+    AAA:
+    Arrange: Se crea un stock compartido y cuatro procesos con carritos propios.
+    Act: Cada proceso intenta agregar laptops de a una, más de las que hay.
+    Assert: Se verifica que entre todos reservaron exactamente el stock.
+    """
+    # Arrange
+    contexto = multiprocessing.get_context("fork")
+    stock = StockCompartido(capacidad=16, contexto=contexto)
+    resultados = contexto.Queue()
+    procesos = [contexto.Process(target=_agregar_uno_a_uno, args=(stock, catalogo, 50, resultados))
+                for _ in range(4)]
+
+    # Act
+    for proceso in procesos:
+        proceso.start()
+    agregados = sum(resultados.get(timeout=30) for _ in procesos)
+    for proceso in procesos:
+        proceso.join(timeout=30)
+
+    # Assert
+    try:
+        assert agregados == 5
+        assert stock.reservado(catalogo.obtener("Laptop")) == 5
+    finally:
+        stock.destruir()
@@ -0,0 +1,70 @@
+# tests/test_suite_rendimiento.py
+import json
+
+from benchmarks import suite
+
+def test_suite_genera_json_y_compara(tmp_path):
+    """
+    AAA:
+    Arrange: Se prepara una ruta de salida para la suite.
+    Act: Se ejecuta la suite en tamaño mínimo y se compara contra su propia salida.
+    Assert: Se verifica que el JSON contiene todas las métricas y que no hay regresiones.
+    """
+    # Arrange
+    salida = tmp_path / "base.json"
+
+    # Act
+    codigo = suite.main(["--tamanos", "10", "--presupuesto", "0.001", "--salida", str(salida)])
+    resultados = json.loads(salida.read_text(encoding="utf-8"))["resultados"]
+
+    # Assert
+    assert codigo == 0
+    assert "calcular_total@10" in resultados and "vaciar@10" in resultados
+    assert {"fusionar@10", "diferencia@10", "restaurar+restaurar@10"} <= set(resultados)
+    assert all(set(metricas) == set(suite.METRICAS) for metricas in resultados.values())
+    assert suite.comparar(resultados, resultados, umbral=0.0) == []
+
+def test_comparar_detecta_regresiones():
+    """
+    AAA:
+    Arrange: Se crea una línea base y resultados con un tiempo y una memoria peores.
+    Act: Se comparan con un umbral del 25%.
+    Assert: Se verifica que se reportan solo las métricas que superan el umbral y el piso de ruido.
+    """
+    # Arrange
+    base = {"calcular_total@1000": {"segundos": 1e-3, "memoria_pico": 10_000, "bloques": 100},
+            "contar_items@1000": {"segundos": 1e-7, "memoria_pico": 100, "bloques": 1}}
+    actual = {"calcular_total@1000": {"segundos": 2e-3, "memoria_pico": 11_000, "bloques": 200},
+              "contar_items@1000": {"segundos": 5e-7, "memoria_pico": 100, "bloques": 1}}
+
+    # Act
+    regresiones = suite.comparar(actual, base, umbral=0.25)
+
+    # Assert
+    assert [(clave, metrica) for clave, metrica, _, _ in regresiones] == [
+        ("calcular_total@1000", "segundos"), ("calcular_total@1000", "bloques")]
+
+def test_comparar_reporta_casos_ausentes(tmp_path):
+    """
+    AAA:
+    Arrange: Se guarda una línea base con un caso que la suite ya no mide y otro de un tamaño no pedido.
+    Act: Se compara una ejecución de tamaño 10 contra esa línea base.
+    Assert: Se verifica que solo el caso ausente del tamaño pedido cuenta como regresión.
+    """
+    # Arrange
+    salida = tmp_path / "base.json"
+    suite.main(["--tamanos", "10", "--presupuesto", "0.001", "--filtro", "contar", "--salida", str(salida)])
+    datos = json.loads(salida.read_text(encoding="utf-8"))
+    metricas = datos["resultados"]["contar_items@10"]
+    datos["resultados"]["contar_eliminado@10"] = metricas
+    datos["resultados"]["contar_items@1000"] = metricas
+    salida.write_text(json.dumps(datos), encoding="utf-8")
+
+    # Act
+    codigo = suite.main(["--tamanos", "10", "--presupuesto", "0.001", "--filtro", "contar",
+                         "--comparar", str(salida), "--umbral", "1000"])
+    regresiones = suite.comparar({}, {"contar_eliminado@10": metricas}, umbral=0.5)
+
+    # Assert
+    assert codigo == 1
+    assert regresiones == [("contar_eliminado@10", "ausente", None, None)]